@@ -0,0 +1,70 @@
+# Benchmark of Apache Arrow round trips of datetime2 arrays
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+
+import numpy as np
+import pyarrow as pa
+
+from datetime2.arrays import DateArray, TimeArray, TimeDeltaArray
+from datetime2.arrow import from_arrow, to_arrow
+
+
+def round_trip(name, array):
+    start = time.perf_counter()
+    arrow_array = to_arrow(array)
+    to_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    back = from_arrow(arrow_array)
+    from_seconds = time.perf_counter() - start
+    assert len(back) == len(array)
+    print(f"{len(array):,} {name}: to_arrow {to_seconds:6.2f} s, from_arrow {from_seconds:6.2f} s")
+    return arrow_array
+
+
+def main():
+    rng = np.random.default_rng(0)
+    count = 50_000_000
+    dates = DateArray._from_buffer(rng.integers(693_596, 767_010, count))
+    round_trip("dates (date32)", dates)
+    del dates
+    nanoseconds = rng.integers(0, 86_400_000_000_000, count)
+    utcoffsets = rng.choice([-18_000_000_000_000, 0, 3_600_000_000_000, -(2**63)], count)
+    round_trip("times (struct<time64[ns], duration[ns]>)", TimeArray(nanoseconds, utcoffsets))
+    del nanoseconds, utcoffsets
+    round_trip("time deltas (duration[ns])", TimeDeltaArray._from_buffer(rng.integers(-10**15, 10**15, count)))
+    start = time.perf_counter()
+    pa.array(rng.integers(-(2**16), 2**16, 1_000_000, dtype=np.int32), type=pa.date32()).to_pylist()
+    print(f"1,000,000 dates through Python objects: {time.perf_counter() - start:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Benchmark of cformat on representations of dates and times
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+from fractions import Fraction
+
+from datetime2.modern import InternetTime, IsoCalendar
+from datetime2.western import GregorianCalendar, WesternTime, WesternTimeDelta
+
+
+def bench(name, objects, format_string):
+    start = time.perf_counter()
+    for obj in objects:
+        obj.cformat(format_string)
+    seconds = time.perf_counter() - start
+    print(f"{name:16s} {format_string!r:28s} {seconds:6.2f} s, {seconds / len(objects) * 1e9:6.0f} ns per call")
+
+
+def main():
+    count = 1_000_000
+    gregorian_dates = [GregorianCalendar.from_rata_die(day) for day in range(730_000, 730_000 + count)]
+    bench("GregorianCalendar", gregorian_dates, "%Y-%m-%d")
+    bench("GregorianCalendar", gregorian_dates, "%A, %d %B %Y (day %j)")
+    del gregorian_dates
+    iso_dates = [IsoCalendar.from_rata_die(day) for day in range(730_000, 730_000 + count // 10)]
+    bench("IsoCalendar", iso_dates, "%Y-W%W-%w")
+    del iso_dates
+    western_times = [WesternTime(hour, minute, second, timezone=Fraction(11, 2))
+                     for hour in range(24) for minute in range(60) for second in range(60)]
+    bench("WesternTime", western_times, "%H:%M:%S.%f%z")
+    western_time_deltas = [WesternTimeDelta(hour, hour, minute, second)
+                           for hour in range(24) for minute in range(60) for second in range(60)]
+    bench("WesternTimeDelta", western_time_deltas, "%d days %H:%M:%S.%f")
+    internet_times = [InternetTime(Fraction(beat, 100)) for beat in range(100_000)]
+    bench("InternetTime", internet_times, "@%b.%f")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Benchmark of bulk formatting with cformat_many
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+
+import numpy as np
+
+from datetime2.western import GregorianCalendar, WesternTime
+
+
+def bench(name, function):
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    print(f"{name:52s} {seconds:6.2f} s")
+
+
+def main():
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    day_counts = rng.integers(693_596, 767_010, count)  # years 1900-2100
+    nanoseconds = rng.integers(0, 86_400_000_000_000, count)
+    day_count_list = day_counts.tolist()
+    for format_string in ("%Y-%m-%d", "%A, %d %B %Y"):
+        bench(f"GregorianCalendar.cformat {format_string!r}",
+              lambda: [GregorianCalendar.from_rata_die(day_count).cformat(format_string)
+                       for day_count in day_count_list])
+        bench(f"GregorianCalendar.cformat_many {format_string!r}",
+              lambda: GregorianCalendar.cformat_many(format_string, day_counts))
+    bench("WesternTime.cformat_many '%H:%M:%S.%f%z'",
+          lambda: WesternTime.cformat_many("%H:%M:%S.%f%z", nanoseconds, timezone=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Benchmark of the current date and time constructors
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import timeit
+
+from datetime2 import Date, Time
+
+
+def main():
+    number = 200_000
+    for name, constructor in (("Date.today()", Date.today),
+                              ("Time.now()", Time.now),
+                              ("Time.now(utcoffset=0)", lambda: Time.now(utcoffset=0)),
+                              ("Time.localnow()", Time.localnow),
+                              ("Time.utcnow()", Time.utcnow)):
+        seconds = min(timeit.repeat(constructor, number=number, repeat=5)) / number
+        print(f"{name:24} {1 / seconds:12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
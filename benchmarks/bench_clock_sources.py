@@ -0,0 +1,54 @@
+# Benchmark of the clock sources
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import timeit
+
+from datetime2 import Time, set_clock_source
+from datetime2.clocks import CoarseClock, FakeClock, MonotonicClock, SystemClock
+
+
+def main():
+    number = 500_000
+    with CoarseClock(tick=0.001) as coarse_clock:
+        for source in (SystemClock(), coarse_clock, MonotonicClock(), FakeClock(1_714_564_800_000_000_000)):
+            previous_source = set_clock_source(source)
+            try:
+                results = []
+                for constructor in (source.time_ns, Time.utcnow, Time.now):
+                    seconds = min(timeit.repeat(constructor, number=number, repeat=5)) / number
+                    results.append(f"{1 / seconds:12,.0f}")
+            finally:
+                set_clock_source(previous_source)
+            print(f"{source!r:28} time_ns {results[0]}/s, Time.utcnow {results[1]}/s, Time.now {results[2]}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Cost of constructing instances with validated fractional values
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import timeit
+from fractions import Fraction
+
+from datetime2 import Time, TimeDelta
+from datetime2.modern import InternetTime
+from datetime2.western import WesternTime, WesternTimeDelta
+
+
+def main():
+    number = 200_000
+    day_frac = Fraction(12345, 86400)
+    second = Fraction(314159, 10000)
+    constructions = {
+        "Time(int)": lambda: Time(0),
+        "Time(Fraction)": lambda: Time(day_frac),
+        "Time(Fraction, utcoffset)": lambda: Time(day_frac, utcoffset=day_frac),
+        "Time(num, den)": lambda: Time(12345, 86400),
+        "TimeDelta(int)": lambda: TimeDelta(7),
+        "TimeDelta(Fraction)": lambda: TimeDelta(day_frac),
+        "WesternTime(h, m, int)": lambda: WesternTime(12, 34, 56),
+        "WesternTime(h, m, Fraction)": lambda: WesternTime(12, 34, second),
+        "WesternTimeDelta(d, h, m, Fraction)": lambda: WesternTimeDelta(1, 2, 3, second),
+        "InternetTime(Fraction)": lambda: InternetTime(second),
+    }
+    for name, construction in constructions.items():
+        seconds = min(timeit.repeat(construction, number=number, repeat=3))
+        print(f"{name:36s} {seconds / number * 1e9:8.0f} ns per construction")
+
+
+if __name__ == "__main__":
+    main()
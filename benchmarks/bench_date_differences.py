@@ -0,0 +1,60 @@
+# Benchmark of date differences and integral time deltas
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import random
+import timeit
+
+from datetime2 import Date, TimeDelta
+
+
+def main():
+    # ages and tenures of a staff register, computed as of a reference date
+    rng = random.Random(0)
+    births = [Date(rng.randrange(700_000, 735_000)) for _ in range(10_000)]
+    hires = [birth + TimeDelta(rng.randrange(6_600, 15_000)) for birth in births]
+    today = Date(739_000)
+    adult = TimeDelta(18 * 365)
+    probation = TimeDelta(180)
+    benchmarks = (
+        ("today - birth", lambda: [today - birth for birth in births]),
+        ("(today - hire).int_part", lambda: [(today - hire).int_part for hire in hires]),
+        ("today - birth >= adult", lambda: [today - birth >= adult for birth in births]),
+        ("hire + probation", lambda: [hire + probation for hire in hires]),
+        ("hire - probation", lambda: [hire - probation for hire in hires]),
+        ("(today - hire) // 365", lambda: [(today - hire) // TimeDelta(365) for hire in hires]),
+        ("TimeDelta(n) + TimeDelta(n)", lambda: [probation + TimeDelta(day) for day in range(10_000)]),
+    )
+    for name, bench in benchmarks:
+        seconds = min(timeit.repeat(bench, number=10, repeat=5)) / 10 / 10_000
+        print(f"{name:30} {seconds * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Benchmark walking ranges of days with and without lazy range objects
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+
+from datetime2 import Date
+from datetime2.western import GregorianCalendar, set_lookup_years
+
+
+def timed(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    first_year, years = 1900, 200
+    start = Date.gregorian(first_year, 1, 1)
+    stop = Date.gregorian(first_year + years, 1, 1)
+    count = stop.day_count - start.day_count
+    print(f"{count:,} days, years {first_year}-{first_year + years - 1}")
+
+    seconds = timed(lambda: [Date(day_count) for day_count in range(start.day_count, stop.day_count)])
+    print(f"Date(n) per day:                            {seconds * 1e3:8.1f} ms")
+    seconds = timed(lambda: list(Date.range(start, stop)))
+    print(f"Date.range:                                 {seconds * 1e3:8.1f} ms")
+
+    # fields of each day; the cache of Date.gregorian is defeated by the number of days
+    for label, table in (("with lookup table", (1970, 2100)), ("computed", (None, None))):
+        set_lookup_years(*table)
+        seconds = timed(lambda: [GregorianCalendar.from_rata_die(day_count) for day_count in range(start.day_count, stop.day_count)])
+        print(f"{'from_rata_die per day (' + label + '):':44}{seconds * 1e3:8.1f} ms")
+    set_lookup_years(1970, 2100)
+    seconds = timed(lambda: [greg for year in range(first_year, first_year + years) for greg in GregorianCalendar.iter_year(year)])
+    print(f"GregorianCalendar.iter_year:                {seconds * 1e3:8.1f} ms")
+    seconds = timed(lambda: len(Date.range(Date(-10 ** 12), Date(10 ** 12))[::7]), repeat=1)
+    print(f"len() of a slice of 2e12 days:              {seconds * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
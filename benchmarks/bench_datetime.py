@@ -0,0 +1,86 @@
+# Benchmark of DateTime against pairs of Date and Time objects
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import random
+import timeit
+import tracemalloc
+from fractions import Fraction
+
+from datetime2 import Date, DateTime, Time, TimeDelta
+
+
+NANOSECONDS_IN_DAY = 86_400_000_000_000
+
+
+def main():
+    # timestamps of an event log, one every few seconds, in one time zone
+    rng = random.Random(0)
+    count = 100_000
+    utcoffset = Fraction(1, 24)
+    moments = sorted(739_000 * NANOSECONDS_IN_DAY + rng.randrange(30 * NANOSECONDS_IN_DAY) for _ in range(count))
+    rng.shuffle(moments)
+    pairs = [(Date(ns // NANOSECONDS_IN_DAY + 1), Time.from_nanoseconds(ns % NANOSECONDS_IN_DAY, utcoffset=utcoffset))
+             for ns in moments]
+    datetimes = [DateTime(date, time_obj) for date, time_obj in pairs]
+    hour = TimeDelta(Fraction(1, 24))
+
+    tracemalloc.start()
+    snapshot = [(Date(ns // NANOSECONDS_IN_DAY + 1), Time.from_nanoseconds(ns % NANOSECONDS_IN_DAY, utcoffset=utcoffset))
+                for ns in moments]
+    pair_bytes = tracemalloc.get_traced_memory()[0]
+    del snapshot
+    tracemalloc.reset_peak()
+    tracemalloc.stop()
+    tracemalloc.start()
+    snapshot = [DateTime.from_nanoseconds(ns, utcoffset=utcoffset) for ns in moments]
+    datetime_bytes = tracemalloc.get_traced_memory()[0]
+    del snapshot
+    tracemalloc.stop()
+    print(f"memory per timestamp:      (Date, Time) {pair_bytes / count:6.0f} B   DateTime {datetime_bytes / count:6.0f} B")
+
+    benchmarks = (
+        ("sort",
+         lambda: sorted(pairs), lambda: sorted(datetimes)),
+        ("set of timestamps",
+         lambda: set(pairs), lambda: set(datetimes)),
+        ("add one hour (no day carry for pairs)",
+         lambda: [(date, time_obj + hour) for date, time_obj in pairs], lambda: [dt + hour for dt in datetimes]),
+        ("difference to the first one",
+         lambda: [(date - pairs[0][0]) + (time_obj - pairs[0][1]) for date, time_obj in pairs],
+         lambda: [dt - datetimes[0] for dt in datetimes]),
+    )
+    for name, pair_bench, datetime_bench in benchmarks:
+        pair_seconds = min(timeit.repeat(pair_bench, number=1, repeat=3)) / count
+        datetime_seconds = min(timeit.repeat(datetime_bench, number=1, repeat=3)) / count
+        print(f"{name:38} (Date, Time) {pair_seconds * 1e9:6.0f} ns   DateTime {datetime_seconds * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
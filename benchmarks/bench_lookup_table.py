@@ -0,0 +1,67 @@
+# Benchmark of the rata die lookup table of the Gregorian calendar
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+import timeit
+
+from datetime2 import Date
+from datetime2.western import GregorianCalendar, set_lookup_years
+import datetime2.western
+
+
+def main():
+    number = 100_000
+    inside = GregorianCalendar(2024, 5, 1).to_rata_die()
+    outside = GregorianCalendar(-500, 5, 1).to_rata_die()
+    for first_year, last_year in ((None, None), (1970, 2100), (1900, 2200), (1, 9999)):
+        set_lookup_years(first_year, last_year)
+        start = time.perf_counter()
+        GregorianCalendar.from_rata_die(inside)  # builds the table
+        build_seconds = time.perf_counter() - start
+        table = datetime2.western._rata_die_table.state[2]
+        memory = 0 if table is None else table.itemsize * len(table)
+        inside_ns = min(timeit.repeat(lambda: GregorianCalendar.from_rata_die(inside), number=number, repeat=3))
+        outside_ns = min(timeit.repeat(lambda: GregorianCalendar.from_rata_die(outside), number=number, repeat=3))
+        date = Date(inside + 1)
+        calendar_cache = Date.__dict__["gregorian"].cache
+
+        def date_to_gregorian():
+            calendar_cache.clear()
+            return date.gregorian
+
+        access_ns = min(timeit.repeat(date_to_gregorian, number=number, repeat=3))
+        print(f"years {first_year!s:>4}-{last_year!s:<4}: {memory / 1024:7.0f} KiB, built in {build_seconds * 1000:5.0f} ms, "
+              f"from_rata_die {inside_ns / number * 1e9:5.0f} ns inside / {outside_ns / number * 1e9:5.0f} ns outside, "
+              f"uncached Date.gregorian {access_ns / number * 1e9:5.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
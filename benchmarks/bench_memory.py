@@ -0,0 +1,65 @@
+# Memory used by instances of the base classes
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import tracemalloc
+from fractions import Fraction
+
+from datetime2 import Date, Time, TimeDelta
+
+
+def bytes_per_instance(factory, count):
+    # values are built before tracing starts, so that only instances are measured
+    values = list(range(count))
+    tracemalloc.start()
+    instances = [factory(value) for value in values]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (size - 8 * count) / count  # the list of instances is not accounted for
+
+
+def main():
+    count = 100_000
+    fractions = [Fraction(value, count) for value in range(count)]
+    factories = {
+        "Date": lambda value: Date(value),
+        "Date, gregorian accessed": lambda value: (lambda date: (date.gregorian, date)[1])(Date(value)),
+        "Time": lambda value: Time(fractions[value]),
+        "Time, western accessed": lambda value: (lambda time: (time.western, time)[1])(Time(fractions[value])),
+        "TimeDelta": lambda value: TimeDelta(fractions[value] * 7),
+    }
+    for name, factory in factories.items():
+        print(f"{name:26s} {bytes_per_instance(factory, count):7.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main()
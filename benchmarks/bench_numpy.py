@@ -0,0 +1,82 @@
+# Benchmark of conversions with NumPy datetime64 and timedelta64 arrays
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from datetime2 import Date, Time, TimeDelta
+from datetime2.arrays import DateArray, TimeArray, TimeDeltaArray
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    sample = 100_000
+    timestamps = np.datetime64("2000-01-01", "ns") + rng.integers(0, 25 * 365 * 86_400_000_000_000, count).astype("timedelta64[ns]")
+    days = timestamps.astype("datetime64[D]")
+    since_midnight = timestamps - days
+    durations = np.diff(np.sort(timestamps))
+
+    # element by element, through Python objects and Fractions, on a sample
+    _, seconds = timed(lambda: [Date(int(day) + 719163) for day in days[:sample].astype(np.int64)])
+    print(f"{count:,} datetime64[D] -> Date objects:             {seconds * count / sample:7.2f} s (estimated)")
+    _, seconds = timed(lambda: [Time(int(ns), 86_400_000_000_000) for ns in since_midnight[:sample].astype(np.int64)])
+    print(f"{count:,} timedelta64[ns] -> Time objects:           {seconds * count / sample:7.2f} s (estimated)")
+    _, seconds = timed(lambda: [TimeDelta(Fraction(int(ns), 86_400_000_000_000)) for ns in durations[:sample].astype(np.int64)])
+    print(f"{count:,} timedelta64[ns] -> TimeDelta objects:      {seconds * count / sample:7.2f} s (estimated)")
+
+    date_array, seconds = timed(lambda: DateArray.from_datetime64(days))
+    print(f"{count:,} datetime64[D] -> DateArray:                {seconds:7.3f} s")
+    _, seconds = timed(lambda: DateArray.from_datetime64(timestamps, rounding="floor"))
+    print(f"{count:,} datetime64[ns] -> DateArray, floor:        {seconds:7.3f} s")
+    _, seconds = timed(date_array.to_datetime64)
+    print(f"{count:,} DateArray -> datetime64[D]:                {seconds:7.3f} s")
+    time_array, seconds = timed(lambda: TimeArray.from_timedelta64(since_midnight))
+    print(f"{count:,} timedelta64[ns] -> TimeArray:              {seconds:7.3f} s")
+    _, seconds = timed(lambda: TimeArray.from_timedelta64(since_midnight.astype("timedelta64[ps]"), rounding="half_even"))
+    print(f"{count:,} timedelta64[ps] -> TimeArray, half_even:   {seconds:7.3f} s")
+    _, seconds = timed(time_array.to_timedelta64)
+    print(f"{count:,} TimeArray -> timedelta64[ns]:              {seconds:7.3f} s")
+    timedelta_array, seconds = timed(lambda: TimeDeltaArray.from_timedelta64(durations))
+    print(f"{count - 1:,} timedelta64[ns] -> TimeDeltaArray:         {seconds:7.3f} s")
+    _, seconds = timed(timedelta_array.to_timedelta64)
+    print(f"{count - 1:,} TimeDeltaArray -> timedelta64[ns]:         {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Benchmark of the streaming parsers of ISO 8601 columns
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from datetime2.arrays import parse_date_chunks, parse_time_chunks
+from datetime2.western import GregorianCalendar
+
+
+def make_log(line_count):
+    rng = np.random.default_rng(0)
+    dates = GregorianCalendar.cformat_many("%Y-%m-%d", rng.integers(693_596, 767_010, line_count))
+    nanoseconds = rng.integers(0, 86_400_000_000_000, line_count).tolist()
+    return b"".join(
+        f"{date}T{ns // 3_600_000_000_000:02d}:{ns // 60_000_000_000 % 60:02d}:{ns // 1_000_000_000 % 60:02d}."
+        f"{ns // 1000 % 1_000_000:06d} INFO request served in 12 ms\n".encode()
+        for date, ns in zip(dates, nanoseconds))
+
+
+def bench(name, size, function):
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    print(f"{name:44s} {seconds:6.2f} s {size / seconds / 1e6:8.1f} MB/s")
+
+
+def main():
+    data = make_log(2_000_000)
+    print(f"{len(data) / 1e6:.0f} MB of log lines")
+    with tempfile.NamedTemporaryFile(delete=False) as log_file:
+        log_file.write(data)
+    try:
+        def from_file(parser, **kwargs):
+            with open(log_file.name, "rb") as source:
+                for _ in parser(source, **kwargs):
+                    pass
+
+        bench("parse_date_chunks, file", len(data), lambda: from_file(parse_date_chunks))
+        bench("parse_time_chunks, file", len(data), lambda: from_file(parse_time_chunks, start=11, fraction_digits=6))
+        bench("parse_date_chunks, memoryview", len(data),
+              lambda: [None for _ in parse_date_chunks(memoryview(data))])
+        sample = data[:len(data) // 20]
+        bench("decode + GregorianCalendar.from_str per line", len(sample),
+              lambda: [GregorianCalendar.from_str(line[:10].decode()) for line in sample.splitlines()])
+    finally:
+        os.remove(log_file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Benchmark of the interning pools of Date and of the calendars
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import timeit
+
+from datetime2 import Date
+from datetime2.modern import IsoCalendar
+from datetime2.western import GregorianCalendar
+
+
+def main():
+    # a working set of dates, repeatedly converted, e.g. the days of a report
+    day_counts = list(range(738000, 738000 + 1000))
+    greg_values = [(greg.year, greg.month, greg.day) for greg in map(GregorianCalendar.from_rata_die, day_counts)]
+    pools = (Date.pool, GregorianCalendar.pool, IsoCalendar.pool)
+    calendar_cache = Date.__dict__["gregorian"].cache
+    benchmarks = (
+        ("GregorianCalendar.from_rata_die", lambda: [GregorianCalendar.from_rata_die(day_count) for day_count in day_counts]),
+        ("IsoCalendar.from_rata_die", lambda: [IsoCalendar.from_rata_die(day_count) for day_count in day_counts]),
+        ("Date.gregorian(y, m, d)", lambda: [Date.gregorian(*values) for values in greg_values]),
+        ("uncached Date(n).gregorian", lambda: (calendar_cache.clear(), [Date(day_count).gregorian for day_count in day_counts])),
+    )
+    for pool_size in (0, 4096):
+        for pool in pools:
+            pool.resize(pool_size)
+            pool.clear()
+        for name, bench in benchmarks:
+            bench()  # fills the pools
+            seconds = min(timeit.repeat(bench, number=20, repeat=5)) / 20 / len(day_counts)
+            print(f"pool size {pool_size:4}: {name:32} {seconds * 1e9:6.0f} ns")
+    print(GregorianCalendar.pool)
+
+
+if __name__ == "__main__":
+    main()
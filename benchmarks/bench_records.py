@@ -0,0 +1,82 @@
+# Benchmark of memory-mapped date and time records
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from datetime2 import Time
+from datetime2.arrays import TIME_RECORD_FORMAT, TimeArray
+
+
+def main():
+    count = 5_000_000
+    rng = np.random.default_rng(0)
+    nanoseconds = rng.integers(0, 86_400_000_000_000, count)
+    utcoffsets = rng.choice([-18_000_000_000_000, 0, 3_600_000_000_000], count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "times.bin")
+        with open(path, "wb") as file:
+            file.write(TimeArray(nanoseconds, utcoffsets).to_bytes())
+        print(f"{count:,} time records, {os.path.getsize(path) / 2**20:.0f} MiB")
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = time.perf_counter()
+            times = TimeArray.from_buffer(mapped)
+            wrap_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            moments = (times.nanoseconds - times.utcoffsets) % 86_400_000_000_000
+            morning = int(np.count_nonzero(moments < 43_200_000_000_000))
+            vector_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            first_times = [times[index] for index in range(1000)]
+            lazy_seconds = time.perf_counter() - start
+            print(f"TimeArray.from_buffer:          {wrap_seconds * 1e6:10.1f} us")
+            print(f"UTC morning count, vectorized:  {vector_seconds * 1e3:10.1f} ms ({morning:,} times)")
+            print(f"first 1000 Time objects:        {lazy_seconds * 1e3:10.1f} ms")
+            start = time.perf_counter()
+            morning = 0
+            for day_ns, utcoffset_ns in struct.iter_unpack(TIME_RECORD_FORMAT, mapped):
+                if (day_ns - utcoffset_ns) % 86_400_000_000_000 < 43_200_000_000_000:
+                    morning += 1
+            print(f"same count with struct:         {(time.perf_counter() - start) * 1e3:10.1f} ms ({morning:,} times)")
+            start = time.perf_counter()
+            for day_ns, utcoffset_ns in struct.iter_unpack(TIME_RECORD_FORMAT, mapped[:16 * 100_000]):
+                Time.from_nanoseconds(day_ns)
+            print(f"100000 Time objects via struct: {(time.perf_counter() - start) * 1e3:10.1f} ms")
+            del times, moments
+
+
+if __name__ == "__main__":
+    main()
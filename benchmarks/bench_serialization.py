@@ -0,0 +1,67 @@
+# Benchmark of the binary encoding and of pickling of the base classes
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import pickle
+import timeit
+from fractions import Fraction
+
+from datetime2 import Date, Time, TimeDelta
+
+
+def main():
+    number = 20_000
+    samples = (
+        ("Date", [Date(day_count) for day_count in range(730000, 740000)]),
+        ("Time", [Time(Fraction(index, 10000)) for index in range(10000)]),
+        ("aware Time", [Time(Fraction(index, 10000), utcoffset=Fraction(1, 24)) for index in range(10000)]),
+        ("TimeDelta", [TimeDelta(Fraction(index, 7)) for index in range(10000)]),
+    )
+    for name, values in samples:
+        value = values[1234]
+        if hasattr(value, "western"):
+            value.western  # a cached representation must not be pickled
+        results = [f"{name:11}", f"pickle {len(pickle.dumps(value)):3} B",
+                   f"list of {len(values)} {len(pickle.dumps(values)) / len(values):5.1f} B/item"]
+        pickled = pickle.dumps(value)
+        dumps_ns = min(timeit.repeat(lambda: pickle.dumps(value), number=number, repeat=3)) / number * 1e9
+        loads_ns = min(timeit.repeat(lambda: pickle.loads(pickled), number=number, repeat=3)) / number * 1e9
+        results.append(f"dumps {dumps_ns:5.0f} ns, loads {loads_ns:5.0f} ns")
+        if hasattr(value, "to_bytes"):
+            encoded = value.to_bytes()
+            cls = type(value)
+            to_ns = min(timeit.repeat(value.to_bytes, number=number, repeat=3)) / number * 1e9
+            from_ns = min(timeit.repeat(lambda: cls.from_bytes(encoded), number=number, repeat=3)) / number * 1e9
+            results.append(f"to_bytes {len(encoded):2} B {to_ns:4.0f} ns, from_bytes {from_ns:5.0f} ns")
+        print(", ".join(results))
+
+
+if __name__ == "__main__":
+    main()
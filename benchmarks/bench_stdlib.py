@@ -0,0 +1,95 @@
+# Benchmark of conversions with the datetime module of the standard library
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import datetime
+import random
+import timeit
+from fractions import Fraction
+
+from datetime2 import Date, Time, TimeDelta
+
+
+def main():
+    rng = random.Random(0)
+    count = 10_000
+    pydates = [datetime.date.fromordinal(rng.randrange(700_000, 740_000)) for _ in range(count)]
+    utc_plus_one = datetime.timezone(datetime.timedelta(hours=1))
+    pytimes = [datetime.time(rng.randrange(24), rng.randrange(60), rng.randrange(60), rng.randrange(1_000_000),
+                             utc_plus_one) for _ in range(count)]
+    pytimedeltas = [datetime.timedelta(days=rng.randrange(-1000, 1000), seconds=rng.randrange(86400)) for _ in range(count)]
+    dates = Date.from_pydate_many(pydates)
+    times = Time.from_pytime_many(pytimes)
+    timedeltas = TimeDelta.from_pytimedelta_many(pytimedeltas)
+
+    def greg_to_pydate(date_obj):
+        greg = date_obj.gregorian
+        return datetime.date(greg.year, greg.month, greg.day)
+
+    def western_to_pytime(time_obj):
+        western = time_obj.western
+        seconds = int(western.second)
+        pytimezone = datetime.timezone(datetime.timedelta(hours=int(western.timezone)))
+        return datetime.time(western.hour, western.minute, seconds, int((western.second - seconds) * 1_000_000), pytimezone)
+
+    benchmarks = (
+        ("datetime.date -> Date",
+         lambda: [Date.gregorian(pydate.year, pydate.month, pydate.day) for pydate in pydates],
+         lambda: [Date.from_pydate(pydate) for pydate in pydates],
+         lambda: Date.from_pydate_many(pydates)),
+        ("Date -> datetime.date",
+         lambda: [greg_to_pydate(date_obj) for date_obj in dates],
+         lambda: [date_obj.to_pydate() for date_obj in dates],
+         lambda: Date.to_pydate_many(dates)),
+        ("datetime.time -> Time",
+         lambda: [Time.western(pytime.hour, pytime.minute, Fraction(pytime.second) + Fraction(pytime.microsecond, 1_000_000),
+                               timezone=1) for pytime in pytimes],
+         lambda: [Time.from_pytime(pytime) for pytime in pytimes],
+         lambda: Time.from_pytime_many(pytimes)),
+        ("Time -> datetime.time",
+         lambda: [western_to_pytime(time_obj) for time_obj in times],
+         lambda: [time_obj.to_pytime() for time_obj in times],
+         lambda: Time.to_pytime_many(times)),
+        ("datetime.timedelta -> TimeDelta",
+         lambda: [TimeDelta(Fraction(pytimedelta.total_seconds()) / 86400) for pytimedelta in pytimedeltas],
+         lambda: [TimeDelta.from_pytimedelta(pytimedelta) for pytimedelta in pytimedeltas],
+         lambda: TimeDelta.from_pytimedelta_many(pytimedeltas)),
+        ("TimeDelta -> datetime.timedelta",
+         lambda: [datetime.timedelta(days=float(timedelta_obj.fractional_days)) for timedelta_obj in timedeltas],
+         lambda: [timedelta_obj.to_pytimedelta() for timedelta_obj in timedeltas],
+         lambda: TimeDelta.to_pytimedelta_many(timedeltas)),
+    )
+    print(f"{'ns per value':32} {'naive route':>12} {'single':>8} {'bulk':>8}")
+    for name, *benches in benchmarks:
+        results = [min(timeit.repeat(bench, number=3, repeat=5)) / 3 / count * 1e9 for bench in benches]
+        print(f"{name:32} {results[0]:12.0f} {results[1]:8.0f} {results[2]:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Stress benchmark of calendar attributes accessed by many threads
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datetime2 import Date
+
+
+def hammer(dates, rounds):
+    for _ in range(rounds):
+        for date in dates:
+            date.gregorian
+            date.iso
+
+
+def main():
+    # shared dates: the first set fits in the caches, the second one does not
+    for date_count in (2_000, 20_000):
+        print(f"{date_count} shared dates")
+        dates = [Date(day_count) for day_count in range(730_000, 730_000 + date_count)]
+        rounds = 100_000 // date_count
+        for thread_count in (1, 2, 4, 8, 16):
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                start = time.perf_counter()
+                for future in [executor.submit(hammer, dates, rounds) for _ in range(thread_count)]:
+                    future.result()
+                seconds = time.perf_counter() - start
+            accesses = 2 * len(dates) * rounds * thread_count
+            print(f"  {thread_count:2d} threads: {accesses / seconds / 1e6:6.2f} M accesses/s in total, "
+                  f"{accesses / seconds / thread_count / 1e6:6.2f} M accesses/s per thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Benchmark of Time comparisons, hashing and subtraction
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import random
+import timeit
+from fractions import Fraction
+
+from datetime2 import Time
+
+
+def make_times(count, aware):
+    random.seed(20260101)
+    times = []
+    for dummy in range(count):
+        day_frac = Fraction(random.randrange(86_400_000_000), 86_400_000_000)  # microsecond resolution
+        if aware:
+            times.append(Time(day_frac, utcoffset=Fraction(random.randrange(1, 49), 96)))
+        else:
+            times.append(Time(day_frac))
+    return times
+
+
+def main():
+    count = 100_000
+    for aware in (False, True):
+        times = make_times(count, aware)
+        pairs = list(zip(times, times[1:]))
+        kind = "aware" if aware else "naive"
+        results = {
+            "sort": timeit.timeit(lambda: sorted(times), number=3) / 3,
+            "hash": timeit.timeit(lambda: set(times), number=3) / 3,
+            "subtraction": timeit.timeit(lambda: [t1 - t2 for t1, t2 in pairs], number=3) / 3,
+        }
+        for name, seconds in results.items():
+            print(f"{kind:5s} {name:12s} {count:7d} instances: {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
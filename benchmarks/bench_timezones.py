@@ -0,0 +1,75 @@
+# Benchmark offset resolution and localization with compiled time zones
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+import datetime
+import time
+import zoneinfo
+
+import numpy as np
+
+from datetime2 import DateTime
+from datetime2.timezones import TimeZone, get_zone
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    key = "America/New_York"
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    sample = 100_000
+    seconds_since_epoch = rng.integers(0, 80 * 365 * 86_400, count)
+    moments = seconds_since_epoch.astype("datetime64[s]").astype("datetime64[ns]")
+
+    _, seconds = timed(lambda: TimeZone(key))
+    print(f"compile {key}:                            {seconds * 1e3:7.2f} ms")
+    zone = get_zone(key)
+    utc_moments = [DateTime.from_nanoseconds((719162 * 86_400 + int(second)) * 1_000_000_000, utcoffset=0)
+                   for second in seconds_since_epoch[:sample]]
+    zone.localize_many(utc_moments[:10])
+    _, seconds = timed(lambda: zone.localize_many(utc_moments))
+    print(f"{sample:,} DateTime localized one by one:        {seconds:7.2f} s")
+
+    tzinfo = zoneinfo.ZoneInfo(key)
+    py_moments = [datetime.datetime.fromtimestamp(int(second), datetime.timezone.utc) for second in seconds_since_epoch[:sample]]
+    _, seconds = timed(lambda: [moment.astimezone(tzinfo) for moment in py_moments])
+    print(f"{sample:,} datetime.astimezone (zoneinfo):       {seconds:7.2f} s")
+
+    _, seconds = timed(lambda: zone.localize_datetime64(moments))
+    print(f"{count:,} datetime64[ns] localized at once:    {seconds:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,37 +30,165 @@
 __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
 
+import datetime
 import numbers
 import time
 from decimal import Decimal
 from fractions import Fraction
 from math import floor
 
-from .common import verify_fractional_value, verify_fractional_value_num_den
-from . import western, modern
+from .common import (
+    FRACTION_NANOSECONDS,
+    FRACTION_NONE,
+    NANOSECONDS_IN_DAY,
+    UNIX_EPOCH_DAY_COUNT,
+    InstancePool,
+    ValueCache,
+    append_fraction,
+    append_integer,
+    check_binary_end,
+    check_binary_header,
+    fraction_to_nanoseconds,
+    read_fraction,
+    read_integer,
+    verify_fractional_value,
+    verify_fractional_value_num_den,
+)
+from . import clocks, western, modern
 
 
 ##############################################################################
 # OS dependent functions
 #
+class _LocalClock:
+    # The UTC offset and the start of the local day are computed with
+    # time.localtime once per second; within the same second, the local
+    # moment is derived from the nanoseconds since the epoch with integer
+    # arithmetic only. The state is a tuple, so that threads see it whole.
+    __slots__ = ("source", "time_ns", "_second_state")
+
+    def __init__(self, source):
+        self.set_source(source)
+
+    def set_source(self, source):
+        if not callable(getattr(source, "time_ns", None)):
+            raise TypeError("Clock source does not have method time_ns.")
+        self.source = source
+        self.time_ns = source.time_ns
+        self._second_state = (None, 0, 0, Fraction(0))
+
+    def moment_ns(self):
+        moment_ns = self.time_ns()
+        second = moment_ns // 1_000_000_000
+        second_state = self._second_state
+        if second_state[0] != second:
+            second_state = self._second_state = self._local_second(second)
+        return second_state[1], moment_ns - second_state[2], second_state[3]
+
+    @staticmethod
+    def _local_second(second):
+        # for the moment we are using time module's functions to get localtime
+        # TODO: check if possible to implement something independent from time module, see e.g. tzlocal
+        moment = time.localtime(second)
+        year_minus_one = moment.tm_year - 1
+        day_count = (year_minus_one * 365 + year_minus_one // 4 - year_minus_one // 100 + year_minus_one // 400
+                     + moment.tm_yday)
+        seconds_in_day = min(moment.tm_hour * 3600 + moment.tm_min * 60 + moment.tm_sec, 86399)  # no leap seconds
+        day_start_ns = (second - seconds_in_day) * 1_000_000_000
+        return second, day_count, day_start_ns, Fraction(moment.tm_gmtoff, 86400)
+
+
+_local_clock = _LocalClock(clocks.SystemClock())
+
+
+def get_clock_source():
+    """Return the clock source of the current date and time."""
+    return _local_clock.source
+
+
+def set_clock_source(source=None):
+    """Use source for the current date and time, or the system clock if
+    source is None, and return the previous clock source."""
+    previous_source = _local_clock.source
+    _local_clock.set_source(clocks.SystemClock() if source is None else source)
+    return previous_source
+
+
+def get_moment_ns():
+    """Return local date and time as day_count, local time as nanoseconds
+    since midnight, and distance from UTC as fraction of a day."""
+    return _local_clock.moment_ns()
+
+
 def get_moment_complete():
     """Return local date and time as day_count, local time as day fraction, and,
     if possible, distance from UTC as fraction of a day."""
-    try:
-        moment_ns = (time.time_ns())  # time in ns from epoch; note epoch is platform dependent
-    except AttributeError:
-        moment_ns = int(time.time() * 1_000_000_000)  # time() returns a float in second
-    # for the moment we are using time module's functions to get localtime
-    # TODO: check if possible to implement something independent from time module, see e.g. tzlocal
-    seconds, nanoseconds = divmod(moment_ns, 1_000_000_000)
-    moment = time.localtime(seconds)
-    year = moment.tm_year
-    days_before_year = ((year - 1) * 365 + (year - 1) // 4 - (year - 1) // 100 + (year - 1) // 400)
-    day_count = days_before_year + moment.tm_yday
-    day_frac = (Fraction(moment.tm_hour, 24)   + Fraction(moment.tm_min, 1440) +
-                Fraction(moment.tm_sec, 86400) + Fraction(nanoseconds, 86_400_000_000_000))
-    utcoffset = Fraction(moment.tm_gmtoff, 86400)
-    return day_count, day_frac, utcoffset
+    day_count, day_ns, utcoffset = _local_clock.moment_ns()
+    return day_count, Fraction(day_ns, NANOSECONDS_IN_DAY), utcoffset
+
+
+##############################################################################
+# Binary encoding: the header byte holds the class in the high nibble and
+# the version of the format in the low nibble
+#
+_DATE_BINARY_HEADER = 0x11
+_TIME_BINARY_HEADER = 0x21
+_TIMEDELTA_BINARY_HEADER = 0x31
+_DATETIME_BINARY_HEADER = 0x41
+
+
+def _restore_legacy_dict(obj, state, fields):
+    # Before the base classes had slots, instances were pickled as their
+    # __dict__: fields are set by the caller, representations cached under
+    # the name of their access attribute are dropped, the rest belongs to a
+    # subclass.
+    instance_dict = {key: value for key, value in state.items() if key not in fields and not hasattr(type(obj), key)}
+    if instance_dict and hasattr(obj, "__dict__"):
+        obj.__dict__.update(instance_dict)
+
+
+##############################################################################
+# Conversions with the datetime module of the standard library: dates have
+# the same day count, times and time deltas are exchanged as integer
+# microseconds; values finer than a microsecond are floored
+#
+_MICROSECONDS_IN_DAY = 86_400_000_000
+_MAX_PYDATE_DAY_COUNT = datetime.date.max.toordinal()
+
+
+def _pydate_range_error(day_count):
+    return ValueError(f"Day count {day_count} is outside the range of datetime.date, 1 to {_MAX_PYDATE_DAY_COUNT}.")
+
+
+def _pytime_nanoseconds(pytime):
+    return (((pytime.hour * 60 + pytime.minute) * 60 + pytime.second) * 1_000_000 + pytime.microsecond) * 1000
+
+
+def _pytimedelta_microseconds(pytimedelta):
+    return (pytimedelta.days * 86400 + pytimedelta.seconds) * 1_000_000 + pytimedelta.microseconds
+
+
+def _utcoffset_from_pytimedelta(pytimedelta):
+    if pytimedelta is None:
+        return None
+    return Fraction(_pytimedelta_microseconds(pytimedelta), _MICROSECONDS_IN_DAY)
+
+
+def _pytimezone_from_utcoffset(utcoffset):
+    if utcoffset is None:
+        return None
+    utcoffset_us = utcoffset * _MICROSECONDS_IN_DAY
+    if utcoffset_us.denominator != 1:
+        raise ValueError("UTC offset must be a whole number of microseconds to be converted to datetime.timezone.")
+    # datetime.timezone raises ValueError for offsets of a whole day
+    return datetime.timezone(datetime.timedelta(microseconds=utcoffset_us.numerator))
+
+
+def _pytime_from_nanoseconds(day_ns, pytimezone):
+    seconds, microseconds = divmod(day_ns // 1000, 1_000_000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return datetime.time(hours, minutes, seconds, microseconds, pytimezone)
 
 
 ##############################################################################
@@ -71,6 +199,10 @@ def get_moment_complete():
 
 
 class Date:
+    __slots__ = ("_day_count",)
+    # opt-in interning of the instances built by calendar constructors
+    pool = InstancePool()
+
     def __init__(self, day_count):
         # TODO: consider using the number hierarchy
         if isinstance(day_count, int):
@@ -80,7 +212,52 @@ class Date:
 
     @classmethod
     def today(cls):
-        return cls(get_moment_complete()[0])
+        return cls(_local_clock.moment_ns()[0])
+
+    @classmethod
+    def from_pydate(cls, pydate):
+        if not isinstance(pydate, datetime.date):
+            raise TypeError("Argument must be a datetime.date instance.")
+        return cls(pydate.toordinal())
+
+    @classmethod
+    def from_pydate_many(cls, pydates):
+        # the unbound method raises TypeError for objects that are not dates
+        to_ordinal = datetime.date.toordinal
+        return [cls(to_ordinal(pydate)) for pydate in pydates]
+
+    def to_pydate(self):
+        if not 0 < self._day_count <= _MAX_PYDATE_DAY_COUNT:
+            raise _pydate_range_error(self._day_count)
+        return datetime.date.fromordinal(self._day_count)
+
+    @staticmethod
+    def to_pydate_many(dates):
+        from_ordinal = datetime.date.fromordinal
+        pydates = []
+        append = pydates.append
+        for date_obj in dates:
+            if not isinstance(date_obj, Date):
+                raise TypeError("Only Date instances can be converted to datetime.date.")
+            day_count = date_obj._day_count
+            if not 0 < day_count <= _MAX_PYDATE_DAY_COUNT:
+                raise _pydate_range_error(day_count)
+            append(from_ordinal(day_count))
+        return pydates
+
+    @classmethod
+    def range(cls, start, stop, step=1):
+        if not isinstance(start, Date) or not isinstance(stop, Date):
+            raise TypeError("Start and stop of a date range must be Date instances.")
+        if isinstance(step, TimeDelta):
+            if step._frac_part:
+                raise ValueError("Step of a date range must be a whole number of days.")
+            step = step._int_part
+        elif not isinstance(step, int):
+            raise TypeError("Step of a date range must be an integer or a TimeDelta.")
+        if step == 0:
+            raise ValueError("Step of a date range must not be zero.")
+        return DateRange._from_day_counts(cls, range(start._day_count, stop._day_count, step))
 
     @property
     def day_count(self):
@@ -94,9 +271,9 @@ class Date:
 
     def __add__(self, other):
         if isinstance(other, TimeDelta):
-            if not other.is_integer():
+            if other._frac_part:
                 raise ValueError("Date object cannot be added to non integral TimeDelta.")
-            return type(self)(self.day_count + int(other.fractional_days))   # note: fractional days is a Fraction
+            return type(self)(self._day_count + other._int_part)
         else:
             return NotImplemented
 
@@ -104,19 +281,20 @@ class Date:
 
     def __sub__(self, other):
         if isinstance(other, Date):
-            return TimeDelta(self.day_count - other.day_count)
+            return TimeDelta._from_days(self._day_count - other._day_count)
         elif isinstance(other, TimeDelta):
-            if not other.is_integer():
+            if other._frac_part:
                 raise ValueError("Non integral TimeDelta cannot be subtracted from Date.")
-            return type(self)(self.day_count - int(other.fractional_days))   # note: fractional days is a Fraction
+            return type(self)(self._day_count - other._int_part)
         else:
             return NotImplemented
 
-    # Comparison operators
+    # Comparison operators; other objects with day counts, like DateArray, are
+    # given the chance to compare themselves
     def __eq__(self, other):
         if isinstance(other, Date):
             return self.day_count == other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             return False
@@ -124,7 +302,7 @@ class Date:
     def __ne__(self, other):
         if isinstance(other, Date):
             return self.day_count != other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             return True
@@ -132,7 +310,7 @@ class Date:
     def __gt__(self, other):
         if isinstance(other, Date):
             return self.day_count > other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
@@ -140,7 +318,7 @@ class Date:
     def __ge__(self, other):
         if isinstance(other, Date):
             return self.day_count >= other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
@@ -148,7 +326,7 @@ class Date:
     def __lt__(self, other):
         if isinstance(other, Date):
             return self.day_count < other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
@@ -156,7 +334,7 @@ class Date:
     def __le__(self, other):
         if isinstance(other, Date):
             return self.day_count <= other.day_count
-        elif hasattr(other, "day_count"):
+        elif hasattr(other, "day_count") or hasattr(other, "day_counts"):
             return NotImplemented
         else:
             raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
@@ -165,6 +343,39 @@ class Date:
     def __hash__(self):
         return hash(self._day_count)
 
+    # binary encoding: header byte, then day count
+    def to_bytes(self):
+        buffer = bytearray((_DATE_BINARY_HEADER,))
+        append_integer(buffer, self._day_count)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        date_obj = cls.__new__(cls)
+        date_obj._load_bytes(data)
+        return date_obj
+
+    def _load_bytes(self, data):
+        data = check_binary_header(data, _DATE_BINARY_HEADER)
+        day_count, offset = read_integer(data, 1)
+        check_binary_end(data, offset)
+        self._day_count = day_count
+
+    # pickling stores the binary encoding, plus the __dict__ of a subclass
+    def __getstate__(self):
+        instance_dict = getattr(self, "__dict__", None)
+        return (self.to_bytes(), instance_dict) if instance_dict else self.to_bytes()
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            Date.__init__(self, state["_day_count"])
+            _restore_legacy_dict(self, state, ("_day_count",))
+            return
+        if isinstance(state, tuple):
+            state, instance_dict = state
+            self.__dict__.update(instance_dict)
+        self._load_bytes(state)
+
     @classmethod
     def register_new_calendar(cls, attribute_name, calendar_class):
         if not isinstance(attribute_name, str) or not attribute_name.isidentifier():
@@ -176,34 +387,150 @@ class Date:
         if not hasattr(calendar_class, "to_rata_die"):
             raise TypeError("Calendar class does not have method to_rata_die.")
 
+        # calendar objects are cached by day count, instead of being stored in the Date instance
+        calendar_cache = ValueCache()
+        # interned calendar objects are shared and must never change class, so
+        # pooled calendars are derived without the pool, or else copied
+        calendar_pool = getattr(calendar_class, "pool", None)
+        if not isinstance(calendar_pool, InstancePool):
+            unshared_from_rata_die = calendar_class.from_rata_die
+        else:
+            unshared_from_rata_die = getattr(calendar_class, "_derive_from_rata_die", None)
+        date_pool = cls.__dict__.get("pool")
+
         class ModifiedClass(type):
             def __call__(klass, *args, **kwargs):
                 calendar_obj = super().__call__(*args, **kwargs)
-                date_obj = cls(calendar_obj.to_rata_die())
-                setattr(date_obj, attribute_name, calendar_obj)
+                day_count = calendar_obj.to_rata_die()
+                if date_pool is not None and date_pool.maxsize:
+                    date_obj = date_pool.get(day_count)
+                    if date_obj is None:
+                        date_obj = date_pool.setdefault(day_count, cls(day_count))
+                else:
+                    date_obj = cls(day_count)
+                calendar_cache.setdefault(day_count, calendar_obj)
                 return date_obj
 
-        # Create the modified calendar class
+            def _dates_from_day_counts(klass, day_counts):
+                # calendar methods returning many days, like GregorianCalendar.iter_month,
+                # return dates when called on the modified class
+                return DateRange._from_day_counts(cls, day_counts)
+
+        # Create the modified calendar class; having the same layout of the
+        # original one, instances of the latter can be converted to it
         new_class_name = f"{calendar_class.__name__}In{cls.__name__}"
-        modified_calendar_class = ModifiedClass(new_class_name, (calendar_class,), {})
+        modified_calendar_class = ModifiedClass(new_class_name, (calendar_class,), {"__slots__": ()})
 
         class CalendarAttribute:
             # This class implements a context dependent attribute
-            def __init__(self, attr_name, modif_calendar_class):
+            def __init__(self, attr_name, modif_calendar_class, cache):
                 self.attribute_name = attr_name
                 self.modified_calendar_class = modif_calendar_class
+                self.cache = cache
 
             def __get__(self, instance, owner):
                 if instance is None:
                     return self.modified_calendar_class
                 else:
-                    assert self.attribute_name not in instance.__dict__
-                    date_obj = self.modified_calendar_class.from_rata_die(instance.day_count)
-                    calendar_obj = getattr(date_obj, self.attribute_name)
-                    setattr(instance, self.attribute_name, calendar_obj)
+                    day_count = instance._day_count
+                    calendar_obj = self.cache.get(day_count)
+                    if calendar_obj is None:
+                        # the unmodified class does not build a throwaway Date
+                        if unshared_from_rata_die is not None:
+                            calendar_obj = unshared_from_rata_die(day_count)
+                            calendar_obj.__class__ = self.modified_calendar_class
+                        else:
+                            pooled_obj = calendar_class.from_rata_die(day_count)
+                            calendar_obj = object.__new__(self.modified_calendar_class)
+                            calendar_obj.__dict__.update(pooled_obj.__dict__)
+                        # if another thread got here first, its object is returned
+                        calendar_obj = self.cache.setdefault(day_count, calendar_obj)
                     return calendar_obj
 
-        setattr(cls, attribute_name, CalendarAttribute(attribute_name, modified_calendar_class))
+        setattr(cls, attribute_name, CalendarAttribute(attribute_name, modified_calendar_class, calendar_cache))
+
+
+class DateRange:
+    # A lazy sequence of dates at a fixed distance, backed by a range of day
+    # counts: length, indexing, slicing and membership need no iteration, and
+    # dates are built only when read, without verifying the day count again.
+    __slots__ = ("_date_class", "_day_counts")
+
+    def __init__(self, start, stop, step=1):
+        range_obj = Date.range(start, stop, step)
+        self._date_class = range_obj._date_class
+        self._day_counts = range_obj._day_counts
+
+    @classmethod
+    def _from_day_counts(cls, date_class, day_counts):
+        range_obj = cls.__new__(cls)
+        range_obj._date_class = date_class
+        range_obj._day_counts = day_counts
+        return range_obj
+
+    def _new_date(self, day_count):
+        date_obj = object.__new__(self._date_class)
+        date_obj._day_count = day_count
+        return date_obj
+
+    @property
+    def start(self):
+        return self._new_date(self._day_counts.start)
+
+    @property
+    def stop(self):
+        return self._new_date(self._day_counts.stop)
+
+    @property
+    def step(self):
+        return self._day_counts.step
+
+    @property
+    def day_counts(self):
+        return self._day_counts
+
+    def __len__(self):
+        return len(self._day_counts)
+
+    def __bool__(self):
+        return bool(self._day_counts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_day_counts(self._date_class, self._day_counts[index])
+        return self._new_date(self._day_counts[index])
+
+    def __iter__(self):
+        new, date_class = object.__new__, self._date_class
+        for day_count in self._day_counts:
+            date_obj = new(date_class)
+            date_obj._day_count = day_count
+            yield date_obj
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def __contains__(self, date_obj):
+        return isinstance(date_obj, Date) and date_obj._day_count in self._day_counts
+
+    def index(self, date_obj):
+        if not isinstance(date_obj, Date) or date_obj._day_count not in self._day_counts:
+            raise ValueError(f"{date_obj!r} is not in date range.")
+        return self._day_counts.index(date_obj._day_count)
+
+    def count(self, date_obj):
+        return int(date_obj in self)
+
+    def __eq__(self, other):
+        if isinstance(other, DateRange):
+            return self._day_counts == other._day_counts
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._day_counts)
+
+    def __repr__(self):
+        return f"datetime2.{type(self).__name__}({self.start!r}, {self.stop!r}, {self.step})"
 
 
 ##############################################################################
@@ -221,47 +548,136 @@ Date.register_new_calendar("iso", modern.IsoCalendar)
 
 
 class Time:
+    __slots__ = ("_day_frac", "_day_ns", "_utcoffset", "_moment_ns")
+
     def __init__(self, numerator, denominator=None, *, utcoffset=None):
         if denominator is None:
             self._day_frac = verify_fractional_value(numerator, min=0, max_excl=1)
         else:
             self._day_frac = verify_fractional_value_num_den(numerator, denominator, min=0, max_excl=1)
+        self._day_ns = fraction_to_nanoseconds(self._day_frac)
         if utcoffset is None:
             # naive instance
             self._utcoffset = None
+            self._moment_ns = self._day_ns
         else:
             # aware instance
             self._utcoffset = verify_fractional_value(utcoffset, min=-1, max=1)
+            self._moment_ns = self._aware_moment_ns()
 
     @classmethod
-    def now(cls, utcoffset=None):
-        current_moment = get_moment_complete()
+    def from_nanoseconds(cls, nanoseconds, *, utcoffset=None):
+        if not isinstance(nanoseconds, int):
+            raise TypeError("Nanoseconds must be an integer.")
+        if nanoseconds < 0 or nanoseconds >= NANOSECONDS_IN_DAY:
+            raise ValueError(f"Nanoseconds must be equal or greater than 0 and less than {NANOSECONDS_IN_DAY}.")
+        if utcoffset is not None:
+            utcoffset = verify_fractional_value(utcoffset, min=-1, max=1)
+        return cls._from_nanoseconds(nanoseconds, utcoffset)
+
+    @classmethod
+    def _from_nanoseconds(cls, day_ns, utcoffset):
+        # day_ns and utcoffset are assumed to be already verified
+        time_obj = cls.__new__(cls)
+        time_obj._day_frac = None
+        time_obj._day_ns = day_ns
+        time_obj._utcoffset = utcoffset
         if utcoffset is None:
-            return cls(current_moment[1], utcoffset=current_moment[2])
+            time_obj._moment_ns = day_ns
+        else:
+            time_obj._moment_ns = time_obj._aware_moment_ns()
+        return time_obj
+
+    def _aware_moment_ns(self):
+        if self._day_ns is None:
+            return None
+        utcoffset_ns = fraction_to_nanoseconds(self._utcoffset)
+        if utcoffset_ns is None:
+            return None
+        return self._day_ns - utcoffset_ns
+
+    def _moment(self):
+        # exact moment, as a Fraction, used when integer nanoseconds are not available
+        if self._utcoffset is None:
+            return self.day_frac
         else:
-            valid_utcoffset = verify_fractional_value(utcoffset, min=-1, max=1)
-            delta = current_moment[2] - valid_utcoffset
-            day_frac_temp = current_moment[1] - delta + 2  # +2 needed to avoid underruns
-            new_day_frac = day_frac_temp - int(day_frac_temp)  # as so we eliminate the +2 above
-            return cls(new_day_frac, utcoffset=valid_utcoffset)
+            return self.day_frac - self._utcoffset
 
     @classmethod
-    def localnow(cls):
+    def now(cls, utcoffset=None):
+        if utcoffset is None:
+            day_count, day_ns, local_utcoffset = _local_clock.moment_ns()
+            return cls._from_nanoseconds(day_ns, local_utcoffset)
+        valid_utcoffset = verify_fractional_value(utcoffset, min=-1, max=1)
+        utcoffset_ns = fraction_to_nanoseconds(valid_utcoffset)
+        if utcoffset_ns is not None:
+            # the epoch is at midnight UTC, so local calendar fields are not needed
+            return cls._from_nanoseconds((_local_clock.time_ns() + utcoffset_ns) % NANOSECONDS_IN_DAY, valid_utcoffset)
         current_moment = get_moment_complete()
-        return cls(current_moment[1])
+        delta = current_moment[2] - valid_utcoffset
+        day_frac_temp = current_moment[1] - delta + 2  # +2 needed to avoid underruns
+        new_day_frac = day_frac_temp - int(day_frac_temp)  # as so we eliminate the +2 above
+        return cls(new_day_frac, utcoffset=valid_utcoffset)
+
+    @classmethod
+    def localnow(cls):
+        return cls._from_nanoseconds(_local_clock.moment_ns()[1], None)
 
     @classmethod
     def utcnow(cls):
-        current_moment = get_moment_complete()
-        utcnow = current_moment[1] - current_moment[2]
-        if utcnow < 0:
-            utcnow += 1
-        elif utcnow >= 1:
-            utcnow -= 1
-        return cls(utcnow)
+        return cls._from_nanoseconds(_local_clock.time_ns() % NANOSECONDS_IN_DAY, None)
+
+    @classmethod
+    def from_pytime(cls, pytime):
+        if not isinstance(pytime, datetime.time):
+            raise TypeError("Argument must be a datetime.time instance.")
+        return cls._from_nanoseconds(_pytime_nanoseconds(pytime), _utcoffset_from_pytimedelta(pytime.utcoffset()))
+
+    @classmethod
+    def from_pytime_many(cls, pytimes):
+        # the UTC offset of a datetime.time depends only on its tzinfo
+        utcoffsets = {None: None}
+        time_objs = []
+        append = time_objs.append
+        for pytime in pytimes:
+            if not isinstance(pytime, datetime.time):
+                raise TypeError("Only datetime.time instances can be converted to Time.")
+            tzinfo = pytime.tzinfo
+            try:
+                utcoffset = utcoffsets[tzinfo]
+            except KeyError:
+                utcoffset = utcoffsets[tzinfo] = _utcoffset_from_pytimedelta(pytime.utcoffset())
+            append(cls._from_nanoseconds(_pytime_nanoseconds(pytime), utcoffset))
+        return time_objs
+
+    def _floor_nanoseconds(self):
+        if self._day_ns is not None:
+            return self._day_ns
+        return self._day_frac.numerator * NANOSECONDS_IN_DAY // self._day_frac.denominator
+
+    def to_pytime(self):
+        return _pytime_from_nanoseconds(self._floor_nanoseconds(), _pytimezone_from_utcoffset(self._utcoffset))
+
+    @staticmethod
+    def to_pytime_many(times):
+        pytimezones = {None: None}
+        pytimes = []
+        append = pytimes.append
+        for time_obj in times:
+            if not isinstance(time_obj, Time):
+                raise TypeError("Only Time instances can be converted to datetime.time.")
+            utcoffset = time_obj._utcoffset
+            try:
+                pytimezone = pytimezones[utcoffset]
+            except KeyError:
+                pytimezone = pytimezones[utcoffset] = _pytimezone_from_utcoffset(utcoffset)
+            append(_pytime_from_nanoseconds(time_obj._floor_nanoseconds(), pytimezone))
+        return pytimes
 
     @property
     def day_frac(self):
+        if self._day_frac is None:
+            self._day_frac = Fraction(self._day_ns, NANOSECONDS_IN_DAY)
         return self._day_frac
 
     @property
@@ -283,6 +699,10 @@ class Time:
     # Math operators
     def __add__(self, other):
         if isinstance(other, TimeDelta):
+            if self._day_ns is not None:
+                delta_ns = fraction_to_nanoseconds(other.fractional_days)
+                if delta_ns is not None:
+                    return self._from_nanoseconds((self._day_ns + delta_ns) % NANOSECONDS_IN_DAY, self._utcoffset)
             total = self.day_frac + other.fractional_days
             return type(self)(total - floor(total), utcoffset=self.utcoffset)
         else:
@@ -292,16 +712,14 @@ class Time:
 
     def __sub__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset:
-                if other.utcoffset is None:
-                    raise ValueError("You cannot mix naive and aware instances.")
-                self_utc = self.day_frac - self.utcoffset
-                other_utc = other.day_frac -  other.utcoffset
-                delta = self_utc - other_utc
-            else:
-                if other.utcoffset is not None:
-                    raise ValueError("You cannot mix naive and aware instances.")
-                delta = self.day_frac - other.day_frac
+            if (self._utcoffset is None) != (other._utcoffset is None):
+                raise ValueError("You cannot mix naive and aware instances.")
+            if self._moment_ns is not None and other._moment_ns is not None:
+                # reduce the difference to the (-1/2, 1/2] day interval
+                half_day_ns = NANOSECONDS_IN_DAY // 2
+                delta_ns = (self._moment_ns - other._moment_ns + half_day_ns - 1) % NANOSECONDS_IN_DAY - half_day_ns + 1
+                return TimeDelta(delta_ns, NANOSECONDS_IN_DAY)
+            delta = self._moment() - other._moment()
             if delta <= Fraction(-1, 2):
                 delta += 1
                 while delta <= Fraction(-1, 2):
@@ -312,24 +730,34 @@ class Time:
                     delta -= 1
             return TimeDelta(delta)
         elif isinstance(other, TimeDelta):
+            if self._day_ns is not None:
+                delta_ns = fraction_to_nanoseconds(other.fractional_days)
+                if delta_ns is not None:
+                    return self._from_nanoseconds((self._day_ns - delta_ns) % NANOSECONDS_IN_DAY, self._utcoffset)
             total = self.day_frac - other.fractional_days
             return type(self)(total - floor(total), utcoffset=self.utcoffset)
         else:
             return NotImplemented
 
     # Comparison operators
+    def _ordering_operands(self, other):
+        # return the values to be compared when ordering two Time instances
+        if self._utcoffset is None:
+            if other._utcoffset is not None:
+                raise TypeError("You cannot compare a naive Time instance with an aware one.")
+        elif other._utcoffset is None:
+            raise TypeError("You cannot compare an aware Time instance with a naive one.")
+        if self._moment_ns is not None and other._moment_ns is not None:
+            return self._moment_ns, other._moment_ns
+        return self._moment(), other._moment()
+
     def __eq__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac == other.day_frac
-                else:
-                    return False
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset == other.day_frac - other.utcoffset
-                else:
-                    return False
+            if (self._utcoffset is None) != (other._utcoffset is None):
+                return False
+            if self._moment_ns is not None and other._moment_ns is not None:
+                return self._moment_ns == other._moment_ns
+            return self._moment() == other._moment()
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -337,16 +765,11 @@ class Time:
 
     def __ne__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac != other.day_frac
-                else:
-                    return True
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset != other.day_frac - other.utcoffset
-                else:
-                    return True
+            if (self._utcoffset is None) != (other._utcoffset is None):
+                return True
+            if self._moment_ns is not None and other._moment_ns is not None:
+                return self._moment_ns != other._moment_ns
+            return self._moment() != other._moment()
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -354,16 +777,8 @@ class Time:
 
     def __gt__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac > other.day_frac
-                else:
-                    raise TypeError("You cannot compare a naive Time instance with an aware one.")
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset > other.day_frac - other.utcoffset
-                else:
-                    raise TypeError("You cannot compare an aware Time instance with a naive one.")
+            self_value, other_value = self._ordering_operands(other)
+            return self_value > other_value
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -371,16 +786,8 @@ class Time:
 
     def __ge__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac >= other.day_frac
-                else:
-                    raise TypeError("You cannot compare a naive Time instance with an aware one.")
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset >= other.day_frac - other.utcoffset
-                else:
-                    raise TypeError("You cannot compare an aware Time instance with a naive one.")
+            self_value, other_value = self._ordering_operands(other)
+            return self_value >= other_value
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -388,16 +795,8 @@ class Time:
 
     def __lt__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac < other.day_frac
-                else:
-                    raise TypeError("You cannot compare a naive Time instance with an aware one.")
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset < other.day_frac - other.utcoffset
-                else:
-                    raise TypeError("You cannot compare an aware Time instance with a naive one.")
+            self_value, other_value = self._ordering_operands(other)
+            return self_value < other_value
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -405,16 +804,8 @@ class Time:
 
     def __le__(self, other):
         if isinstance(other, Time):
-            if self.utcoffset is None:
-                if other.utcoffset is None:
-                    return self.day_frac <= other.day_frac
-                else:
-                    raise TypeError("You cannot compare a naive Time instance with an aware one.")
-            else:
-                if other.utcoffset is not None:
-                    return self.day_frac - self.utcoffset <= other.day_frac - other.utcoffset
-                else:
-                    raise TypeError("You cannot compare an aware Time instance with a naive one.")
+            self_value, other_value = self._ordering_operands(other)
+            return self_value <= other_value
         elif hasattr(other, "day_frac") and hasattr(other, "utcoffset"):
             return NotImplemented
         else:
@@ -422,10 +813,89 @@ class Time:
 
     # hash value
     def __hash__(self):
-        if self.utcoffset is None:
-            return hash((self.day_frac, None))
+        # equal instances must have the same hash, so the moment is hashed as
+        # integer nanoseconds whenever it can be represented exactly
+        moment = self._moment_ns
+        if moment is None:
+            moment = self._moment()
+            moment_ns = fraction_to_nanoseconds(moment)
+            if moment_ns is not None:
+                moment = moment_ns
+        if self._utcoffset is None:
+            return hash((moment, None))
+        else:
+            return hash(moment)
+
+    # binary encoding: header byte, byte with the kinds of encoding of day
+    # fraction and UTC offset, then their values
+    def to_bytes(self):
+        buffer = bytearray((_TIME_BINARY_HEADER, 0))
+        if self._day_ns is None:
+            day_frac_kind = append_fraction(buffer, self._day_frac)
+        else:
+            append_integer(buffer, self._day_ns)
+            day_frac_kind = FRACTION_NANOSECONDS
+        buffer[1] = day_frac_kind | (append_fraction(buffer, self._utcoffset) << 2)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        time_obj = cls.__new__(cls)
+        time_obj._load_bytes(data)
+        return time_obj
+
+    def _load_bytes(self, data):
+        data = check_binary_header(data, _TIME_BINARY_HEADER)
+        if len(data) < 2:
+            raise ValueError("Truncated binary data.")
+        day_frac_kind, utcoffset_kind = data[1] & 3, data[1] >> 2
+        if day_frac_kind != FRACTION_NANOSECONDS or utcoffset_kind not in (FRACTION_NANOSECONDS, FRACTION_NONE):
+            day_frac, offset = read_fraction(day_frac_kind, data, 2)
+            if day_frac is None:
+                raise ValueError("Invalid binary data: missing day fraction.")
+            utcoffset, offset = read_fraction(utcoffset_kind, data, offset)
+            check_binary_end(data, offset)
+            Time.__init__(self, day_frac, utcoffset=utcoffset)
+            return
+        # the common case, where integer nanoseconds need no Fraction arithmetic
+        day_ns, offset = read_integer(data, 2)
+        if day_ns < 0 or day_ns >= NANOSECONDS_IN_DAY:
+            raise ValueError(f"Nanoseconds must be equal or greater than 0 and less than {NANOSECONDS_IN_DAY}.")
+        self._day_frac = None
+        self._day_ns = day_ns
+        if utcoffset_kind == FRACTION_NONE:
+            check_binary_end(data, offset)
+            self._utcoffset = None
+            self._moment_ns = day_ns
+        else:
+            utcoffset_ns, offset = read_integer(data, offset)
+            check_binary_end(data, offset)
+            if utcoffset_ns < -NANOSECONDS_IN_DAY or utcoffset_ns > NANOSECONDS_IN_DAY:
+                raise ValueError("UTC offset must be between -1 and 1.")
+            self._utcoffset = Fraction(utcoffset_ns, NANOSECONDS_IN_DAY)
+            self._moment_ns = day_ns - utcoffset_ns
+
+    # pickling stores the binary encoding, plus the __dict__ of a subclass
+    def __getstate__(self):
+        instance_dict = getattr(self, "__dict__", None)
+        return (self.to_bytes(), instance_dict) if instance_dict else self.to_bytes()
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            Time.__init__(self, state["_day_frac"], utcoffset=state["_utcoffset"])
+            _restore_legacy_dict(self, state, ("_day_frac", "_utcoffset"))
+            return
+        if isinstance(state, tuple):
+            state, instance_dict = state
+            self.__dict__.update(instance_dict)
+        self._load_bytes(state)
+
+    def _value_key(self):
+        # key identifying day fraction and UTC offset, used to cache time representations
+        if self._day_ns is None:
+            return self._day_frac, self._utcoffset
         else:
-            return hash(self.day_frac - self.utcoffset)
+            return self._day_ns, self._utcoffset
 
     @classmethod
     def register_new_time(cls, attribute_name, time_repr_class):
@@ -438,35 +908,44 @@ class Time:
         if not hasattr(time_repr_class, "to_time_pair"):
             raise TypeError("Time representation class does not have method to_time_pair.")
 
+        # time representation objects are cached by value, instead of being stored in the Time instance
+        time_repr_cache = ValueCache()
+
         class ModifiedClass(type):
             def __call__(klass, *args, **kwargs):
                 time_repr_obj = super().__call__(*args, **kwargs)
                 day_frac, utcoffset = time_repr_obj.to_time_pair()
                 time_obj = cls(day_frac, utcoffset=utcoffset)
-                setattr(time_obj, attribute_name, time_repr_obj)
+                time_repr_cache.setdefault(time_obj._value_key(), time_repr_obj)
                 return time_obj
 
-        # Create the modified calendar class
+        # Create the modified time representation class; having the same layout
+        # of the original one, instances of the latter can be converted to it
         new_class_name = f"{time_repr_class.__name__}In{cls.__name__}"
-        modified_time_repr_class = ModifiedClass(new_class_name, (time_repr_class,), {})
+        modified_time_repr_class = ModifiedClass(new_class_name, (time_repr_class,), {"__slots__": ()})
 
         class TimeReprAttribute:
             # This class implements a context dependent attribute
-            def __init__(self, attr_name, modif_time_repr_class):
+            def __init__(self, attr_name, modif_time_repr_class, cache):
                 self.attr_name = attr_name
                 self.modified_time_repr_class = modif_time_repr_class
+                self.cache = cache
 
             def __get__(self, instance, owner):
                 if instance is None:
                     return self.modified_time_repr_class
                 else:
-                    assert self.attr_name not in instance.__dict__
-                    time_obj = self.modified_time_repr_class.from_time_pair(instance.day_frac, utcoffset=instance.utcoffset)
-                    time_repr_obj = getattr(time_obj, self.attr_name)
-                    setattr(instance, self.attr_name, time_repr_obj)
+                    value_key = instance._value_key()
+                    time_repr_obj = self.cache.get(value_key)
+                    if time_repr_obj is None:
+                        # the unmodified class does not build a throwaway Time
+                        time_repr_obj = time_repr_class.from_time_pair(instance.day_frac, utcoffset=instance.utcoffset)
+                        time_repr_obj.__class__ = self.modified_time_repr_class
+                        # if another thread got here first, its object is returned
+                        time_repr_obj = self.cache.setdefault(value_key, time_repr_obj)
                     return time_repr_obj
 
-        setattr(cls, attribute_name, TimeReprAttribute(attribute_name, modified_time_repr_class))
+        setattr(cls, attribute_name, TimeReprAttribute(attribute_name, modified_time_repr_class, time_repr_cache))
 
 
 ##############################################################################
@@ -484,17 +963,84 @@ Time.register_new_time("internet", modern.InternetTime)
 
 
 class TimeDelta:
+    # Integral time deltas store an int in _fractional_days and 0 in
+    # _frac_part, so that day arithmetic does not build Fractions; the
+    # properties convert them to Fraction only when they are asked for.
+    __slots__ = ("_fractional_days", "_int_part", "_frac_part")
+
     def __init__(self, numerator, denominator=None):
         if denominator is None:
+            if type(numerator) is int:
+                self._fractional_days = self._int_part = numerator
+                self._frac_part = 0
+                return
             self._fractional_days = verify_fractional_value(numerator)
         else:
             self._fractional_days = verify_fractional_value_num_den(numerator, denominator)
         self._int_part = int(self._fractional_days)
         self._frac_part = self._fractional_days - self._int_part
 
+    @classmethod
+    def _from_days(cls, days):
+        # days is an int; used by Date, which needs no verification
+        timedelta_obj = cls.__new__(cls)
+        timedelta_obj._fractional_days = timedelta_obj._int_part = days
+        timedelta_obj._frac_part = 0
+        return timedelta_obj
+
+    @classmethod
+    def _from_nanoseconds(cls, nanoseconds):
+        # nanoseconds is an int; used by DateTime, which needs no verification
+        days, day_ns = divmod(nanoseconds, NANOSECONDS_IN_DAY)
+        if not day_ns:
+            return cls._from_days(days)
+        if days < 0:
+            days += 1
+            day_ns -= NANOSECONDS_IN_DAY
+        timedelta_obj = cls.__new__(cls)
+        timedelta_obj._fractional_days = Fraction(nanoseconds, NANOSECONDS_IN_DAY)
+        timedelta_obj._int_part = days
+        timedelta_obj._frac_part = Fraction(day_ns, NANOSECONDS_IN_DAY)
+        return timedelta_obj
+
+    @classmethod
+    def from_pytimedelta(cls, pytimedelta):
+        if not isinstance(pytimedelta, datetime.timedelta):
+            raise TypeError("Argument must be a datetime.timedelta instance.")
+        return cls._from_nanoseconds(_pytimedelta_microseconds(pytimedelta) * 1000)
+
+    @classmethod
+    def from_pytimedelta_many(cls, pytimedeltas):
+        timedelta_objs = []
+        append = timedelta_objs.append
+        for pytimedelta in pytimedeltas:
+            if not isinstance(pytimedelta, datetime.timedelta):
+                raise TypeError("Only datetime.timedelta instances can be converted to TimeDelta.")
+            if pytimedelta.seconds or pytimedelta.microseconds:
+                append(cls._from_nanoseconds(_pytimedelta_microseconds(pytimedelta) * 1000))
+            else:
+                append(cls._from_days(pytimedelta.days))
+        return timedelta_objs
+
+    def to_pytimedelta(self):
+        if not self._frac_part:
+            return datetime.timedelta(days=self._int_part)
+        fractional_days = self._fractional_days
+        return datetime.timedelta(microseconds=fractional_days.numerator * _MICROSECONDS_IN_DAY // fractional_days.denominator)
+
+    @staticmethod
+    def to_pytimedelta_many(timedeltas):
+        try:
+            return [timedelta_obj.to_pytimedelta() for timedelta_obj in timedeltas]
+        except AttributeError as exc:
+            raise TypeError("Only TimeDelta instances can be converted to datetime.timedelta.") from exc
+
     @property
     def fractional_days(self):
-        return self._fractional_days
+        fractional_days = self._fractional_days
+        if type(fractional_days) is int:
+            self._fractional_days = fractional_days = Fraction(fractional_days)
+        return fractional_days
 
     @property
     def int_part(self):
@@ -502,7 +1048,10 @@ class TimeDelta:
 
     @property
     def frac_part(self):
-        return self._frac_part
+        frac_part = self._frac_part
+        if type(frac_part) is int:
+            self._frac_part = frac_part = Fraction(0)
+        return frac_part
 
     def __repr__(self):
         return f"datetime2.{type(self).__name__}('{self.fractional_days!s}')"
@@ -526,7 +1075,7 @@ class TimeDelta:
 
     def __add__(self, other):
         if isinstance(other, TimeDelta):
-            return type(self)(self.fractional_days + other.fractional_days)
+            return type(self)(self._fractional_days + other._fractional_days)
         else:
             return NotImplemented
 
@@ -534,19 +1083,21 @@ class TimeDelta:
         return self
 
     def __neg__(self):
-        return TimeDelta(-self.fractional_days)
+        return TimeDelta(-self._fractional_days)
 
     def __abs__(self):
-        return self if self.fractional_days >= 0 else -self
+        return self if self._fractional_days >= 0 else -self
 
     def __sub__(self, other):
         if isinstance(other, TimeDelta):
-            return type(self)(self.fractional_days - other.fractional_days)
+            return type(self)(self._fractional_days - other._fractional_days)
         else:
             return NotImplemented
 
     def __mul__(self, other):
-        if isinstance(other, (numbers.Real, Decimal)):
+        if type(other) is int and type(self._fractional_days) is int:
+            return type(self)(self._fractional_days * other)
+        elif isinstance(other, (numbers.Real, Decimal)):
             try:
                 return type(self)(self.fractional_days * Fraction(other))
             except (OverflowError, ValueError) as exc:
@@ -577,7 +1128,7 @@ class TimeDelta:
 
     def __floordiv__(self, other):
         if isinstance(other, TimeDelta):
-            return self.fractional_days // other.fractional_days
+            return self._fractional_days // other._fractional_days
         elif isinstance(other, (numbers.Real, Decimal)):
             try:
                 return type(self)(self.fractional_days // Fraction(other))
@@ -618,7 +1169,7 @@ class TimeDelta:
     # comparisons
     def __eq__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days == other.fractional_days
+            return self._fractional_days == other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -626,7 +1177,7 @@ class TimeDelta:
 
     def __ne__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days != other.fractional_days
+            return self._fractional_days != other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -634,7 +1185,7 @@ class TimeDelta:
 
     def __gt__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days > other.fractional_days
+            return self._fractional_days > other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -642,7 +1193,7 @@ class TimeDelta:
 
     def __ge__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days >= other.fractional_days
+            return self._fractional_days >= other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -650,7 +1201,7 @@ class TimeDelta:
 
     def __lt__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days < other.fractional_days
+            return self._fractional_days < other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -658,7 +1209,7 @@ class TimeDelta:
 
     def __le__(self, other):
         if isinstance(other, TimeDelta):
-            return self._fractional_days <= other.fractional_days
+            return self._fractional_days <= other._fractional_days
         elif hasattr(other, "fractional_days"):
             return NotImplemented
         else:
@@ -668,6 +1219,52 @@ class TimeDelta:
     def __hash__(self):
         return hash(self._fractional_days)
 
+    # binary encoding: header byte, byte with the kind of encoding of the
+    # fractional days, then their value
+    def to_bytes(self):
+        buffer = bytearray((_TIMEDELTA_BINARY_HEADER, 0))
+        buffer[1] = append_fraction(buffer, self._fractional_days)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        timedelta_obj = cls.__new__(cls)
+        timedelta_obj._load_bytes(data)
+        return timedelta_obj
+
+    def _load_bytes(self, data):
+        data = check_binary_header(data, _TIMEDELTA_BINARY_HEADER)
+        if len(data) < 2:
+            raise ValueError("Truncated binary data.")
+        fractional_days, offset = read_fraction(data[1], data, 2)
+        if fractional_days is None:
+            raise ValueError("Invalid binary data: missing fractional days.")
+        check_binary_end(data, offset)
+        self._int_part = int(fractional_days)
+        if fractional_days.denominator == 1:
+            self._fractional_days = self._int_part
+            self._frac_part = 0
+            return
+        self._fractional_days = fractional_days
+        # cheaper than subtracting Fractions
+        self._frac_part = Fraction(fractional_days.numerator - self._int_part * fractional_days.denominator,
+                                   fractional_days.denominator)
+
+    # pickling stores the binary encoding, plus the __dict__ of a subclass
+    def __getstate__(self):
+        instance_dict = getattr(self, "__dict__", None)
+        return (self.to_bytes(), instance_dict) if instance_dict else self.to_bytes()
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            TimeDelta.__init__(self, state["_fractional_days"])
+            _restore_legacy_dict(self, state, ("_fractional_days", "_int_part", "_frac_part"))
+            return
+        if isinstance(state, tuple):
+            state, instance_dict = state
+            self.__dict__.update(instance_dict)
+        self._load_bytes(state)
+
     @classmethod
     def register_new_time_interval(cls, attribute_name, time_interval_class):
         if not isinstance(attribute_name, str) or not attribute_name.isidentifier():
@@ -679,34 +1276,43 @@ class TimeDelta:
         if not hasattr(time_interval_class, "to_fractional_days"):
             raise TypeError("Time interval class does not have method to_fractional_days.")
 
+        # time interval objects are cached by value, instead of being stored in the TimeDelta instance
+        time_interval_cache = ValueCache()
+
         class ModifiedClass(type):
             def __call__(klass, *args, **kwargs):
                 time_interval_obj = super().__call__(*args, **kwargs)
-                date_obj = cls(time_interval_obj.to_fractional_days())
-                setattr(date_obj, attribute_name, time_interval_obj)
-                return date_obj
+                timedelta_obj = cls(time_interval_obj.to_fractional_days())
+                time_interval_cache.setdefault(timedelta_obj.fractional_days, time_interval_obj)
+                return timedelta_obj
 
-        # Create the modified calendar class
+        # Create the modified time interval class; having the same layout of
+        # the original one, instances of the latter can be converted to it
         new_class_name = f"{time_interval_class.__name__}In{cls.__name__}"
-        modified_time_interval_class = ModifiedClass(new_class_name, (time_interval_class,), {})
+        modified_time_interval_class = ModifiedClass(new_class_name, (time_interval_class,), {"__slots__": ()})
 
         class TimeIntervalAttribute:
             # This class implements a context dependent attribute
-            def __init__(self, attr_name, modif_time_interval_class):
+            def __init__(self, attr_name, modif_time_interval_class, cache):
                 self.attribute_name = attr_name
                 self.modified_time_interval_class = modif_time_interval_class
+                self.cache = cache
 
             def __get__(self, instance, owner):
                 if instance is None:
                     return self.modified_time_interval_class
                 else:
-                    assert self.attribute_name not in instance.__dict__
-                    timedelta = self.modified_time_interval_class.from_fractional_days(instance.fractional_days)
-                    time_interval_obj = getattr(timedelta, self.attribute_name)
-                    setattr(instance, self.attribute_name, time_interval_obj)
+                    fractional_days = instance.fractional_days
+                    time_interval_obj = self.cache.get(fractional_days)
+                    if time_interval_obj is None:
+                        # the unmodified class does not build a throwaway TimeDelta
+                        time_interval_obj = time_interval_class.from_fractional_days(fractional_days)
+                        time_interval_obj.__class__ = self.modified_time_interval_class
+                        # if another thread got here first, its object is returned
+                        time_interval_obj = self.cache.setdefault(fractional_days, time_interval_obj)
                     return time_interval_obj
 
-        setattr(cls, attribute_name, TimeIntervalAttribute(attribute_name, modified_time_interval_class))
+        setattr(cls, attribute_name, TimeIntervalAttribute(attribute_name, modified_time_interval_class, time_interval_cache))
 
 
 ##############################################################################
@@ -715,3 +1321,237 @@ class TimeDelta:
 TimeDelta.register_new_time_interval("western", western.WesternTimeDelta)
 
 
+##############################################################################
+#
+# DateTime
+#
+##############################################################################
+
+
+_UNIX_EPOCH_NS = (UNIX_EPOCH_DAY_COUNT - 1) * NANOSECONDS_IN_DAY
+
+
+def _utcoffset_nanoseconds(utcoffset):
+    valid_utcoffset = verify_fractional_value(utcoffset, min=-1, max=1)
+    utcoffset_ns = fraction_to_nanoseconds(valid_utcoffset)
+    if utcoffset_ns is None:
+        raise ValueError("DateTime UTC offset must be a whole number of nanoseconds.")
+    return valid_utcoffset, utcoffset_ns
+
+
+def _timedelta_nanoseconds(timedelta):
+    if not timedelta._frac_part:
+        return timedelta._int_part * NANOSECONDS_IN_DAY
+    delta_ns = fraction_to_nanoseconds(timedelta.fractional_days)
+    if delta_ns is None:
+        raise ValueError("DateTime can only be shifted by a whole number of nanoseconds.")
+    return delta_ns
+
+
+class DateTime:
+    # A single integer, the nanoseconds elapsed since the beginning of day 1
+    # in local time, holds date and time; _moment_ns is the same count in UTC
+    # for aware instances. Date and Time views are built on first access.
+    __slots__ = ("_nanoseconds", "_utcoffset", "_moment_ns", "_date", "_time")
+
+    def __init__(self, date, time):
+        if not isinstance(date, Date):
+            raise TypeError("Date argument for DateTime must be a Date instance.")
+        if not isinstance(time, Time):
+            raise TypeError("Time argument for DateTime must be a Time instance.")
+        if time._day_ns is None:
+            raise ValueError("DateTime time must be a whole number of nanoseconds.")
+        utcoffset = time.utcoffset
+        if utcoffset is None:
+            utcoffset_ns = None
+        else:
+            utcoffset, utcoffset_ns = _utcoffset_nanoseconds(utcoffset)
+        self._set((date.day_count - 1) * NANOSECONDS_IN_DAY + time._day_ns, utcoffset, utcoffset_ns)
+
+    def _set(self, nanoseconds, utcoffset, utcoffset_ns):
+        self._nanoseconds = nanoseconds
+        self._utcoffset = utcoffset
+        self._moment_ns = nanoseconds if utcoffset_ns is None else nanoseconds - utcoffset_ns
+        self._date = None
+        self._time = None
+
+    @classmethod
+    def from_nanoseconds(cls, nanoseconds, *, utcoffset=None):
+        if not isinstance(nanoseconds, int):
+            raise TypeError("Nanoseconds must be an integer.")
+        if utcoffset is None:
+            return cls._from_nanoseconds(nanoseconds, None, None)
+        return cls._from_nanoseconds(nanoseconds, *_utcoffset_nanoseconds(utcoffset))
+
+    @classmethod
+    def _from_nanoseconds(cls, nanoseconds, utcoffset, utcoffset_ns):
+        # arguments are assumed to be already verified
+        datetime_obj = cls.__new__(cls)
+        datetime_obj._set(nanoseconds, utcoffset, utcoffset_ns)
+        return datetime_obj
+
+    @classmethod
+    def now(cls, utcoffset=None):
+        if utcoffset is None:
+            day_count, day_ns, local_utcoffset = _local_clock.moment_ns()
+            return cls._from_nanoseconds((day_count - 1) * NANOSECONDS_IN_DAY + day_ns,
+                                         *_utcoffset_nanoseconds(local_utcoffset))
+        valid_utcoffset, utcoffset_ns = _utcoffset_nanoseconds(utcoffset)
+        return cls._from_nanoseconds(_local_clock.time_ns() + _UNIX_EPOCH_NS + utcoffset_ns, valid_utcoffset, utcoffset_ns)
+
+    @classmethod
+    def localnow(cls):
+        day_count, day_ns, local_utcoffset = _local_clock.moment_ns()
+        return cls._from_nanoseconds((day_count - 1) * NANOSECONDS_IN_DAY + day_ns, None, None)
+
+    @classmethod
+    def utcnow(cls):
+        return cls._from_nanoseconds(_local_clock.time_ns() + _UNIX_EPOCH_NS, None, None)
+
+    @property
+    def nanoseconds(self):
+        return self._nanoseconds
+
+    @property
+    def utcoffset(self):
+        return self._utcoffset
+
+    @property
+    def date(self):
+        if self._date is None:
+            self._date = Date(self._nanoseconds // NANOSECONDS_IN_DAY + 1)
+        return self._date
+
+    @property
+    def time(self):
+        if self._time is None:
+            self._time = Time._from_nanoseconds(self._nanoseconds % NANOSECONDS_IN_DAY, self._utcoffset)
+        return self._time
+
+    def __repr__(self):
+        return f"datetime2.{type(self).__name__}({self.date!r}, {self.time!r})"
+
+    def __str__(self):
+        return f"{self.date!s}, {self.time!s}"
+
+    # Math operators
+    def _shifted(self, delta_ns):
+        utcoffset_ns = None if self._utcoffset is None else self._nanoseconds - self._moment_ns
+        return self._from_nanoseconds(self._nanoseconds + delta_ns, self._utcoffset, utcoffset_ns)
+
+    def __add__(self, other):
+        if isinstance(other, TimeDelta):
+            return self._shifted(_timedelta_nanoseconds(other))
+        else:
+            return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DateTime):
+            if (self._utcoffset is None) != (other._utcoffset is None):
+                raise ValueError("You cannot mix naive and aware instances.")
+            return TimeDelta._from_nanoseconds(self._moment_ns - other._moment_ns)
+        elif isinstance(other, TimeDelta):
+            return self._shifted(-_timedelta_nanoseconds(other))
+        else:
+            return NotImplemented
+
+    # Comparison operators
+    def _ordering_operands(self, other):
+        if (self._utcoffset is None) != (other._utcoffset is None):
+            raise TypeError("You cannot compare a naive DateTime instance with an aware one.")
+        return self._moment_ns, other._moment_ns
+
+    def __eq__(self, other):
+        if isinstance(other, DateTime):
+            return (self._utcoffset is None) == (other._utcoffset is None) and self._moment_ns == other._moment_ns
+        else:
+            return False
+
+    def __ne__(self, other):
+        if isinstance(other, DateTime):
+            return (self._utcoffset is None) != (other._utcoffset is None) or self._moment_ns != other._moment_ns
+        else:
+            return True
+
+    def __gt__(self, other):
+        if isinstance(other, DateTime):
+            self_value, other_value = self._ordering_operands(other)
+            return self_value > other_value
+        else:
+            raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
+
+    def __ge__(self, other):
+        if isinstance(other, DateTime):
+            self_value, other_value = self._ordering_operands(other)
+            return self_value >= other_value
+        else:
+            raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
+
+    def __lt__(self, other):
+        if isinstance(other, DateTime):
+            self_value, other_value = self._ordering_operands(other)
+            return self_value < other_value
+        else:
+            raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
+
+    def __le__(self, other):
+        if isinstance(other, DateTime):
+            self_value, other_value = self._ordering_operands(other)
+            return self_value <= other_value
+        else:
+            raise TypeError(f"You cannot compare '{type(self)!s}' with '{type(other)!s}'.")
+
+    # hash value
+    def __hash__(self):
+        if self._utcoffset is None:
+            return hash((self._moment_ns, None))
+        else:
+            return hash(self._moment_ns)
+
+    # binary encoding: header byte, byte with the kind of encoding of the
+    # UTC offset, then local nanoseconds and UTC offset in nanoseconds
+    def to_bytes(self):
+        buffer = bytearray((_DATETIME_BINARY_HEADER, FRACTION_NONE))
+        append_integer(buffer, self._nanoseconds)
+        if self._utcoffset is not None:
+            buffer[1] = FRACTION_NANOSECONDS
+            append_integer(buffer, self._nanoseconds - self._moment_ns)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        datetime_obj = cls.__new__(cls)
+        datetime_obj._load_bytes(data)
+        return datetime_obj
+
+    def _load_bytes(self, data):
+        data = check_binary_header(data, _DATETIME_BINARY_HEADER)
+        if len(data) < 2:
+            raise ValueError("Truncated binary data.")
+        utcoffset_kind = data[1]
+        if utcoffset_kind not in (FRACTION_NANOSECONDS, FRACTION_NONE):
+            raise ValueError("Invalid binary data: unknown UTC offset encoding.")
+        nanoseconds, offset = read_integer(data, 2)
+        if utcoffset_kind == FRACTION_NONE:
+            check_binary_end(data, offset)
+            self._set(nanoseconds, None, None)
+        else:
+            utcoffset_ns, offset = read_integer(data, offset)
+            check_binary_end(data, offset)
+            if utcoffset_ns < -NANOSECONDS_IN_DAY or utcoffset_ns > NANOSECONDS_IN_DAY:
+                raise ValueError("UTC offset must be between -1 and 1.")
+            self._set(nanoseconds, Fraction(utcoffset_ns, NANOSECONDS_IN_DAY), utcoffset_ns)
+
+    # pickling stores the binary encoding, plus the __dict__ of a subclass
+    def __getstate__(self):
+        instance_dict = getattr(self, "__dict__", None)
+        return (self.to_bytes(), instance_dict) if instance_dict else self.to_bytes()
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            state, instance_dict = state
+            self.__dict__.update(instance_dict)
+        self._load_bytes(state)
+
@@ -0,0 +1,688 @@
+# Columnar containers for datetime2 base classes
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+__all__ = [
+    "DATE_DTYPE",
+    "DATE_RECORD_FORMAT",
+    "NAIVE_UTCOFFSET",
+    "TIME_DTYPE",
+    "TIME_RECORD_FORMAT",
+    "TIMEDELTA_DTYPE",
+    "TIMEDELTA_RECORD_FORMAT",
+    "DateArray",
+    "TimeArray",
+    "TimeDeltaArray",
+    "parse_date_chunks",
+    "parse_dates",
+    "parse_time_chunks",
+    "parse_times",
+]
+
+
+from fractions import Fraction
+
+import numpy as np
+
+from datetime2 import Date, Time, TimeDelta
+from datetime2.common import (
+    NANOSECONDS_IN_DAY,
+    UNIX_EPOCH_DAY_COUNT,
+    fraction_to_rounded_nanoseconds,
+    verify_integer_array,
+    verify_rounding,
+)
+from datetime2.western import GregorianCalendar
+
+
+def _integral_days(timedelta):
+    if timedelta._frac_part:
+        raise ValueError("DateArray can only be shifted by an integral TimeDelta.")
+    return timedelta._int_part
+
+
+##############################################################################
+# Record layouts, shared with other systems: little-endian 64 bit integers,
+# the day count for dates; nanoseconds since midnight and UTC offset in
+# nanoseconds for times, where NAIVE_UTCOFFSET marks naive times
+#
+DATE_RECORD_FORMAT = "<q"
+TIME_RECORD_FORMAT = "<qq"
+TIMEDELTA_RECORD_FORMAT = "<q"
+DATE_DTYPE = np.dtype("<i8")
+TIME_DTYPE = np.dtype([("nanoseconds", "<i8"), ("utcoffset", "<i8")])
+TIMEDELTA_DTYPE = np.dtype("<i8")
+NAIVE_UTCOFFSET = -(2**63)
+
+
+def _records_from_buffer(buffer, dtype, offset, count):
+    # the returned array shares memory with buffer, and is writable if buffer is
+    try:
+        byte_view = memoryview(buffer).cast("B")
+    except TypeError as exc:
+        raise TypeError("Buffer must be a bytes-like object, e.g. a memoryview or an mmap.") from exc
+    return np.frombuffer(byte_view, dtype=dtype, count=count, offset=offset)
+
+
+def _read_only(array):
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+##############################################################################
+# Conversions with NumPy datetime64 and timedelta64 arrays: values are
+# rescaled with integer arithmetic, and values that do not fit the target
+# unit are rounded as requested with one of ROUNDING_MODES, or refused
+#
+_NANOSECONDS_IN_UNIT = {
+    "W": 7 * NANOSECONDS_IN_DAY,
+    "D": NANOSECONDS_IN_DAY,
+    "h": 3_600_000_000_000,
+    "m": 60_000_000_000,
+    "s": 1_000_000_000,
+    "ms": 1_000_000,
+    "us": 1_000,
+    "ns": 1,
+    "ps": Fraction(1, 1_000),
+    "fs": Fraction(1, 1_000_000),
+    "as": Fraction(1, 1_000_000_000),
+}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def _numpy_values(values, kind, allow_nat=False):
+    array = np.asarray(values)
+    if array.dtype.kind != kind:
+        raise TypeError(f"NumPy {'datetime64' if kind == 'M' else 'timedelta64'} values expected.")
+    if array.size == 0:
+        return array.reshape(0)
+    if array.ndim != 1:
+        raise ValueError("Values must be given as a one-dimensional sequence.")
+    if not allow_nat and np.isnat(array).any():
+        raise ValueError("NaT values cannot be converted.")
+    return array
+
+
+def _unit_ratio(dtype, target_nanoseconds):
+    # the Fraction that converts values of dtype to the target unit
+    unit, count = np.datetime_data(dtype)
+    if unit not in _NANOSECONDS_IN_UNIT:
+        raise TypeError(f"NumPy values with unit '{unit}' cannot be converted.")
+    return Fraction(_NANOSECONDS_IN_UNIT[unit] * count) / target_nanoseconds
+
+
+def _rescale(values, ratio, rounding):
+    # return a new int64 array with values * ratio, rounded
+    values = values.view(np.int64).astype(np.int64)
+    if ratio.numerator != 1:
+        limit = _INT64_MAX // ratio.numerator
+        if len(values) and (values.min() < -limit or values.max() > limit):
+            raise ValueError("Values are too large to be converted.")
+        values *= ratio.numerator
+    if ratio.denominator == 1:
+        return values
+    quotients, remainders = np.divmod(values, ratio.denominator)
+    if rounding is None:
+        if remainders.any():
+            raise ValueError("Values do not fit the target unit; use the rounding argument to round them.")
+    elif rounding == "ceiling":
+        quotients += remainders != 0
+    elif rounding == "half_even":
+        twice_remainders = remainders * 2
+        quotients += (twice_remainders > ratio.denominator) | ((twice_remainders == ratio.denominator) & (quotients % 2 == 1))
+    return quotients
+
+
+def _day_nanoseconds(values, rounding):
+    # nanoseconds since midnight of timedelta64 values
+    ratio = _unit_ratio(values.dtype, 1)
+    nanoseconds = _rescale(values, ratio, None if rounding is None else "floor")
+    if ((nanoseconds < 0) | (nanoseconds >= NANOSECONDS_IN_DAY)).any():
+        raise ValueError("Times must be equal or greater than 0 and less than a day.")
+    if rounding is not None and ratio.denominator != 1:
+        # times rounded up to a whole day wrap to midnight
+        nanoseconds = _rescale(values, ratio, rounding) % NANOSECONDS_IN_DAY
+    return nanoseconds
+
+
+##############################################################################
+# Date array
+#
+class DateArray:
+    def __init__(self, day_counts):
+        self._day_counts = verify_integer_array(day_counts).copy()
+
+    @classmethod
+    def from_dates(cls, dates):
+        try:
+            day_counts = [date.day_count for date in dates]
+        except AttributeError as exc:
+            raise TypeError("DateArray can only be built from Date instances.") from exc
+        return cls(day_counts)
+
+    @classmethod
+    def _from_buffer(cls, day_counts):
+        # day_counts is an int64 ndarray which is adopted without copying
+        date_array = cls.__new__(cls)
+        date_array._day_counts = day_counts
+        return date_array
+
+    @classmethod
+    def from_buffer(cls, buffer, *, offset=0, count=-1):
+        return cls._from_buffer(_records_from_buffer(buffer, DATE_DTYPE, offset, count))
+
+    def to_bytes(self):
+        return self._day_counts.astype(DATE_DTYPE, copy=False).tobytes()
+
+    @classmethod
+    def from_datetime64(cls, values, *, rounding=None):
+        values = _numpy_values(values, "M")
+        verify_rounding(rounding)
+        if np.datetime_data(values.dtype)[0] in ("Y", "M"):
+            # calendar units are converted exactly by NumPy
+            values = values.astype("datetime64[D]")
+        epoch_days = _rescale(values, _unit_ratio(values.dtype, NANOSECONDS_IN_DAY), rounding)
+        return cls._from_buffer(epoch_days + UNIX_EPOCH_DAY_COUNT)
+
+    def to_datetime64(self):
+        # the smallest int64 value is NaT in NumPy
+        if len(self._day_counts) and self._day_counts.min() <= _INT64_MIN + UNIX_EPOCH_DAY_COUNT:
+            raise ValueError("Dates are too far in the past to be converted to datetime64.")
+        return (self._day_counts - UNIX_EPOCH_DAY_COUNT).astype("datetime64[D]")
+
+    @property
+    def day_counts(self):
+        return _read_only(self._day_counts)
+
+    def __array__(self, dtype=None, copy=None):
+        # NumPy sees a DateArray as its day counts
+        if dtype is None and not copy:
+            return self.day_counts
+        return self._day_counts.astype(dtype if dtype is not None else np.int64)
+
+    def __len__(self):
+        return len(self._day_counts)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Date(int(self._day_counts[index]))
+        return self._from_buffer(self._day_counts[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Date):
+            self._day_counts[index] = value.day_count
+        elif isinstance(value, DateArray):
+            self._day_counts[index] = value._day_counts
+        else:
+            raise TypeError("Only Date or DateArray values can be assigned to a DateArray.")
+
+    def __iter__(self):
+        for day_count in self._day_counts.tolist():
+            yield Date(day_count)
+
+    def __repr__(self):
+        return f"datetime2.arrays.{type(self).__name__}({self._day_counts.tolist()!r})"
+
+    # Math operators
+    def __add__(self, other):
+        if isinstance(other, TimeDelta):
+            return self._from_buffer(self._day_counts + _integral_days(other))
+        else:
+            return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, TimeDelta):
+            return self._from_buffer(self._day_counts - _integral_days(other))
+        elif isinstance(other, DateArray):
+            return self._day_counts - other._day_counts
+        elif isinstance(other, Date):
+            return self._day_counts - other.day_count
+        else:
+            return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, Date):
+            return other.day_count - self._day_counts
+        else:
+            return NotImplemented
+
+    # Comparison operators
+    def _other_day_counts(self, other):
+        if isinstance(other, DateArray):
+            return other._day_counts
+        elif isinstance(other, Date):
+            return other.day_count
+        else:
+            return None
+
+    def __eq__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts == other_day_counts
+
+    def __ne__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts != other_day_counts
+
+    def __gt__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts > other_day_counts
+
+    def __ge__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts >= other_day_counts
+
+    def __lt__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts < other_day_counts
+
+    def __le__(self, other):
+        other_day_counts = self._other_day_counts(other)
+        if other_day_counts is None:
+            return NotImplemented
+        return self._day_counts <= other_day_counts
+
+    # a DateArray is mutable and comparisons return arrays, so it cannot be hashed
+    __hash__ = None
+
+    # Sorting
+    def sort(self):
+        self._day_counts.sort(kind="stable")
+
+    def argsort(self):
+        return self._day_counts.argsort(kind="stable")
+
+    def sorted(self):
+        return self._from_buffer(np.sort(self._day_counts, kind="stable"))
+
+
+##############################################################################
+# Time array
+#
+def _time_from_record(nanoseconds, utcoffset):
+    # values are verified here, since records may come from other systems
+    if utcoffset == NAIVE_UTCOFFSET:
+        return Time.from_nanoseconds(nanoseconds)
+    return Time.from_nanoseconds(nanoseconds, utcoffset=Fraction(utcoffset, NANOSECONDS_IN_DAY))
+
+
+class TimeArray:
+    def __init__(self, nanoseconds, utcoffsets=None):
+        nanoseconds = verify_integer_array(nanoseconds)
+        if ((nanoseconds < 0) | (nanoseconds >= NANOSECONDS_IN_DAY)).any():
+            raise ValueError(f"Nanoseconds must be equal or greater than 0 and less than {NANOSECONDS_IN_DAY}.")
+        records = np.empty(len(nanoseconds), dtype=TIME_DTYPE)
+        records["nanoseconds"] = nanoseconds
+        if utcoffsets is None:
+            records["utcoffset"] = NAIVE_UTCOFFSET
+        else:
+            utcoffsets = verify_integer_array(utcoffsets)
+            if len(utcoffsets) != len(nanoseconds):
+                raise ValueError("Nanoseconds and UTC offsets must have the same length.")
+            aware = utcoffsets != NAIVE_UTCOFFSET
+            if ((utcoffsets[aware] < -NANOSECONDS_IN_DAY) | (utcoffsets[aware] > NANOSECONDS_IN_DAY)).any():
+                raise ValueError(f"UTC offsets must be between {-NANOSECONDS_IN_DAY} and {NANOSECONDS_IN_DAY} nanoseconds.")
+            records["utcoffset"] = utcoffsets
+        self._records = records
+
+    @classmethod
+    def from_times(cls, times, *, rounding=None):
+        verify_rounding(rounding)
+        nanoseconds = []
+        utcoffsets = []
+        for time_obj in times:
+            if not isinstance(time_obj, Time):
+                raise TypeError("TimeArray can only be built from Time instances.")
+            day_ns = fraction_to_rounded_nanoseconds(time_obj.day_frac, rounding)
+            if time_obj.utcoffset is None:
+                utcoffset_ns = NAIVE_UTCOFFSET
+            else:
+                utcoffset_ns = fraction_to_rounded_nanoseconds(time_obj.utcoffset, rounding)
+            if day_ns is None or utcoffset_ns is None:
+                raise ValueError("TimeArray can only hold times that are whole numbers of nanoseconds.")
+            # times rounded up to a whole day wrap to midnight
+            nanoseconds.append(day_ns % NANOSECONDS_IN_DAY)
+            utcoffsets.append(utcoffset_ns)
+        return cls(nanoseconds, utcoffsets)
+
+    @classmethod
+    def from_timedelta64(cls, times, utcoffsets=None, *, rounding=None):
+        times = _numpy_values(times, "m")
+        verify_rounding(rounding)
+        nanoseconds = _day_nanoseconds(times, rounding)
+        if utcoffsets is None:
+            return cls(nanoseconds)
+        utcoffsets = _numpy_values(utcoffsets, "m", allow_nat=True)
+        naive = np.isnat(utcoffsets)
+        utcoffset_ns = _rescale(np.where(naive, np.timedelta64(0), utcoffsets), _unit_ratio(utcoffsets.dtype, 1), rounding)
+        return cls(nanoseconds, np.where(naive, NAIVE_UTCOFFSET, utcoffset_ns))
+
+    def to_timedelta64(self):
+        # NAIVE_UTCOFFSET has the same value of NaT
+        return self._records["nanoseconds"].astype("timedelta64[ns]"), self._records["utcoffset"].astype("timedelta64[ns]")
+
+    @classmethod
+    def _from_records(cls, records):
+        # records is a TIME_DTYPE ndarray which is adopted without copying
+        time_array = cls.__new__(cls)
+        time_array._records = records
+        return time_array
+
+    @classmethod
+    def from_buffer(cls, buffer, *, offset=0, count=-1):
+        return cls._from_records(_records_from_buffer(buffer, TIME_DTYPE, offset, count))
+
+    def to_bytes(self):
+        return self._records.tobytes()
+
+    @property
+    def nanoseconds(self):
+        return _read_only(self._records["nanoseconds"])
+
+    @property
+    def utcoffsets(self):
+        return _read_only(self._records["utcoffset"])
+
+    def __array__(self, dtype=None, copy=None):
+        # NumPy sees a TimeArray as its records
+        if dtype is None and not copy:
+            return _read_only(self._records)
+        return self._records.astype(dtype if dtype is not None else TIME_DTYPE)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return _time_from_record(*self._records[index].item())
+        return self._from_records(self._records[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Time):
+            self._records[index] = self.from_times([value])._records[0]
+        elif isinstance(value, TimeArray):
+            self._records[index] = value._records
+        else:
+            raise TypeError("Only Time or TimeArray values can be assigned to a TimeArray.")
+
+    def __iter__(self):
+        for nanoseconds, utcoffset in zip(self._records["nanoseconds"].tolist(), self._records["utcoffset"].tolist()):
+            yield _time_from_record(nanoseconds, utcoffset)
+
+    def __repr__(self):
+        nanoseconds = self._records["nanoseconds"].tolist()
+        if (self._records["utcoffset"] == NAIVE_UTCOFFSET).all():
+            return f"datetime2.arrays.{type(self).__name__}({nanoseconds!r})"
+        return f"datetime2.arrays.{type(self).__name__}({nanoseconds!r}, {self._records['utcoffset'].tolist()!r})"
+
+
+##############################################################################
+# Time delta array
+#
+class TimeDeltaArray:
+    def __init__(self, nanoseconds):
+        self._nanoseconds = verify_integer_array(nanoseconds).copy()
+
+    @classmethod
+    def from_timedeltas(cls, timedeltas, *, rounding=None):
+        verify_rounding(rounding)
+        nanoseconds = []
+        for timedelta in timedeltas:
+            if not isinstance(timedelta, TimeDelta):
+                raise TypeError("TimeDeltaArray can only be built from TimeDelta instances.")
+            timedelta_ns = fraction_to_rounded_nanoseconds(timedelta.fractional_days, rounding)
+            if timedelta_ns is None:
+                raise ValueError("TimeDeltaArray can only hold time intervals that are whole numbers of nanoseconds.")
+            nanoseconds.append(timedelta_ns)
+        return cls(nanoseconds)
+
+    @classmethod
+    def _from_buffer(cls, nanoseconds):
+        # nanoseconds is an int64 ndarray which is adopted without copying
+        timedelta_array = cls.__new__(cls)
+        timedelta_array._nanoseconds = nanoseconds
+        return timedelta_array
+
+    @classmethod
+    def from_buffer(cls, buffer, *, offset=0, count=-1):
+        return cls._from_buffer(_records_from_buffer(buffer, TIMEDELTA_DTYPE, offset, count))
+
+    def to_bytes(self):
+        return self._nanoseconds.astype(TIMEDELTA_DTYPE, copy=False).tobytes()
+
+    @classmethod
+    def from_timedelta64(cls, values, *, rounding=None):
+        values = _numpy_values(values, "m")
+        verify_rounding(rounding)
+        return cls._from_buffer(_rescale(values, _unit_ratio(values.dtype, 1), rounding))
+
+    def to_timedelta64(self):
+        # the smallest int64 value is NaT in NumPy
+        if len(self._nanoseconds) and self._nanoseconds.min() == _INT64_MIN:
+            raise ValueError(f"Time delta of {_INT64_MIN} nanoseconds cannot be converted to timedelta64.")
+        return self._nanoseconds.astype("timedelta64[ns]")
+
+    @property
+    def nanoseconds(self):
+        return _read_only(self._nanoseconds)
+
+    def __array__(self, dtype=None, copy=None):
+        # NumPy sees a TimeDeltaArray as its nanoseconds
+        if dtype is None and not copy:
+            return self.nanoseconds
+        return self._nanoseconds.astype(dtype if dtype is not None else np.int64)
+
+    def __len__(self):
+        return len(self._nanoseconds)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return TimeDelta(int(self._nanoseconds[index]), NANOSECONDS_IN_DAY)
+        return self._from_buffer(self._nanoseconds[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, TimeDelta):
+            self._nanoseconds[index] = self.from_timedeltas([value])._nanoseconds[0]
+        elif isinstance(value, TimeDeltaArray):
+            self._nanoseconds[index] = value._nanoseconds
+        else:
+            raise TypeError("Only TimeDelta or TimeDeltaArray values can be assigned to a TimeDeltaArray.")
+
+    def __iter__(self):
+        for nanoseconds in self._nanoseconds.tolist():
+            yield TimeDelta(nanoseconds, NANOSECONDS_IN_DAY)
+
+    def __repr__(self):
+        return f"datetime2.arrays.{type(self).__name__}({self._nanoseconds.tolist()!r})"
+
+
+##############################################################################
+# Streaming parsers of fixed-width ISO 8601 columns
+#
+_NEWLINE = ord("\n")
+
+
+def _file_blocks(source, chunk_size):
+    # yield (offset, block) where each block is a uint8 array of whole lines
+    offset = 0
+    rest = b""
+    while True:
+        data = source.read(chunk_size)
+        if not isinstance(data, bytes):
+            raise TypeError("Source must be a binary file object or a bytes-like object.")
+        if not data:
+            if rest:
+                yield offset, np.frombuffer(rest, dtype=np.uint8)
+            return
+        data = rest + data
+        end = data.rfind(b"\n") + 1
+        if end:
+            yield offset, np.frombuffer(data, dtype=np.uint8, count=end)
+            offset += end
+        rest = data[end:]
+
+
+def _buffer_blocks(source, chunk_size):
+    # as _file_blocks, but blocks are views on the buffer of source
+    try:
+        buffer = np.frombuffer(memoryview(source).cast("B"), dtype=np.uint8)
+    except TypeError as exc:
+        raise TypeError("Source must be a binary file object or a bytes-like object.") from exc
+    offset = 0
+    while offset < len(buffer):
+        window = buffer[offset:offset + chunk_size]
+        newlines = np.flatnonzero(window == _NEWLINE)
+        if offset + chunk_size >= len(buffer):
+            end = len(buffer)
+        elif len(newlines):
+            end = offset + int(newlines[-1]) + 1
+        else:  # a line longer than chunk_size
+            newlines = np.flatnonzero(buffer[offset + chunk_size:] == _NEWLINE)
+            end = offset + chunk_size + int(newlines[0]) + 1 if len(newlines) else len(buffer)
+        yield offset, buffer[offset:end]
+        offset = end
+
+
+def _iter_fields(source, start, width, chunk_size):
+    # yield (byte offsets of lines, fields) where fields is a 2-D uint8 array
+    # with the width bytes starting at column start of each non-empty line
+    if not isinstance(start, int) or not isinstance(chunk_size, int):
+        raise TypeError("Start column and chunk size must be integers.")
+    if start < 0 or chunk_size <= 0:
+        raise ValueError("Start column must not be negative and chunk size must be positive.")
+    if hasattr(source, "read"):
+        blocks = _file_blocks(source, chunk_size)
+    else:
+        blocks = _buffer_blocks(source, chunk_size)
+    columns = np.arange(start, start + width)
+    for offset, block in blocks:
+        newlines = np.flatnonzero(block == _NEWLINE)
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(block)]))
+        non_empty = ends > starts
+        if not non_empty.any():
+            continue
+        starts = starts[non_empty]
+        ends = ends[non_empty]
+        too_short = ends - starts < start + width
+        if too_short.any():
+            raise ValueError(f"Line at byte {offset + starts[too_short.argmax()]} is too short.")
+        yield offset + starts, block[starts[:, np.newaxis] + columns]
+
+
+def _digits_value(fields, positions, line_offsets, what):
+    # return the integer written in the digits at the given positions of fields
+    digits = fields[:, positions].astype(np.int64) - ord("0")
+    not_digit = ((digits < 0) | (digits > 9)).any(axis=1)
+    if not_digit.any():
+        raise ValueError(f"Invalid {what} at byte {line_offsets[not_digit.argmax()]}.")
+    return digits @ (10 ** np.arange(len(positions) - 1, -1, -1, dtype=np.int64))
+
+
+def _check_separators(fields, separators, line_offsets, what):
+    # separators maps positions in fields to the expected character
+    for position, separator in separators.items():
+        wrong = fields[:, position] != ord(separator)
+        if wrong.any():
+            raise ValueError(f"Invalid {what} at byte {line_offsets[wrong.argmax()]}.")
+
+
+def parse_date_chunks(source, *, start=0, chunk_size=1 << 20):
+    for line_offsets, fields in _iter_fields(source, start, 10, chunk_size):
+        _check_separators(fields, {4: "-", 7: "-"}, line_offsets, "date")
+        years = _digits_value(fields, [0, 1, 2, 3], line_offsets, "date")
+        months = _digits_value(fields, [5, 6], line_offsets, "date")
+        days = _digits_value(fields, [8, 9], line_offsets, "date")
+        try:
+            day_counts = GregorianCalendar.to_rata_die_many(years, months, days)
+        except ValueError:
+            # find the first invalid date, with the error of the constructor
+            for line_offset, year, month, day in zip(line_offsets.tolist(), years.tolist(), months.tolist(),
+                                                     days.tolist()):
+                try:
+                    GregorianCalendar(year, month, day)
+                except ValueError as exc:
+                    raise ValueError(f"Invalid date at byte {line_offset}: {exc}") from None
+            raise
+        yield DateArray._from_buffer(day_counts)
+
+
+def parse_dates(source, *, start=0, chunk_size=1 << 20):
+    for date_array in parse_date_chunks(source, start=start, chunk_size=chunk_size):
+        yield from date_array
+
+
+def parse_time_chunks(source, *, start=0, fraction_digits=0, chunk_size=1 << 20):
+    if not isinstance(fraction_digits, int):
+        raise TypeError("Number of fraction digits must be an integer.")
+    if fraction_digits < 0 or fraction_digits > 9:
+        raise ValueError("Number of fraction digits must be between 0 and 9.")
+    separators = {2: ":", 5: ":"}
+    width = 8
+    if fraction_digits:
+        separators[8] = "."
+        width = 9 + fraction_digits
+    for line_offsets, fields in _iter_fields(source, start, width, chunk_size):
+        _check_separators(fields, separators, line_offsets, "time")
+        hours = _digits_value(fields, [0, 1], line_offsets, "time")
+        minutes = _digits_value(fields, [3, 4], line_offsets, "time")
+        seconds = _digits_value(fields, [6, 7], line_offsets, "time")
+        # same limits as WesternTime
+        out_of_range = (hours > 23) | (minutes > 59) | (seconds > 59)
+        if out_of_range.any():
+            raise ValueError(f"Invalid time at byte {line_offsets[out_of_range.argmax()]}.")
+        nanoseconds = ((hours * 60 + minutes) * 60 + seconds) * 1_000_000_000
+        if fraction_digits:
+            fraction = _digits_value(fields, list(range(9, width)), line_offsets, "time")
+            nanoseconds += fraction * 10 ** (9 - fraction_digits)
+        records = np.empty(len(nanoseconds), dtype=TIME_DTYPE)
+        records["nanoseconds"] = nanoseconds
+        records["utcoffset"] = NAIVE_UTCOFFSET
+        yield TimeArray._from_records(records)
+
+
+def parse_times(source, *, start=0, fraction_digits=0, chunk_size=1 << 20):
+    for time_array in parse_time_chunks(source, start=start, fraction_digits=fraction_digits, chunk_size=chunk_size):
+        for day_ns in time_array._records["nanoseconds"].tolist():
+            yield Time._from_nanoseconds(day_ns, None)
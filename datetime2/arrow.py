@@ -0,0 +1,150 @@
+# Apache Arrow conversions for datetime2 arrays
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+__all__ = ["UNIX_EPOCH_DAY_COUNT", "from_arrow", "to_arrow"]
+
+
+import numpy as np
+import pyarrow as pa
+
+from datetime2.arrays import NAIVE_UTCOFFSET, DateArray, TimeArray, TimeDeltaArray
+from datetime2.common import UNIX_EPOCH_DAY_COUNT
+
+
+# Arrow counts days from the Unix epoch, 1970-01-01, which is day
+# UNIX_EPOCH_DAY_COUNT in the rata die count of Date. Times and time deltas
+# go through Arrow as nanoseconds; a TimeArray becomes a struct with a
+# time64[ns] field and a duration[ns] UTC offset field, which is null for
+# naive times.
+_TIME_STRUCT_TYPE = pa.struct([("time", pa.time64("ns")), ("utcoffset", pa.duration("ns"))])
+_NANOSECONDS_IN_UNIT = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+_MILLISECONDS_IN_DAY = 86_400_000
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+_INT64_MAX = 2**63 - 1
+
+
+def _arrow_array(arrow_type, values, valid=None):
+    # values must be a contiguous ndarray; Arrow uses its memory without copying
+    if valid is None or valid.all():
+        validity = None
+    else:
+        validity = pa.py_buffer(np.packbits(valid, bitorder="little"))
+    return pa.Array.from_buffers(arrow_type, len(values), [validity, pa.py_buffer(values)])
+
+
+def _arrow_values(array, integer_type):
+    # the returned ndarray shares memory with the Arrow array
+    return array.view(integer_type).to_numpy()
+
+
+def _nanoseconds(array):
+    # array is a time32, time64 or duration Arrow array without nulls
+    integer_type = pa.int32() if pa.types.is_time32(array.type) else pa.int64()
+    values = _arrow_values(array, integer_type).astype(np.int64, copy=False)
+    scale = _NANOSECONDS_IN_UNIT[array.type.unit]
+    if scale == 1:
+        return values
+    if len(values) and (values.min() < -(_INT64_MAX // scale) or values.max() > _INT64_MAX // scale):
+        raise ValueError(f"Arrow {array.type} values are too large to be expressed in nanoseconds.")
+    return values * scale
+
+
+def _check_no_nulls(array):
+    if array.null_count:
+        raise ValueError(f"Arrow {array.type} array has null values, which datetime2 arrays cannot hold.")
+
+
+def to_arrow(array):
+    if isinstance(array, DateArray):
+        day_counts = array.day_counts
+        if len(day_counts) and (
+            day_counts.min() - UNIX_EPOCH_DAY_COUNT < _INT32_MIN or day_counts.max() - UNIX_EPOCH_DAY_COUNT > _INT32_MAX
+        ):
+            raise ValueError("Dates are too far from 1970-01-01 to be expressed as Arrow date32 values.")
+        epoch_days = (day_counts - UNIX_EPOCH_DAY_COUNT).astype(np.int32)
+        return _arrow_array(pa.date32(), epoch_days)
+    elif isinstance(array, TimeArray):
+        nanoseconds = np.ascontiguousarray(array.nanoseconds)
+        utcoffsets = np.ascontiguousarray(array.utcoffsets)
+        time_field = _arrow_array(pa.time64("ns"), nanoseconds)
+        utcoffset_field = _arrow_array(pa.duration("ns"), utcoffsets, utcoffsets != NAIVE_UTCOFFSET)
+        return pa.StructArray.from_arrays([time_field, utcoffset_field], fields=list(_TIME_STRUCT_TYPE))
+    elif isinstance(array, TimeDeltaArray):
+        return _arrow_array(pa.duration("ns"), np.ascontiguousarray(array.nanoseconds))
+    else:
+        raise TypeError("Only DateArray, TimeArray or TimeDeltaArray instances can be converted to Arrow.")
+
+
+def _time_array_from_struct(array):
+    _check_no_nulls(array)
+    fields = {array.type.field(index).name: field for index, field in enumerate(array.flatten())}
+    if "time" not in fields or not pa.types.is_time(fields["time"].type):
+        raise TypeError("Arrow struct array must have a time32 or time64 field named 'time'.")
+    time_field = fields["time"]
+    _check_no_nulls(time_field)
+    nanoseconds = _nanoseconds(time_field)
+    utcoffset_field = fields.get("utcoffset")
+    if utcoffset_field is None:
+        return TimeArray(nanoseconds)
+    if not pa.types.is_duration(utcoffset_field.type):
+        raise TypeError("The 'utcoffset' field of an Arrow struct array must have a duration type.")
+    naive = utcoffset_field.is_null().to_numpy(zero_copy_only=False)
+    utcoffsets = _nanoseconds(utcoffset_field.fill_null(pa.scalar(0, utcoffset_field.type)))
+    return TimeArray(nanoseconds, np.where(naive, NAIVE_UTCOFFSET, utcoffsets))
+
+
+def from_arrow(array):
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not isinstance(array, pa.Array):
+        raise TypeError("Only Arrow arrays or chunked arrays can be converted from Arrow.")
+    arrow_type = array.type
+    if pa.types.is_struct(arrow_type):
+        return _time_array_from_struct(array)
+    _check_no_nulls(array)
+    if pa.types.is_date32(arrow_type):
+        epoch_days = _arrow_values(array, pa.int32())
+        return DateArray._from_buffer(epoch_days.astype(np.int64) + UNIX_EPOCH_DAY_COUNT)
+    elif pa.types.is_date64(arrow_type):
+        epoch_days, remainders = np.divmod(_arrow_values(array, pa.int64()), _MILLISECONDS_IN_DAY)
+        if remainders.any():
+            raise ValueError("Arrow date64 values must be whole days.")
+        return DateArray._from_buffer(epoch_days + UNIX_EPOCH_DAY_COUNT)
+    elif pa.types.is_time(arrow_type):
+        return TimeArray(_nanoseconds(array))
+    elif pa.types.is_duration(arrow_type):
+        # Arrow memory is read-only, while TimeDeltaArray values can be assigned
+        return TimeDeltaArray._from_buffer(np.array(_nanoseconds(array)))
+    else:
+        raise TypeError(f"Arrow {arrow_type} arrays cannot be converted to datetime2 arrays.")
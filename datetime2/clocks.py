@@ -0,0 +1,140 @@
+# Clock sources for the current date and time
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+__all__ = ["CoarseClock", "FakeClock", "MonotonicClock", "SystemClock"]
+
+
+import threading
+import time
+
+
+# A clock source is any object with a time_ns() method, returning the
+# nanoseconds elapsed since the epoch, 1970-01-01 00:00 UTC.
+
+
+class SystemClock:
+    """Ask the operating system at each call."""
+
+    time_ns = staticmethod(time.time_ns)
+
+    def __repr__(self):
+        return "SystemClock()"
+
+
+class CoarseClock:
+    """Return a shared timestamp, refreshed by a background thread every
+    tick seconds. Reading it costs an attribute access, at the price of a
+    resolution of one tick. close() stops the thread."""
+
+    def __init__(self, tick=0.001):
+        if not isinstance(tick, (int, float)):
+            raise TypeError("Tick must be a number of seconds.")
+        if not tick > 0:
+            raise ValueError(f"Tick must be greater than 0, while it is {tick}.")
+        self.tick = tick
+        self._moment_ns = time.time_ns()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._refresh, name="datetime2-coarse-clock", daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        return f"CoarseClock(tick={self.tick})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _refresh(self):
+        stopped = self._stopped
+        while not stopped.wait(self.tick):
+            self._moment_ns = time.time_ns()
+
+    def time_ns(self):
+        return self._moment_ns
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join()
+
+
+class MonotonicClock:
+    """Derive the current time from time.monotonic_ns(), plus an offset to
+    the system clock that is computed again every resync seconds. Between
+    two resynchronizations the returned time never goes backwards, even if
+    the system clock is adjusted."""
+
+    def __init__(self, resync=1.0):
+        if not isinstance(resync, (int, float)):
+            raise TypeError("Resynchronization period must be a number of seconds.")
+        if not resync > 0:
+            raise ValueError(f"Resynchronization period must be greater than 0, while it is {resync}.")
+        self.resync = resync
+        self._resync_ns = int(resync * 1_000_000_000)
+        self._synchronize(time.monotonic_ns())
+
+    def __repr__(self):
+        return f"MonotonicClock(resync={self.resync})"
+
+    def _synchronize(self, monotonic_ns):
+        # a tuple, so that threads see the deadline and the offset together
+        self._offset_state = monotonic_ns + self._resync_ns, time.time_ns() - monotonic_ns
+        return self._offset_state
+
+    def time_ns(self):
+        monotonic_ns = time.monotonic_ns()
+        offset_state = self._offset_state
+        if monotonic_ns >= offset_state[0]:
+            offset_state = self._synchronize(monotonic_ns)
+        return monotonic_ns + offset_state[1]
+
+
+class FakeClock:
+    """Return a time set by the program, for tests."""
+
+    def __init__(self, moment_ns=0):
+        self.set(moment_ns)
+
+    def __repr__(self):
+        return f"FakeClock({self.moment_ns})"
+
+    def set(self, moment_ns):
+        if not isinstance(moment_ns, int):
+            raise TypeError("Nanoseconds must be an integer.")
+        self.moment_ns = moment_ns
+
+    def advance(self, nanoseconds):
+        self.set(self.moment_ns + nanoseconds)
+
+    def time_ns(self):
+        return self.moment_ns
@@ -28,22 +28,349 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+import collections
+import functools
+import itertools
+import math
+import operator
+import re
 from fractions import Fraction
 
 
 __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
 
+NANOSECONDS_IN_DAY = 86_400_000_000_000
+# day count of 1970-01-01, the epoch of Unix time and of Apache Arrow dates
+UNIX_EPOCH_DAY_COUNT = 719163
+
+
+class ValueCache:
+    """Bounded mapping from the value of a base class instance to one of its
+    representations. When the cache is full, the oldest entry is discarded.
+
+    The cache is safe to use from many threads without locks: each operation
+    is a single dictionary operation, which is atomic, and when two threads
+    store an object for the same value, both get the object stored first.
+    Concurrent evictions may let the cache exceed maxsize by a few entries."""
+
+    __slots__ = ("maxsize", "_entries", "get")
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = {}
+        # lookups are the hot path, so they go straight to the dictionary
+        self.get = self._entries.get
+
+    def __len__(self):
+        return len(self._entries)
+
+    def setdefault(self, key, value):
+        entries = self._entries
+        cached_value = entries.setdefault(key, value)
+        if len(entries) > self.maxsize:
+            try:
+                del entries[next(iter(entries))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass  # another thread changed the cache, it will evict later
+        return cached_value
+
+    def clear(self):
+        self._entries.clear()
+
+
+class InstancePool:
+    """Bounded mapping interning instances by value, e.g. by rata die. When
+    the pool is full, the least recently used entry is discarded. A pool with
+    maxsize 0, the default, is disabled: classes using it do not look it up.
+
+    The hits and misses counters record lookups; under concurrent use they
+    are approximate, since increments are not atomic. Every other operation
+    is a single OrderedDict operation, hence safe without locks."""
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize=0):
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self.resize(maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"InstancePool(maxsize={self.maxsize}, size={len(self._entries)}, hits={self.hits}, misses={self.misses})"
+
+    def get(self, key):
+        entries = self._entries
+        try:
+            value = entries[key]
+            entries.move_to_end(key)
+        except KeyError:  # missing, or evicted by another thread
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def setdefault(self, key, value):
+        entries = self._entries
+        pooled_value = entries.setdefault(key, value)
+        self._evict()
+        return pooled_value
+
+    def holds(self, key, value):
+        """Return True if value is the instance pooled for key."""
+        return self._entries.get(key) is value
+
+    def resize(self, maxsize):
+        if not isinstance(maxsize, int):
+            raise TypeError("integer argument expected")
+        if maxsize < 0:
+            raise ValueError(f"Pool size must be non-negative, while it is {maxsize}.")
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self):
+        entries = self._entries
+        while len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                break  # another thread emptied the pool
+
+
+def split_format(format_string, format_functions):
+    """Split format_string into a list of literal strings and of indices in
+    the returned list of format functions. Directives not among the
+    format_functions are left verbatim and "%%" produces a single "%"."""
+    pieces = []
+    for format_chunk in format_string.split("%%"):
+        format_parts = format_chunk.split("%")
+        pieces.append(format_parts[0])
+        for part in format_parts[1:]:
+            if part == "":  # special case: last char is '%'
+                pieces.append("%")
+            else:
+                pieces.append(format_functions.get(part[0], "%" + part[0]))
+                pieces.append(part[1:])
+        pieces.append("%")
+    del pieces[-1]
+    functions = []
+    split_pieces = []
+    for piece in pieces:
+        if isinstance(piece, str):
+            if split_pieces and isinstance(split_pieces[-1], str):
+                split_pieces[-1] += piece
+            elif piece:
+                split_pieces.append(piece)
+        else:
+            if piece not in functions:
+                functions.append(piece)
+            split_pieces.append(functions.index(piece))
+    return split_pieces, functions
+
+
+class _AnyDirective:
+    # directive table for split_format that accepts every letter, wrapped in a
+    # tuple to tell it from literal text; functions are looked up at run time
+    @staticmethod
+    def get(letter, default):
+        return letter,
+
+
+def _split_directives(format_string):
+    # return the literal chunks of format_string, with None in place of each
+    # directive, and the pairs of position and letter of the directives
+    pieces, directives = split_format(format_string, _AnyDirective)
+    chunks = [piece if isinstance(piece, str) else None for piece in pieces]
+    slots = [(position, directives[piece][0]) for position, piece in enumerate(pieces) if not isinstance(piece, str)]
+    return chunks, slots
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_format(cls, format_string):
+    """Compile format_string into a function that formats an instance of cls.
+    The format string is split once into literal chunks and directives; the
+    directive functions are looked up in the format_functions of cls at each
+    call, so changes to that table are seen by compiled formats."""
+    chunks, slots = _split_directives(format_string)
+
+    def format_obj(obj):
+        format_functions = cls.format_functions
+        formatted = chunks.copy()
+        for position, letter in slots:
+            format_function = format_functions.get(letter)
+            formatted[position] = "%" + letter if format_function is None else format_function(obj)
+        return "".join(formatted)
+
+    return format_obj
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_format_many(cls, format_string):
+    """Compile format_string into a function that formats many values at once
+    with the format_many_functions of cls, looked up at each call. Each of
+    these functions receives the components of the values and returns the
+    list of their formatted strings; the compiled function returns the list
+    of formatted values."""
+    chunks, slots = _split_directives(format_string)
+
+    def format_many(components):
+        format_many_functions = cls.format_many_functions
+        columns = {}
+        formatted = chunks.copy()
+        for position, letter in slots:
+            format_many_function = format_many_functions.get(letter)
+            if format_many_function is None:
+                formatted[position] = "%" + letter
+            else:
+                if letter not in columns:
+                    columns[letter] = format_many_function(components)
+                formatted[position] = columns[letter]
+        if not columns:
+            return ["".join(formatted)] * len(components)
+        # literal text is repeated on each row, between the formatted columns
+        row_columns = [itertools.repeat(piece) if isinstance(piece, str) else piece for piece in formatted]
+        return ["".join(row) for row in zip(*row_columns)]
+
+    return format_many
+
+
+_UNPARSABLE = ("", None, None)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_parse(cls, format_string):
+    """Compile format_string into a function that parses a string formatted
+    with cformat and returns a dictionary of the parsed fields. The
+    parse_directives of cls map each directive to a regular expression
+    without capturing groups, the name of the field and the function that
+    converts the matched text. A field parsed more than once must have the
+    same value each time.
+
+    Raised exceptions:
+    - ValueError: (at compile time) if a directive of cformat cannot be parsed.
+    - ValueError: (by the returned function) if the string does not match."""
+    parse_directives = {directive: cls.parse_directives.get(directive, _UNPARSABLE)
+                        for directive in cls.format_functions}
+    pieces, directives = split_format(format_string, parse_directives)
+    if _UNPARSABLE in directives:
+        raise ValueError(f"Format {format_string!r} contains directives that cannot be parsed.")
+    fields = [directives[piece][1:] for piece in pieces if not isinstance(piece, str)]
+    regex = re.compile("".join(re.escape(piece) if isinstance(piece, str) else f"({directives[piece][0]})"
+                               for piece in pieces))
+
+    def parse(string):
+        match = regex.fullmatch(string)
+        if match is None:
+            raise ValueError(f"String {string!r} does not match format {format_string!r}.")
+        parsed_fields = {}
+        for (field, converter), text in zip(fields, match.groups()):
+            value = converter(text)
+            if parsed_fields.setdefault(field, value) != value:
+                raise ValueError(f"String {string!r} has inconsistent values for {field}.")
+        return parsed_fields
+
+    return parse
+
+
+def format_integers_many(values, format_function):
+    """Return the list of format_function(value) for each value in an integer
+    NumPy array. Each distinct value is formatted only once, and all its
+    occurrences share the same string."""
+    import numpy as np
+
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    formatted = np.empty(len(unique_values), dtype=object)
+    formatted[:] = [format_function(value) for value in unique_values.tolist()]
+    return formatted[inverse].tolist()
+
+
+def range_validator(min=None, max=None, min_excl=None, max_excl=None):
+    """Return a function that returns its argument if it observes the given
+    condition(s). Validators are built once per combination of conditions;
+    bounds are converted to Fraction first, so that equal bounds, e.g. 1,
+    Fraction(1) and True, share the same validator and error messages.
+
+    Raised exceptions:
+    - RuntimeError: if both min and min_excl, or max and max_excl are provided.
+    - ValueError: (by the returned function) if value does not observe condition(s)."""
+    return _range_validator(*(None if bound is None else Fraction(bound) for bound in (min, max, min_excl, max_excl)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _range_validator(min, max, min_excl, max_excl):
+    if min is not None and min_excl is not None:
+        raise RuntimeError("Only one minimum value can be given.")
+    if max is not None and max_excl is not None:
+        raise RuntimeError("Only one maximum value can be given.")
+    # bounds are compared by cross multiplication of numerators and
+    # denominators, which works with integers and fractions alike
+    if min is not None:
+        lower, lower_fails, lower_message = min, operator.lt, f"Value must be more than or equal to {min}"
+    elif min_excl is not None:
+        lower, lower_fails, lower_message = min_excl, operator.le, f"Value must be more than {min_excl}"
+    else:
+        lower = None
+    if max is not None:
+        upper, upper_fails, upper_message = max, operator.gt, f"Value must be less than or equal to {max}"
+    elif max_excl is not None:
+        upper, upper_fails, upper_message = max_excl, operator.ge, f"Value must be less than {max_excl}"
+    else:
+        upper = None
+
+    if lower is None and upper is None:
+        def validator(value):
+            return value
+    elif upper is None:
+        lower_num, lower_den = lower.numerator, lower.denominator
+
+        def validator(value):
+            if lower_fails(value.numerator * lower_den, lower_num * value.denominator):
+                raise ValueError(lower_message)
+            return value
+    elif lower is None:
+        upper_num, upper_den = upper.numerator, upper.denominator
+
+        def validator(value):
+            if upper_fails(value.numerator * upper_den, upper_num * value.denominator):
+                raise ValueError(upper_message)
+            return value
+    else:
+        lower_num, lower_den = lower.numerator, lower.denominator
+        upper_num, upper_den = upper.numerator, upper.denominator
+
+        def validator(value):
+            numerator, denominator = value.numerator, value.denominator
+            if lower_fails(numerator * lower_den, lower_num * denominator):
+                raise ValueError(lower_message)
+            if upper_fails(numerator * upper_den, upper_num * denominator):
+                raise ValueError(upper_message)
+            return value
+    return validator
+
+
 def verify_value(num, den, min, max, min_excl, max_excl, strict):
     """Raised exceptions:
     - RuntimeError: if both min and min_excl, or max and max_excl are provided.
     - TypeError: if tuple argument for fraction is invalid or has wrong values
                  (0 denominator, NaN or similar)
     - ValueError: if fractional value does not observe condition(s)."""
-    if min is not None and min_excl is not None:
-        raise RuntimeError("Only one minimum value can be given.")
-    if max is not None and max_excl is not None:
-        raise RuntimeError("Only one maximum value can be given.")
+    validator = range_validator(min, max, min_excl, max_excl)
+    if den is None:
+        # Fraction instances are immutable, so they need not be copied
+        value_type = type(num)
+        if value_type is Fraction:
+            return validator(num)
+        elif value_type is int and not strict:
+            return Fraction(validator(num))
     if strict:
         if den is None:
             if not isinstance(num, Fraction):
@@ -60,15 +387,7 @@ def verify_value(num, den, min, max, min_excl, max_excl, strict):
         raise TypeError("Invalid type in a fractional value.") from exc
     except (OverflowError, ValueError) as exc:
         raise TypeError("Invalid fractional value.") from exc
-    if min is not None and value < min:
-        raise ValueError(f"Value must be more than or equal to {min}")
-    if min_excl is not None and value <= min_excl:
-        raise ValueError(f"Value must be more than {min_excl}")
-    if max is not None and value > max:
-        raise ValueError(f"Value must be less than or equal to {max}")
-    if max_excl is not None and value >= max_excl:
-        raise ValueError(f"Value must be less than {max}")
-    return value
+    return validator(value)
 
 
 def verify_fractional_value(fractional, min=None, max=None, min_excl=None, max_excl=None, strict=False):
@@ -77,3 +396,153 @@ def verify_fractional_value(fractional, min=None, max=None, min_excl=None, max_e
 
 def verify_fractional_value_num_den(numerator, denominator, min=None, max=None, min_excl=None, max_excl=None, strict=False):
     return verify_value(numerator, denominator, min, max, min_excl, max_excl, strict)
+
+
+def fraction_to_nanoseconds(value):
+    """Return the Fraction value, in days, as an integer number of nanoseconds,
+    or None if the value is not an exact multiple of a nanosecond."""
+    if NANOSECONDS_IN_DAY % value.denominator:
+        return None
+    return value.numerator * (NANOSECONDS_IN_DAY // value.denominator)
+
+
+# Rounding of values that are not exact multiples of a nanosecond: None means
+# that such values are an error; "half_even" rounds to the nearest value,
+# ties to the even one
+ROUNDING_MODES = ("floor", "ceiling", "half_even")
+
+
+def verify_rounding(rounding):
+    """Return rounding, if it is None or one of ROUNDING_MODES.
+
+    Raised exceptions:
+    - ValueError: for other values."""
+    if rounding is not None and rounding not in ROUNDING_MODES:
+        raise ValueError(f"Rounding must be None or one of: {', '.join(ROUNDING_MODES)}.")
+    return rounding
+
+
+def fraction_to_rounded_nanoseconds(value, rounding):
+    """Return the Fraction value, in days, as an integer number of nanoseconds
+    rounded according to rounding, or None if rounding is None and the value
+    is not an exact multiple of a nanosecond."""
+    nanoseconds = fraction_to_nanoseconds(value)
+    if nanoseconds is not None or rounding is None:
+        return nanoseconds
+    scaled = value * NANOSECONDS_IN_DAY
+    if rounding == "floor":
+        return math.floor(scaled)
+    elif rounding == "ceiling":
+        return math.ceil(scaled)
+    else:
+        return round(scaled)
+
+
+##############################################################################
+# Binary encoding
+#
+# An integer is stored as a length byte followed by its two's complement
+# little-endian bytes, so that both conversions are done by int methods;
+# lengths of 255 bytes or more are stored as 255 and four more bytes. A
+# Fraction is stored as an integer when possible, else as a number of
+# nanoseconds when it is a multiple of a nanosecond of a day, else as
+# numerator and denominator.
+FRACTION_INTEGER = 0
+FRACTION_NANOSECONDS = 1
+FRACTION_RATIONAL = 2
+FRACTION_NONE = 3
+
+
+def append_integer(buffer, value):
+    length = (value.bit_length() + 8) >> 3  # room for the sign bit
+    if length < 255:
+        buffer.append(length)
+    else:
+        buffer.append(255)
+        buffer += length.to_bytes(4, "little")
+    buffer += value.to_bytes(length, "little", signed=True)
+
+
+def read_integer(data, offset):
+    """Return the integer at offset in data and the offset that follows it."""
+    try:
+        length = data[offset]
+        offset += 1
+        if length == 255:
+            length = int.from_bytes(data[offset:offset + 4], "little")
+            offset += 4
+    except IndexError:
+        raise ValueError("Truncated binary data.") from None
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated binary data.")
+    return int.from_bytes(data[offset:end], "little", signed=True), end
+
+
+def append_fraction(buffer, value):
+    """Append the Fraction value, or None, to buffer and return the kind of
+    encoding used, one of the FRACTION_* constants."""
+    if value is None:
+        return FRACTION_NONE
+    if value.denominator == 1:
+        append_integer(buffer, value.numerator)
+        return FRACTION_INTEGER
+    nanoseconds = fraction_to_nanoseconds(value)
+    if nanoseconds is not None:
+        append_integer(buffer, nanoseconds)
+        return FRACTION_NANOSECONDS
+    append_integer(buffer, value.numerator)
+    append_integer(buffer, value.denominator)
+    return FRACTION_RATIONAL
+
+
+def read_fraction(kind, data, offset):
+    """Return the Fraction, or None, encoded with kind at offset in data and
+    the offset that follows it."""
+    if kind == FRACTION_NONE:
+        return None, offset
+    numerator, offset = read_integer(data, offset)
+    if kind == FRACTION_INTEGER:
+        return Fraction(numerator), offset
+    if kind == FRACTION_NANOSECONDS:
+        return Fraction(numerator, NANOSECONDS_IN_DAY), offset
+    if kind == FRACTION_RATIONAL:
+        denominator, offset = read_integer(data, offset)
+        if denominator <= 0:
+            raise ValueError("Invalid binary data: non positive denominator.")
+        return Fraction(numerator, denominator), offset
+    raise ValueError(f"Invalid binary data: unknown fraction encoding {kind}.")
+
+
+def check_binary_header(data, header):
+    """Return data as bytes, after checking that it starts with the header
+    byte of the expected class and format version."""
+    if not isinstance(data, bytes):
+        data = memoryview(data).tobytes()  # TypeError if not a bytes-like object
+    if len(data) == 0 or data[0] != header:
+        raise ValueError("Binary data has not been produced by to_bytes of this class or format version.")
+    return data
+
+
+def check_binary_end(data, offset):
+    if offset != len(data):
+        raise ValueError("Invalid binary data: unexpected trailing bytes.")
+
+
+def verify_integer_array(values):
+    """Return values as a one-dimensional NumPy int64 array. NumPy is imported
+    here, so that it is required only by the functions that work on arrays.
+
+    Raised exceptions:
+    - TypeError: if values are not integers.
+    - ValueError: if values are not one-dimensional."""
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.size == 0:
+        return array.astype(np.int64).reshape(0)
+    if array.ndim != 1:
+        raise ValueError("Values must be given as a one-dimensional sequence.")
+    if array.dtype.kind not in "iu":
+        raise TypeError("Integer values expected.")
+    return array.astype(np.int64, copy=False)
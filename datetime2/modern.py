@@ -38,6 +38,7 @@ from fractions import Fraction
 from math import floor
 
 from datetime2 import verify_fractional_value
+from datetime2.common import InstancePool, compile_format, verify_integer_array
 
 _long_years = frozenset(
     [
@@ -129,6 +130,9 @@ for year_index in range(1, 400):
 # Iso calendar
 #
 class IsoCalendar:
+    # opt-in interning of the instances returned by from_rata_die
+    pool = InstancePool()
+
     def __init__(self, year, week, day):
         if not isinstance(year, int) or not isinstance(week, int) or not isinstance(day, int):
             raise TypeError("integer argument expected")
@@ -157,15 +161,37 @@ class IsoCalendar:
     def from_rata_die(cls, day_count):
         if not isinstance(day_count, int):
             raise TypeError("integer argument expected")
+        pool = IsoCalendar.pool
+        if pool.maxsize and cls is IsoCalendar:
+            iso = pool.get(day_count)
+            if iso is None:
+                iso = pool.setdefault(day_count, cls._derive_from_rata_die(day_count))
+            return iso
+        return cls._derive_from_rata_die(day_count)
+
+    @classmethod
+    def _derive_from_rata_die(cls, day_count):
         week_no_less_1, day_less_1 = divmod(day_count - 1, 7)  # ranges: week_no_less_1: free, day_less_1: 0..6
         four_hundred_years, no_of_weeks_in_400 = divmod(week_no_less_1, 20871)  # ranges: four_hundred_years: free, no_of_weeks_in_400: 0..20870
         year_in_400 = bisect.bisect_right(_weeks_in_previous_years, no_of_weeks_in_400)  # range: year_in_400: 1..400
         year = year_in_400 + four_hundred_years * 400
         week = no_of_weeks_in_400 - _weeks_in_previous_years[year_in_400 - 1] + 1
         day = day_less_1 + 1
-        iso_day = cls(year, week, day)
-        iso_day._rata_die = day_count
-        return iso_day
+        return cls(year, week, day)
+
+    @classmethod
+    def from_rata_die_many(cls, day_counts):
+        import numpy as np
+
+        day_counts = verify_integer_array(day_counts)
+        week_no_less_1, day_less_1 = np.divmod(day_counts - 1, 7)
+        four_hundred_years, no_of_weeks_in_400 = np.divmod(week_no_less_1, 20871)
+        weeks_in_previous_years = np.asarray(_weeks_in_previous_years, dtype=np.int64)
+        year_in_400 = np.searchsorted(weeks_in_previous_years, no_of_weeks_in_400, side="right")
+        years = year_in_400 + four_hundred_years * 400
+        weeks = no_of_weeks_in_400 - weeks_in_previous_years[year_in_400 - 1] + 1
+        days = day_less_1 + 1
+        return years, weeks, days
 
     @staticmethod
     def is_long_year(year):
@@ -181,6 +207,24 @@ class IsoCalendar:
             self._rata_die = (y400 * 146097 + 7 * (_weeks_in_previous_years[year_in_400] + self.week - 1) + self.day)
         return self._rata_die
 
+    @classmethod
+    def to_rata_die_many(cls, years, weeks, days):
+        import numpy as np
+
+        years = verify_integer_array(years)
+        weeks = verify_integer_array(weeks)
+        days = verify_integer_array(days)
+        if not len(years) == len(weeks) == len(days):
+            raise ValueError("Years, weeks and days must have the same length.")
+        y400, year_in_400 = np.divmod(years - 1, 400)
+        weeks_in_years = np.where(np.isin((year_in_400 + 1) % 400, list(_long_years)), 53, 52)
+        if np.any((weeks < 1) | (weeks > weeks_in_years)):
+            raise ValueError("Weeks must be between 1 and number of weeks in year.")
+        if np.any((days < 1) | (days > 7)):
+            raise ValueError("Days must be between 1 and 7.")
+        weeks_in_previous_years = np.asarray(_weeks_in_previous_years, dtype=np.int64)
+        return y400 * 146097 + 7 * (weeks_in_previous_years[year_in_400] + weeks - 1) + days
+
     def day_of_year(self):
         return 7 * (self.week - 1) + self.day
 
@@ -225,22 +269,7 @@ class IsoCalendar:
     def cformat(self, format_string):
         if not isinstance(format_string, str):
             raise TypeError("Format must be specified with string.")
-        output_pieces = []
-        for format_chunk in format_string.split("%%"):
-            format_parts = format_chunk.split("%")
-            chunk_pieces = [format_parts[0]]
-            for part in format_parts[1:]:
-                if part == "":  # special case: last char is '%'
-                    value = "%"
-                else:
-                    try:
-                        value = self.format_functions[part[0]](self)
-                    except KeyError:
-                        value = "%" + part[0]
-                chunk_pieces.append(value)
-                chunk_pieces.append(part[1:])
-            output_pieces.append("".join(chunk_pieces))
-        return "%".join(output_pieces)
+        return compile_format(type(self), format_string)(self)
 
 
 ##############################################################################
@@ -288,19 +317,4 @@ class InternetTime:
     def cformat(self, format_string):
         if not isinstance(format_string, str):
             raise TypeError("Format must be specified with string.")
-        output_pieces = []
-        for format_chunk in format_string.split("%%"):
-            format_parts = format_chunk.split("%")
-            chunk_pieces = [format_parts[0]]
-            for part in format_parts[1:]:
-                if part == "":  # special case: last char is '%'
-                    value = "%"
-                else:
-                    try:
-                        value = self.format_functions[part[0]](self)
-                    except KeyError:
-                        value = "%" + part[0]
-                chunk_pieces.append(value)
-                chunk_pieces.append(part[1:])
-            output_pieces.append("".join(chunk_pieces))
-        return "%".join(output_pieces)
+        return compile_format(type(self), format_string)(self)
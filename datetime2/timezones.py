@@ -0,0 +1,428 @@
+# Time zones compiled from TZif files
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+
+__all__ = ["TZPATH", "TimeZone", "available_zones", "get_zone"]
+
+
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
+
+from datetime2 import Date, DateTime, Time, _local_clock
+from datetime2.common import NANOSECONDS_IN_DAY, UNIX_EPOCH_DAY_COUNT, ValueCache
+
+
+# Directories searched for TZif files, in order. As in the zoneinfo module of
+# the standard library, the PYTHONTZPATH environment variable replaces them.
+if os.environ.get("PYTHONTZPATH"):
+    TZPATH = [path for path in os.environ["PYTHONTZPATH"].split(os.pathsep) if os.path.isabs(path)]
+else:
+    TZPATH = ["/usr/share/zoneinfo", "/usr/lib/zoneinfo", "/usr/share/lib/zoneinfo", "/etc/zoneinfo"]
+
+_SECONDS_IN_DAY = 86400
+_NANOSECONDS_IN_SECOND = 1_000_000_000
+# nanoseconds from the beginning of day 1 to the Unix epoch
+_UNIX_EPOCH_NS = (UNIX_EPOCH_DAY_COUNT - 1) * NANOSECONDS_IN_DAY
+
+
+##############################################################################
+# TZif files (RFC 8536)
+#
+_TZIF_HEADER = struct.Struct(">4sc15x6L")
+_TZIF_TYPE = struct.Struct(">lBB")
+
+
+def _read_tzif_block(data, position, time_code):
+    # return transition instants, their type indices, the UTC offsets of the
+    # types and the position following the data block
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _TZIF_HEADER.unpack_from(data, position)
+    if magic != b"TZif":
+        raise ValueError("Time zone data is not in TZif format.")
+    if typecnt == 0:
+        raise ValueError("Time zone data has no local time types.")
+    time_size = struct.calcsize(f">{time_code}")
+    position += _TZIF_HEADER.size
+    transitions = struct.unpack_from(f">{timecnt}{time_code}", data, position)
+    position += timecnt * time_size
+    type_indices = data[position:position + timecnt]
+    position += timecnt
+    type_offsets = [_TZIF_TYPE.unpack_from(data, position + index * _TZIF_TYPE.size)[0] for index in range(typecnt)]
+    position += typecnt * _TZIF_TYPE.size + charcnt + leapcnt * (time_size + 4) + isstdcnt + isutcnt
+    if max(type_indices, default=0) >= typecnt:
+        raise ValueError("Time zone data refers to a missing local time type.")
+    return transitions, [type_offsets[index] for index in type_indices], type_offsets[0], position, version
+
+
+def _parse_tzif(data):
+    # return the transition instants in seconds from the Unix epoch, the UTC
+    # offsets in seconds in force from each of them, the offset before the
+    # first one and the POSIX TZ string of the footer, possibly empty
+    try:
+        transitions, offsets, initial_offset, position, version = _read_tzif_block(data, 0, "l")
+        if version != b"\x00":
+            # version 2 and later repeat the data with 64-bit instants
+            transitions, offsets, initial_offset, position, version = _read_tzif_block(data, position, "q")
+            footer_end = data.index(b"\n", position + 1)
+            if data[position:position + 1] != b"\n":
+                raise ValueError("Time zone data has a malformed footer.")
+            return transitions, offsets, initial_offset, data[position + 1:footer_end].decode("ascii")
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise ValueError("Time zone data is truncated or malformed.") from exc
+    return transitions, offsets, initial_offset, ""
+
+
+##############################################################################
+# POSIX TZ strings, which describe the rule in force after the last
+# transition of a TZif file
+#
+_POSIX_TIME = r"[+-]?\d{1,3}(?::\d{1,2}){0,2}"
+_POSIX_TZ = re.compile(rf"""(?:<[^>]*>|[A-Za-z]+)(?P<std_offset>{_POSIX_TIME})
+                            (?:(?:<[^>]*>|[A-Za-z]+)(?P<dst_offset>{_POSIX_TIME})?
+                               (?:,(?P<start>[^,/]+)(?:/(?P<start_time>{_POSIX_TIME}))?
+                                  ,(?P<end>[^,/]+)(?:/(?P<end_time>{_POSIX_TIME}))?)?)?\Z""", re.VERBOSE)
+_POSIX_DATE = re.compile(r"J(?P<julian>\d{1,3})|(?P<zero_based>\d{1,3})|M(?P<month>\d{1,2})\.(?P<week>[1-5])\.(?P<weekday>[0-6])\Z")
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365)
+
+
+def _posix_seconds(text):
+    sign = -1 if text.startswith("-") else 1
+    hours, minutes, seconds = (text.lstrip("+-").split(":") + ["0", "0"])[:3]
+    return sign * (int(hours) * 3600 + int(minutes) * 60 + int(seconds))
+
+
+def _posix_date(text):
+    match = _POSIX_DATE.match(text)
+    if match is None:
+        raise ValueError(f"Invalid date in POSIX TZ string: {text}.")
+    if match["julian"] is not None:
+        day = int(match["julian"])
+        if not 1 <= day <= 365:
+            raise ValueError(f"Invalid date in POSIX TZ string: {text}.")
+        return "J", day, 0, 0
+    if match["zero_based"] is not None:
+        day = int(match["zero_based"])
+        if day > 365:
+            raise ValueError(f"Invalid date in POSIX TZ string: {text}.")
+        return "N", day, 0, 0
+    month = int(match["month"])
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid date in POSIX TZ string: {text}.")
+    return "M", month, int(match["week"]), int(match["weekday"])
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _first_day_of_year(year):
+    previous_year = year - 1
+    return previous_year * 365 + previous_year // 4 - previous_year // 100 + previous_year // 400 + 1
+
+
+def _year_of_seconds(seconds):
+    day_count = seconds // _SECONDS_IN_DAY + UNIX_EPOCH_DAY_COUNT
+    year = (day_count - 1) * 400 // 146097 + 1
+    while _first_day_of_year(year + 1) <= day_count:
+        year += 1
+    while _first_day_of_year(year) > day_count:
+        year -= 1
+    return year
+
+
+class _PosixRule:
+    # The offsets and the start and end of daylight saving time, as a date
+    # description and the local time of the change in seconds.
+    def __init__(self, tz_string):
+        match = _POSIX_TZ.match(tz_string)
+        if match is None:
+            raise ValueError(f"Invalid POSIX TZ string: {tz_string}.")
+        # POSIX offsets are positive west of Greenwich
+        self.std_offset = -_posix_seconds(match["std_offset"])
+        if match["dst_offset"] is None:
+            self.dst_offset = self.std_offset + 3600
+        else:
+            self.dst_offset = -_posix_seconds(match["dst_offset"])
+        self.has_dst = match.end("std_offset") < len(tz_string)
+        if self.has_dst:
+            # the rule of the United States when the string has no rule
+            start, end = (match["start"], match["end"]) if match["start"] else ("M3.2.0", "M11.1.0")
+            self.start = _posix_date(start), _posix_seconds(match["start_time"] or "2")
+            self.end = _posix_date(end), _posix_seconds(match["end_time"] or "2")
+            # daylight saving time all year long is written as a change
+            # at the beginning and one at the end of the year
+            self.permanent_dst = self._dst_length(2001) >= self._change_instants(2002)[0] - self._change_instants(2001)[0]
+
+    @staticmethod
+    def _day_count(date, year):
+        kind, first, week, weekday = date
+        first_day = _first_day_of_year(year)
+        if kind == "J":
+            return first_day + first - 1 + (first >= 60 and _is_leap(year))
+        if kind == "N":
+            return first_day + first
+        leap_day = first >= 3 and _is_leap(year)
+        month_start = first_day + _DAYS_BEFORE_MONTH[first - 1] + leap_day
+        month_end = first_day + _DAYS_BEFORE_MONTH[first] + (first >= 2 and _is_leap(year))
+        day_count = month_start + (weekday - month_start % 7) % 7 + (week - 1) * 7
+        while day_count >= month_end:
+            day_count -= 7
+        return day_count
+
+    def _change_instants(self, year):
+        # instants of the start and of the end of daylight saving time in
+        # seconds from the Unix epoch; the start is given in standard time,
+        # the end in daylight saving time
+        (start_date, start_time), (end_date, end_time) = self.start, self.end
+        start = (self._day_count(start_date, year) - UNIX_EPOCH_DAY_COUNT) * _SECONDS_IN_DAY + start_time - self.std_offset
+        end = (self._day_count(end_date, year) - UNIX_EPOCH_DAY_COUNT) * _SECONDS_IN_DAY + end_time - self.dst_offset
+        return start, end
+
+    def _dst_length(self, year):
+        start, end = self._change_instants(year)
+        if end < start:  # southern hemisphere
+            end = self._change_instants(year + 1)[1]
+        return end - start
+
+    def transitions(self, first_year, last_year):
+        # pairs of instant and offset from then on, in chronological order
+        result = []
+        for year in range(first_year, last_year + 1):
+            start, end = self._change_instants(year)
+            result.extend(sorted([(start, self.dst_offset), (end, self.std_offset)]))
+        return result
+
+
+##############################################################################
+# Time zones
+#
+class TimeZone:
+    """Offsets from UTC of a region over time. Transitions are compiled in
+    arrays of instants, in seconds from the Unix epoch, and of the offsets in
+    force from each of them; offsets are found by bisection. Transitions after
+    the last one in the TZif file are computed from its POSIX TZ string when
+    first needed."""
+
+    def __init__(self, key):
+        if not isinstance(key, str):
+            raise TypeError("Time zone key must be a string.")
+        normalized = os.path.normpath(key)
+        if not key or os.path.isabs(key) or normalized != key or normalized.startswith(".."):
+            raise ValueError(f"Invalid time zone key: {key}.")
+        for directory in TZPATH:
+            path = os.path.join(directory, key)
+            if os.path.isfile(path):
+                with open(path, "rb") as tzif_file:
+                    self._compile(key, tzif_file.read())
+                return
+        raise ValueError(f"Time zone not found: {key}.")
+
+    @classmethod
+    def from_bytes(cls, data, key=None):
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError("Time zone data must be a bytes-like object.")
+        zone = cls.__new__(cls)
+        zone._compile(key, bytes(data))
+        return zone
+
+    @classmethod
+    def from_file(cls, path, key=None):
+        with open(path, "rb") as tzif_file:
+            return cls.from_bytes(tzif_file.read(), key)
+
+    def _compile(self, key, data):
+        transitions, offsets, initial_offset, tz_string = _parse_tzif(data)
+        self.key = key
+        self._rule = _PosixRule(tz_string) if tz_string else None
+        self._utcoffsets = {}
+        # offsets[0] is in force before the first transition
+        self._state = self._build_state(array("q", transitions), array("q", [initial_offset, *offsets]))
+        if self._rule is not None and self._rule.has_dst and not self._rule.permanent_dst:
+            first_year = _year_of_seconds(transitions[-1]) if transitions else 1970
+            self._state = self._extended_state(self._state, first_year, first_year)
+
+    @staticmethod
+    def _build_state(transitions, offsets, covered_until=None):
+        # Local times at the boundaries: a local time before bound[i], as
+        # seconds from the Unix epoch, has offsets[i]. Skipped and repeated
+        # local times are resolved with the offset before the transition if
+        # fold is 0, with the one after it if fold is 1, as in PEP 495.
+        fold0_bounds = array("q", [instant + max(before, after)
+                                   for instant, before, after in zip(transitions, offsets, offsets[1:])])
+        fold1_bounds = array("q", [instant + min(before, after)
+                                   for instant, before, after in zip(transitions, offsets, offsets[1:])])
+        # a tuple, so that threads see the arrays and their extent together
+        return transitions, offsets, (fold0_bounds, fold1_bounds), covered_until
+
+    def _extended_state(self, state, first_year, last_year):
+        transitions, offsets = array("q", state[0]), array("q", state[1])
+        last_transition = transitions[-1] if transitions else None
+        for instant, offset in self._rule.transitions(first_year, last_year):
+            if last_transition is None or instant > last_transition:
+                transitions.append(instant)
+                offsets.append(offset)
+                last_transition = instant
+        # the first change of the following year may happen a week before
+        # it, with the largest time of change allowed in TZ strings
+        covered_until = (_first_day_of_year(last_year + 1) - UNIX_EPOCH_DAY_COUNT - 8) * _SECONDS_IN_DAY
+        return self._build_state(transitions, offsets, covered_until)
+
+    def _covering_state(self, seconds):
+        # Return the state whose transitions are valid up to seconds. The
+        # state is replaced, never changed, so readers need no locks.
+        state = self._state
+        if state[3] is not None and seconds >= state[3]:
+            last_year = _year_of_seconds(state[3] + 9 * _SECONDS_IN_DAY)
+            state = self._extended_state(state, last_year, max(_year_of_seconds(seconds) + 1, last_year))
+            self._state = state
+        return state
+
+    def _offset_seconds(self, seconds):
+        # UTC offset in seconds at a UTC instant in seconds from the Unix epoch
+        state = self._covering_state(seconds)
+        return state[1][bisect_right(state[0], seconds)]
+
+    def _local_offset_seconds(self, seconds, fold):
+        # UTC offset in seconds at a local time in seconds from the Unix epoch
+        state = self._covering_state(seconds + _SECONDS_IN_DAY)
+        return state[1][bisect_right(state[2][fold], seconds)]
+
+    def _utcoffset(self, offset_seconds):
+        # UTC offset as a fraction of a day and in nanoseconds
+        utcoffset = self._utcoffsets.get(offset_seconds)
+        if utcoffset is None:
+            utcoffset = Fraction(offset_seconds, _SECONDS_IN_DAY), offset_seconds * _NANOSECONDS_IN_SECOND
+            self._utcoffsets[offset_seconds] = utcoffset
+        return utcoffset
+
+    def __repr__(self):
+        if self.key is None:
+            return f"{type(self).__name__}.from_bytes(...)"
+        return f"{type(self).__name__}({self.key!r})"
+
+    def __str__(self):
+        return repr(self) if self.key is None else self.key
+
+    def utcoffset(self, date, time, *, fold=0):
+        if not isinstance(date, Date):
+            raise TypeError("Date argument must be a Date instance.")
+        if not isinstance(time, Time):
+            raise TypeError("Time argument must be a Time instance.")
+        if fold not in (0, 1):
+            raise ValueError("Fold must be 0 or 1.")
+        days = date.day_count - UNIX_EPOCH_DAY_COUNT
+        if time._moment_ns is not None:
+            seconds = days * _SECONDS_IN_DAY + time._moment_ns // _NANOSECONDS_IN_SECOND
+        elif time.utcoffset is None:
+            seconds = (days + time.day_frac) * _SECONDS_IN_DAY // 1
+        else:
+            seconds = (days + time.day_frac - time.utcoffset) * _SECONDS_IN_DAY // 1
+        if time.utcoffset is None:
+            return self._utcoffset(self._local_offset_seconds(seconds, fold))[0]
+        return self._utcoffset(self._offset_seconds(seconds))[0]
+
+    def localize(self, moment, *, fold=0):
+        if not isinstance(moment, DateTime):
+            raise TypeError("Moment must be a DateTime instance.")
+        if fold not in (0, 1):
+            raise ValueError("Fold must be 0 or 1.")
+        if moment._utcoffset is None:
+            # a naive moment is a local time in this zone
+            nanoseconds = moment._nanoseconds
+            offset_seconds = self._local_offset_seconds((nanoseconds - _UNIX_EPOCH_NS) // _NANOSECONDS_IN_SECOND, fold)
+            utcoffset, utcoffset_ns = self._utcoffset(offset_seconds)
+        else:
+            # an aware moment is converted to the local time of this zone
+            moment_ns = moment._moment_ns
+            offset_seconds = self._offset_seconds((moment_ns - _UNIX_EPOCH_NS) // _NANOSECONDS_IN_SECOND)
+            utcoffset, utcoffset_ns = self._utcoffset(offset_seconds)
+            nanoseconds = moment_ns + utcoffset_ns
+        return DateTime._from_nanoseconds(nanoseconds, utcoffset, utcoffset_ns)
+
+    def localize_many(self, moments, *, fold=0):
+        return [self.localize(moment, fold=fold) for moment in moments]
+
+    def now(self):
+        moment_ns = _local_clock.time_ns()
+        utcoffset, utcoffset_ns = self._utcoffset(self._offset_seconds(moment_ns // _NANOSECONDS_IN_SECOND))
+        return DateTime._from_nanoseconds(moment_ns + _UNIX_EPOCH_NS + utcoffset_ns, utcoffset, utcoffset_ns)
+
+    def localize_datetime64(self, moments):
+        """Return the local times and the UTC offsets, as timedelta64[s], of a
+        NumPy datetime64 array of UTC moments. Offsets are searched for all
+        moments at once."""
+        import numpy as np
+
+        moments = np.asarray(moments)
+        if moments.dtype.kind != "M":
+            raise TypeError("Moments must be a NumPy datetime64 array.")
+        seconds = moments.astype("datetime64[s]").view(np.int64)
+        state = self._state
+        if state[3] is not None and seconds.size:
+            state = self._covering_state(int(seconds.max()))
+        transitions = np.frombuffer(state[0], dtype=np.int64)
+        offsets = np.frombuffer(state[1], dtype=np.int64)[np.searchsorted(transitions, seconds, side="right")]
+        utcoffsets = offsets.astype("timedelta64[s]")
+        return moments + utcoffsets, utcoffsets
+
+
+_zones = ValueCache(maxsize=1024)
+
+
+def get_zone(key):
+    """Return the TimeZone of key, compiling its TZif file only the first
+    time it is asked for."""
+    zone = _zones.get(key)
+    if zone is None:
+        zone = _zones.setdefault(key, TimeZone(key))
+    return zone
+
+
+def available_zones():
+    keys = set()
+    for directory in TZPATH:
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    with open(path, "rb") as tzif_file:
+                        if tzif_file.read(4) != b"TZif":
+                            continue
+                except OSError:
+                    continue
+                keys.add(os.path.relpath(path, directory).replace(os.sep, "/"))
+    # posix/ and right/ are copies of the other zones, with and without leap seconds
+    return {key for key in keys if not key.startswith(("posix/", "right/")) and key not in ("localtime", "posixrules", "Factory")}
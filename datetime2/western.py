@@ -31,9 +31,21 @@ __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
 
 import bisect
+import functools
+import re
+from array import array
 from fractions import Fraction
 
-from .common import verify_fractional_value
+from .common import (
+    NANOSECONDS_IN_DAY,
+    InstancePool,
+    compile_format,
+    compile_format_many,
+    compile_parse,
+    format_integers_many,
+    verify_fractional_value,
+    verify_integer_array,
+)
 
 
 _days_in_month = [
@@ -46,11 +58,69 @@ _days_in_previous_months = [
     for leap_year in (0, 1)
 ]
 
+_month_of_day_of_year = [
+    [bisect.bisect_left(_days_in_previous_months[leap_year], day) for day in range(367)]
+    for leap_year in (0, 1)
+]
+
+
+class _RataDieTable:
+    # Packed year, month and day for each day of a range of years. The table
+    # is built on first use, outside the range GregorianCalendar falls back to
+    # computation. The first day, the day after the last one and the packed
+    # values are published as a single tuple, replaced and never changed, so
+    # that readers need no locks.
+
+    def __init__(self, first_year, last_year):
+        self.set_years(first_year, last_year)
+
+    def set_years(self, first_year, last_year):
+        if first_year is None and last_year is None:
+            self.state = (0, 0, None)
+        else:
+            if not isinstance(first_year, int) or not isinstance(last_year, int):
+                raise TypeError("First and last year must be integers or both None.")
+            if first_year > last_year:
+                raise ValueError("First year must not be greater than last year.")
+            self.state = (GregorianCalendar(first_year, 1, 1).to_rata_die(),
+                          GregorianCalendar(last_year, 12, 31).to_rata_die() + 1, None)
+
+    def build(self, state):
+        # return the packed values for the range of state, publishing them
+        # unless the range has been changed in the meantime
+        first_day, end_day, packed = state
+        if packed is None:
+            packed = array("q")
+            year = _year_and_day_of_year(first_day)[0]
+            while len(packed) < end_day - first_day:
+                for month, days_in_month in enumerate(_days_in_month[GregorianCalendar.is_leap_year(year)], start=1):
+                    packed.extend([(year << 9) | (month << 5) | day for day in range(1, days_in_month + 1)])
+                year += 1
+            if self.state is state:
+                self.state = (first_day, end_day, packed)
+        return packed
+
+
+def _year_and_day_of_year(day_count):
+    y400, d400 = divmod(day_count - 1, 146097)
+    y100, d100 = divmod(d400, 36524)
+    y4, d4 = divmod(d100, 1461)
+    y1 = d4 // 365
+    year_minus_one = (400 * y400 + 100 * y100 + 4 * y4 + y1 - (1 if (y100 == 4 or y1 == 4) else 0))
+    days = (day_count - 365 * year_minus_one - year_minus_one // 4 + year_minus_one // 100 - year_minus_one // 400)  # days from january 1st (included) to today
+    return year_minus_one + 1, days
+
+
+_gregorian_str_regex = re.compile(r"(-?\d{4,})-(\d{2})-(\d{2})", re.ASCII)
+
 
 ##############################################################################
 # Gregorian calendar
 #
 class GregorianCalendar:
+    # opt-in interning of the instances returned by from_rata_die
+    pool = InstancePool()
+
     def __init__(self, year, month, day):
         if not isinstance(year, int) or not isinstance(month, int) or not isinstance(day, int):
             raise TypeError("integer argument expected")
@@ -85,19 +155,71 @@ class GregorianCalendar:
         day_in_month = (day - _days_in_previous_months[GregorianCalendar.is_leap_year(year)][month - 1])
         return cls(year, month, day_in_month)
 
+    @classmethod
+    def iter_month(cls, year, month):
+        if not isinstance(year, int) or not isinstance(month, int):
+            raise TypeError("integer argument expected")
+        if month < 1 or month > 12:
+            raise ValueError(f"Month must be between 1 and 12, while it is {month}.")
+        leap_year = GregorianCalendar.is_leap_year(year)
+        first_day = _days_in_previous_months[leap_year][month - 1]
+        return _gregorian_days(cls, year, range(first_day, first_day + _days_in_month[leap_year][month - 1]))
+
+    @classmethod
+    def iter_year(cls, year):
+        if not isinstance(year, int):
+            raise TypeError("integer argument expected")
+        return _gregorian_days(cls, year, range(GregorianCalendar.days_in_year(year)))
+
     @classmethod
     def from_rata_die(cls, day_count):
         if not isinstance(day_count, int):
             raise TypeError("integer argument expected")
-        y400, d400 = divmod(day_count - 1, 146097)
-        y100, d100 = divmod(d400, 36524)
-        y4, d4 = divmod(d100, 1461)
+        pool = GregorianCalendar.pool
+        if pool.maxsize and cls is GregorianCalendar:
+            greg = pool.get(day_count)
+            if greg is None:
+                greg = pool.setdefault(day_count, cls._derive_from_rata_die(day_count))
+            return greg
+        return cls._derive_from_rata_die(day_count)
+
+    @classmethod
+    def _derive_from_rata_die(cls, day_count):
+        # the state is read once, so that a concurrent set_lookup_years cannot mix two tables
+        state = _rata_die_table.state
+        first_day, end_day, packed = state
+        if first_day <= day_count < end_day:
+            if packed is None:
+                packed = _rata_die_table.build(state)
+            packed_date = packed[day_count - first_day]
+            greg = cls(packed_date >> 9, (packed_date >> 5) & 15, packed_date & 31)
+            if isinstance(greg, GregorianCalendar):  # a modified class returns a base class instance
+                greg._rata_die = day_count
+            return greg
+        return cls.year_day(*_year_and_day_of_year(day_count))
+
+    @classmethod
+    def from_rata_die_many(cls, day_counts):
+        import numpy as np
+
+        day_counts = verify_integer_array(day_counts)
+        y400, d400 = np.divmod(day_counts - 1, 146097)
+        y100, d100 = np.divmod(d400, 36524)
+        y4, d4 = np.divmod(d100, 1461)
         y1 = d4 // 365
-        year_minus_one = (400 * y400 + 100 * y100 + 4 * y4 + y1 - (1 if (y100 == 4 or y1 == 4) else 0))
-        days = (day_count - 365 * year_minus_one - year_minus_one // 4 + year_minus_one // 100 - year_minus_one // 400)  # days from january 1st (included) to today
-        greg_day = cls.year_day(year_minus_one + 1, days)
-        greg_day._rata_die = day_count
-        return greg_day
+        year_minus_one = 400 * y400 + 100 * y100 + 4 * y4 + y1 - ((y100 == 4) | (y1 == 4))
+        days = (day_counts - 365 * year_minus_one - year_minus_one // 4 + year_minus_one // 100 - year_minus_one // 400)
+        years = year_minus_one + 1
+        leap = GregorianCalendar._is_leap_year_many(years)
+        months = np.asarray(_month_of_day_of_year, dtype=np.int64)[leap, days]
+        days -= np.asarray(_days_in_previous_months, dtype=np.int64)[leap, months - 1]
+        return years, months, days
+
+    @staticmethod
+    def _is_leap_year_many(years):
+        import numpy as np
+
+        return ((years % 4 == 0) & ~np.isin(years % 400, (100, 200, 300))).astype(np.int64)
 
     @staticmethod
     def is_leap_year(year):
@@ -118,12 +240,34 @@ class GregorianCalendar:
                 + self._day)
         return self._rata_die
 
+    @classmethod
+    def to_rata_die_many(cls, years, months, days):
+        import numpy as np
+
+        years = verify_integer_array(years)
+        months = verify_integer_array(months)
+        days = verify_integer_array(days)
+        if not len(years) == len(months) == len(days):
+            raise ValueError("Years, months and days must have the same length.")
+        if np.any((months < 1) | (months > 12)):
+            raise ValueError("Months must be between 1 and 12.")
+        leap = GregorianCalendar._is_leap_year_many(years)
+        if np.any((days < 1) | (days > np.asarray(_days_in_month, dtype=np.int64)[leap, months - 1])):
+            raise ValueError("Days must be between 1 and number of days in month.")
+        year_minus_one = years - 1
+        return (365 * year_minus_one
+                + year_minus_one // 4
+                - year_minus_one // 100
+                + year_minus_one // 400
+                + (367 * months - 362) // 12
+                + np.where(months > 2, leap - 2, 0)
+                + days)
+
     def weekday(self):
         return (self.to_rata_die() - 1) % 7 + 1
 
     def day_of_year(self):
-        return self.to_rata_die() - (365 * (self._year - 1) + (self._year - 1) // 4
-                                     - (self._year - 1) // 100 + (self._year - 1) // 400)
+        return _days_in_previous_months[GregorianCalendar.is_leap_year(self._year)][self._month - 1] + self._day
 
     def replace(self, *, year=None, month=None, day=None):
         if year is None:
@@ -185,22 +329,264 @@ class GregorianCalendar:
     def cformat(self, format_string):
         if not isinstance(format_string, str):
             raise TypeError("Format must be specified with string.")
-        output_pieces = []
-        for format_chunk in format_string.split("%%"):
-            format_parts = format_chunk.split("%")
-            chunk_pieces = [format_parts[0]]
-            for part in format_parts[1:]:
-                if part == "":  # special case: last char is '%'
-                    value = "%"
-                else:
-                    try:
-                        value = self.format_functions[part[0]](self)
-                    except KeyError:
-                        value = "%" + part[0]
-                chunk_pieces.append(value)
-                chunk_pieces.append(part[1:])
-            output_pieces.append("".join(chunk_pieces))
-        return "%".join(output_pieces)
+        return compile_format(type(self), format_string)(self)
+
+    format_many_functions = {
+        "a": lambda components: format_integers_many(
+            components.weekdays, lambda weekday: GregorianCalendar.name_weekdays[weekday - 1][:3]),
+        "A": lambda components: format_integers_many(
+            components.weekdays, lambda weekday: GregorianCalendar.name_weekdays[weekday - 1]),
+        "b": lambda components: format_integers_many(
+            components.months, lambda month: GregorianCalendar.name_months[month - 1][:3]),
+        "B": lambda components: format_integers_many(
+            components.months, lambda month: GregorianCalendar.name_months[month - 1]),
+        "d": lambda components: format_integers_many(components.days, "{:02d}".format),
+        "m": lambda components: format_integers_many(components.months, "{:02d}".format),
+        "j": lambda components: format_integers_many(components.days_of_year, "{:03d}".format),
+        "U": lambda components: format_integers_many(
+            (components.days_of_year + (13 - components.weekdays) % 7) // 7, "{:02d}".format),
+        "w": lambda components: format_integers_many(components.weekdays, "{:1d}".format),
+        "W": lambda components: format_integers_many(
+            (components.days_of_year + 7 - components.weekdays) // 7, "{:02d}".format),
+        "y": lambda components: format_integers_many(components.years, lambda year: f"{year:03d}"[-2:]),
+        "Y": lambda components: format_integers_many(
+            components.years, lambda year: f"{year:04d}" if year >= 0 else f"-{-year:04d}"),
+    }
+
+    @classmethod
+    def cformat_many(cls, format_string, rata_die_values):
+        if not isinstance(format_string, str):
+            raise TypeError("Format must be specified with string.")
+        components = _GregorianComponents(verify_integer_array(rata_die_values))
+        return compile_format_many(cls, format_string)(components)
+
+    parse_directives = {
+        "a": ("|".join(name[:3] for name in name_weekdays), "weekday",
+              {name[:3]: weekday for weekday, name in enumerate(name_weekdays, start=1)}.__getitem__),
+        "A": ("|".join(name_weekdays), "weekday",
+              {name: weekday for weekday, name in enumerate(name_weekdays, start=1)}.__getitem__),
+        "b": ("|".join(name[:3] for name in name_months), "month",
+              {name[:3]: month for month, name in enumerate(name_months, start=1)}.__getitem__),
+        "B": ("|".join(name_months), "month",
+              {name: month for month, name in enumerate(name_months, start=1)}.__getitem__),
+        "d": (r"\d{2}", "day", int),
+        "m": (r"\d{2}", "month", int),
+        "j": (r"\d{3}", "day_of_year", int),
+        "U": (r"\d{2}", "week_sunday", int),
+        "w": (r"\d", "weekday", int),
+        "W": (r"\d{2}", "week_monday", int),
+        "Y": (r"-?\d{4,}", "year", int),
+    }
+
+    @classmethod
+    def cparse(cls, string, format_string):
+        if not isinstance(string, str) or not isinstance(format_string, str):
+            raise TypeError("String and format must be specified with strings.")
+        fields = compile_parse(cls, format_string)(string)
+        try:
+            year = fields["year"]
+        except KeyError:
+            raise ValueError("Year is required to parse a date.") from None
+        if "month" in fields or "day" in fields:
+            greg = cls(year, fields.get("month", 1), fields.get("day", 1))
+        elif "day_of_year" in fields:
+            greg = cls.year_day(year, fields["day_of_year"])
+        elif "weekday" in fields and ("week_monday" in fields or "week_sunday" in fields):
+            weekday_of_jan_1 = cls(year, 1, 1).weekday()
+            if "week_monday" in fields:
+                first_monday = (8 - weekday_of_jan_1) % 7 + 1
+                day_of_year = first_monday + (fields["week_monday"] - 1) * 7 + fields["weekday"] - 1
+            else:
+                first_sunday = (7 - weekday_of_jan_1) % 7 + 1
+                day_of_year = first_sunday + (fields["week_sunday"] - 1) * 7 + fields["weekday"] % 7
+            greg = cls.year_day(year, day_of_year)
+        else:
+            greg = cls(year, 1, 1)
+        # all parsed fields must describe the same date
+        if not fields.keys() <= {"year", "month", "day"}:
+            weekday = greg.weekday()
+            day_of_year = greg.day_of_year()
+            actual_fields = {
+                "month": greg.month,
+                "day": greg.day,
+                "weekday": weekday,
+                "day_of_year": day_of_year,
+                "week_sunday": (day_of_year + (13 - weekday) % 7) // 7,
+                "week_monday": (day_of_year + 7 - weekday) // 7,
+            }
+            for field, value in fields.items():
+                if field != "year" and actual_fields[field] != value:
+                    raise ValueError(f"String {string!r} does not describe a single date.")
+        return greg
+
+    @classmethod
+    def from_str(cls, string):
+        if not isinstance(string, str):
+            raise TypeError("String expected.")
+        # canonical form YYYY-MM-DD, parsed by hand
+        if len(string) == 10 and string[4] == "-" and string[7] == "-" and string.isascii():
+            year, month, day = string[:4], string[5:7], string[8:]
+            if year.isdigit() and month.isdigit() and day.isdigit():
+                return cls(int(year), int(month), int(day))
+        match = _gregorian_str_regex.fullmatch(string)
+        if match is None:
+            raise ValueError(f"String {string!r} is not a valid Gregorian date.")
+        return cls(int(match[1]), int(match[2]), int(match[3]))
+
+
+_rata_die_table = _RataDieTable(1970, 2100)
+
+
+def set_lookup_years(first_year, last_year):
+    _rata_die_table.set_years(first_year, last_year)
+
+
+class _GregorianDays:
+    # Lazy sequence of the days of a year, or of a part of it, as calendar
+    # objects. Days are kept as a range of zero-based days of the year; month,
+    # day and rata die come from tables and from the rata die of January 1st,
+    # so objects are filled in without computing them from the rata die and
+    # without the verifications of the constructor.
+    __slots__ = ("_calendar_class", "_year", "_days", "_first_rata_die")
+
+    def __init__(self, calendar_class, year, days, first_rata_die=None):
+        self._calendar_class = calendar_class
+        self._year = year
+        self._days = days
+        if first_rata_die is None:
+            year_minus_one = year - 1
+            first_rata_die = 365 * year_minus_one + year_minus_one // 4 - year_minus_one // 100 + year_minus_one // 400 + 1
+        self._first_rata_die = first_rata_die
+
+    def _calendar_objects(self, days):
+        new, calendar_class, year, first_rata_die = object.__new__, self._calendar_class, self._year, self._first_rata_die
+        leap_year = GregorianCalendar.is_leap_year(year)
+        month_of_day_of_year = _month_of_day_of_year[leap_year]
+        days_in_previous_months = _days_in_previous_months[leap_year]
+        for day in days:
+            month = month_of_day_of_year[day + 1]
+            greg = new(calendar_class)
+            greg._year = year
+            greg._month = month
+            greg._day = day + 1 - days_in_previous_months[month - 1]
+            greg._rata_die = first_rata_die + day
+            yield greg
+
+    def __len__(self):
+        return len(self._days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _GregorianDays(self._calendar_class, self._year, self._days[index], self._first_rata_die)
+        return next(self._calendar_objects((self._days[index],)))
+
+    def __iter__(self):
+        return self._calendar_objects(self._days)
+
+    def __reversed__(self):
+        return self._calendar_objects(reversed(self._days))
+
+    def __repr__(self):
+        # the repr shows how the sequence is built: a month, a year or a slice of the latter
+        days, year = self._days, self._year
+        iter_year = f"datetime2.western.{self._calendar_class.__name__}.iter_year({year})"
+        if days == range(GregorianCalendar.days_in_year(year)):
+            return iter_year
+        leap_year = GregorianCalendar.is_leap_year(year)
+        if days and days.step == 1:
+            month = _month_of_day_of_year[leap_year][days.start + 1]
+            first_day = _days_in_previous_months[leap_year][month - 1]
+            if days == range(first_day, first_day + _days_in_month[leap_year][month - 1]):
+                return f"datetime2.western.{self._calendar_class.__name__}.iter_month({year}, {month})"
+        if not days:
+            return f"{iter_year}[0:0]"
+        stop = "" if days.stop < 0 else days.stop
+        step = "" if days.step == 1 else f":{days.step}"
+        return f"{iter_year}[{days.start}:{stop}{step}]"
+
+
+def _gregorian_days(calendar_class, year, days):
+    gregorian_days = _GregorianDays(calendar_class, year, days)
+    # the class of a calendar attribute, like Date.gregorian, returns the days as dates
+    dates_from_day_counts = getattr(calendar_class, "_dates_from_day_counts", None)
+    if dates_from_day_counts is None:
+        return gregorian_days
+    first_rata_die = gregorian_days._first_rata_die
+    return dates_from_day_counts(range(first_rata_die + days.start, first_rata_die + days.stop))
+
+
+class _GregorianComponents:
+    # components of many dates, computed with NumPy only when required by a directive
+    def __init__(self, day_counts):
+        self.day_counts = day_counts
+
+    def __len__(self):
+        return len(self.day_counts)
+
+    @functools.cached_property
+    def _years_months_days(self):
+        return GregorianCalendar.from_rata_die_many(self.day_counts)
+
+    @functools.cached_property
+    def years(self):
+        return self._years_months_days[0]
+
+    @functools.cached_property
+    def months(self):
+        return self._years_months_days[1]
+
+    @functools.cached_property
+    def days(self):
+        return self._years_months_days[2]
+
+    @functools.cached_property
+    def weekdays(self):
+        return (self.day_counts - 1) % 7 + 1
+
+    @functools.cached_property
+    def days_of_year(self):
+        year_minus_one = self.years - 1
+        return self.day_counts - (365 * year_minus_one + year_minus_one // 4
+                                  - year_minus_one // 100 + year_minus_one // 400)
+
+
+def _format_timezone(timezone):  # this case is too complex to fit in a lambda
+    if timezone is None:
+        return ""
+    if timezone < 0:
+        tz_sign = "-"
+        abs_timezone = -timezone
+    else:
+        tz_sign = "+"
+        abs_timezone = timezone
+    tz_hour = int(abs_timezone)
+    remainder_in_minutes = (abs_timezone - tz_hour) * 60
+    tz_minute = int(remainder_in_minutes)
+    remainder_in_seconds = (remainder_in_minutes - tz_minute) * 60
+    tz_second = int(remainder_in_seconds)
+    remainder_in_microseconds = (remainder_in_seconds - tz_second) * 1_000_000
+    tz_microsecond = int(remainder_in_microseconds)
+    if tz_microsecond > 0:
+        return f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}:{tz_second:02d}.{tz_microsecond:06d}"
+    elif tz_second > 0:
+        return f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}:{tz_second:02d}"
+    else:
+        return f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}"
+
+
+def _parse_timezone(text):  # inverse of _format_timezone
+    if text == "":
+        return None
+    sign = -1 if text[0] == "-" else 1
+    timezone = int(text[1:3]) + Fraction(int(text[4:6]), 60)
+    if len(text) > 6:
+        timezone += Fraction(int(text[7:9]), 3600)
+    if len(text) > 9:
+        timezone += Fraction(int(text[10:]), 3_600_000_000)
+    return sign * timezone
+
+
+_western_time_str_regex = re.compile(r"(\d{2}):(\d{2}):(\d{2})(?:([+-]\d{1,2}):(-?\d{2}))?", re.ASCII)
 
 
 ##############################################################################
@@ -308,50 +694,126 @@ class WesternTime:
         "M": lambda self: f"{self.minute:02d}",
         "S": lambda self: f"{int(self.second):02d}",
         "f": lambda self: f"{int((self.second - int(self.second)) * 1000000):06d}",
+        "z": lambda self: _format_timezone(self.timezone),
     }
 
     def cformat(self, format_string):
         if not isinstance(format_string, str):
             raise TypeError("Format must be specified with string.")
-        output_pieces = []
-        for format_chunk in format_string.split("%%"):
-            format_parts = format_chunk.split("%")
-            chunk_pieces = [format_parts[0]]
-            for part in format_parts[1:]:
-                if part == "":  # special case: last char is '%'
-                    value = "%"
-                elif part == 'z':  # this case is too complex to fit in a lambda
-                    if self.timezone is None:
-                        value = ''
-                    else:
-                        if self.timezone < 0:
-                            tz_sign = '-'
-                            abs_timezone = -self.timezone
-                        else:
-                            tz_sign = '+'
-                            abs_timezone = self.timezone
-                        tz_hour = int(abs_timezone)
-                        remainder_in_minutes = (abs_timezone - tz_hour) * 60
-                        tz_minute = int(remainder_in_minutes)
-                        remainder_in_seconds = (remainder_in_minutes - tz_minute) * 60
-                        tz_second = int(remainder_in_seconds)
-                        remainder_in_microseconds = (remainder_in_seconds - tz_second) * 1_000_000
-                        tz_microsecond = int(remainder_in_microseconds)
-                        if tz_microsecond > 0:
-                            value = f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}:{tz_second:02d}.{tz_microsecond:06d}"
-                        elif tz_second > 0:
-                            value = f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}:{tz_second:02d}"
-                        else:
-                            value = f"{tz_sign}{tz_hour:02d}:{tz_minute:02d}"
-                else:
-                    try:
-                        value = self.format_functions[part[0]](self)
-                    except KeyError:
-                        value = "%" + part[0]
-                chunk_pieces.append(value)
-                chunk_pieces.append(part[1:])
-            output_pieces.append("".join(chunk_pieces))
-        return "%".join(output_pieces)
+        return compile_format(type(self), format_string)(self)
+
+    format_many_functions = {
+        "H": lambda components: format_integers_many(components.hours, "{:02d}".format),
+        "I": lambda components: format_integers_many(
+            components.hours, lambda hour: f"{12 if hour == 0 else hour if hour <= 12 else hour - 12:02d}"),
+        "p": lambda components: format_integers_many(components.hours, lambda hour: "AM" if hour < 12 else "PM"),
+        "M": lambda components: format_integers_many(components.minutes, "{:02d}".format),
+        "S": lambda components: format_integers_many(components.seconds, "{:02d}".format),
+        "f": lambda components: format_integers_many(components.microseconds, "{:06d}".format),
+        "z": lambda components: [_format_timezone(components.timezone)] * len(components),
+    }
+
+    @classmethod
+    def cformat_many(cls, format_string, nanoseconds, *, timezone=None):
+        import numpy as np
+
+        if not isinstance(format_string, str):
+            raise TypeError("Format must be specified with string.")
+        nanoseconds = verify_integer_array(nanoseconds)
+        if np.any((nanoseconds < 0) | (nanoseconds >= NANOSECONDS_IN_DAY)):
+            raise ValueError("Nanoseconds must be equal or greater than 0 and less than the nanoseconds in a day.")
+        if timezone is not None:
+            try:
+                timezone = verify_fractional_value(timezone, min=-24, max=+24)
+            except TypeError as exc:
+                raise TypeError("Time zone is not a valid fractional value") from exc
+            except ValueError as exc:
+                raise ValueError("Time zone must be greater than -24 and less than 24.") from exc
+        components = _WesternTimeComponents(nanoseconds, timezone)
+        return compile_format_many(cls, format_string)(components)
+
+    parse_directives = {
+        "H": (r"\d{2}", "hour", int),
+        "I": (r"\d{2}", "hour_12", int),
+        "p": ("AM|PM", "post_meridiem", lambda text: text == "PM"),
+        "M": (r"\d{2}", "minute", int),
+        "S": (r"\d{2}", "second", int),
+        "f": (r"\d{6}", "microsecond", int),
+        "z": (r"(?:[+-]\d{2}:\d{2}(?::\d{2}(?:\.\d{6})?)?)?", "timezone", lambda text: _parse_timezone(text)),
+    }
+
+    @classmethod
+    def cparse(cls, string, format_string):
+        if not isinstance(string, str) or not isinstance(format_string, str):
+            raise TypeError("String and format must be specified with strings.")
+        fields = compile_parse(cls, format_string)(string)
+        hour = fields.get("hour")
+        if "hour_12" in fields:
+            if "post_meridiem" not in fields:
+                raise ValueError("Hour on a 12-hour clock requires AM or PM to be parsed.")
+            hour_12 = fields["hour_12"]
+            if hour_12 < 1 or hour_12 > 12:
+                raise ValueError(f"Hour on a 12-hour clock must be between 1 and 12, while it is {hour_12}.")
+            if hour is None:
+                hour = hour_12 % 12 + (12 if fields["post_meridiem"] else 0)
+            elif hour != hour_12 % 12 + (12 if fields["post_meridiem"] else 0):
+                raise ValueError(f"String {string!r} does not describe a single time.")
+        elif hour is None:
+            hour = 0
+        elif "post_meridiem" in fields and fields["post_meridiem"] != (hour >= 12):
+            raise ValueError(f"String {string!r} does not describe a single time.")
+        second = fields.get("second", 0)
+        if "microsecond" in fields:
+            second += Fraction(fields["microsecond"], 1_000_000)
+        return cls(hour, fields.get("minute", 0), second, timezone=fields.get("timezone"))
+
+    @classmethod
+    def from_str(cls, string):
+        if not isinstance(string, str):
+            raise TypeError("String expected.")
+        # canonical naive form HH:MM:SS, parsed by hand
+        if len(string) == 8 and string[2] == ":" and string[5] == ":" and string.isascii():
+            hour, minute, second = string[:2], string[3:5], string[6:]
+            if hour.isdigit() and minute.isdigit() and second.isdigit():
+                return cls(int(hour), int(minute), int(second))
+        match = _western_time_str_regex.fullmatch(string)
+        if match is None:
+            raise ValueError(f"String {string!r} is not a valid western time.")
+        hour, minute, second, tz_hour, tz_minute = match.groups()
+        if tz_hour is None:
+            return cls(int(hour), int(minute), int(second))
+        # __str__ writes the sign of the time zone in both parts (e.g. -2:-45),
+        # while in ISO 8601 the sign of the hours applies to the minutes too
+        tz_minute = Fraction(int(tz_minute), 60)
+        if tz_hour[0] == "-" and tz_minute > 0:
+            tz_minute = -tz_minute
+        return cls(int(hour), int(minute), int(second), timezone=int(tz_hour) + tz_minute)
+
+
+class _WesternTimeComponents:
+    # components of many times, computed with NumPy only when required by a directive
+    def __init__(self, nanoseconds, timezone):
+        self.nanoseconds = nanoseconds
+        self.timezone = timezone
+
+    def __len__(self):
+        return len(self.nanoseconds)
+
+    @functools.cached_property
+    def hours(self):
+        return self.nanoseconds // 3_600_000_000_000
+
+    @functools.cached_property
+    def minutes(self):
+        return self.nanoseconds // 60_000_000_000 % 60
+
+    @functools.cached_property
+    def seconds(self):
+        return self.nanoseconds // 1_000_000_000 % 60
+
+    @functools.cached_property
+    def microseconds(self):
+        return self.nanoseconds // 1000 % 1_000_000
 
 
 ##############################################################################
@@ -449,19 +911,4 @@ class WesternTimeDelta:
     def cformat(self, format_string):
         if not isinstance(format_string, str):
             raise TypeError("Format must be specified with string.")
-        output_pieces = []
-        for format_chunk in format_string.split("%%"):
-            format_parts = format_chunk.split("%")
-            chunk_pieces = [format_parts[0]]
-            for part in format_parts[1:]:
-                if part == "":  # special case: last char is '%'
-                    value = "%"
-                else:
-                    try:
-                        value = self.format_functions[part[0]](self)
-                    except KeyError:
-                        value = "%" + part[0]
-                chunk_pieces.append(value)
-                chunk_pieces.append(part[1:])
-            output_pieces.append("".join(chunk_pieces))
-        return "%".join(output_pieces)
+        return compile_format(type(self), format_string)(self)
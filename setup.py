@@ -37,6 +37,8 @@ setuptools.setup(
 
     packages=setuptools.find_packages(exclude=['docs*']),
 
+    extras_require={'numpy': ['numpy'], 'arrow': ['numpy', 'pyarrow']},
+
     platforms=['Platform independent'],
 
     project_urls={"Documentation": 'https://datetime2.readthedocs.io/en/stable/',
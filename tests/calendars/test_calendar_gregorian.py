@@ -33,7 +33,8 @@ from decimal import Decimal
 from fractions import Fraction
 import pytest
 
-from datetime2.western import GregorianCalendar
+from datetime2 import western
+from datetime2.western import GregorianCalendar, set_lookup_years
 
 
 INF = float('inf')
@@ -330,6 +331,107 @@ def test_09_constructor_rata_die():
             GregorianCalendar.from_rata_die(par)
 
 
+def test_11_constructor_rata_die_lookup_table():
+    def dates_in(day_counts):
+        return [(greg.year, greg.month, greg.day, greg.weekday(), greg.day_of_year())
+                for greg in map(GregorianCalendar.from_rata_die, day_counts)]
+
+    day_counts = list(range(-5000, 5000)) + list(range(GregorianCalendar(1899, 12, 1).to_rata_die(),
+                                                       GregorianCalendar(2201, 2, 1).to_rata_die()))
+    try:
+        set_lookup_years(None, None)
+        computed = dates_in(day_counts)
+        for first_year, last_year in ((1970, 2100), (1900, 2200), (2000, 2000), (-10, 10)):
+            set_lookup_years(first_year, last_year)
+            assert dates_in(day_counts) == computed
+        # invalid ranges
+        for par in ((1970, None), (None, 2100), (1970.0, 2100), ("1970", "2100")):
+            with pytest.raises(TypeError):
+                set_lookup_years(*par)
+        with pytest.raises(ValueError):
+            set_lookup_years(2100, 1970)
+
+        # a table built for a range that has since been changed is not published
+        set_lookup_years(2000, 2000)
+        old_state = western._rata_die_table.state
+        set_lookup_years(1900, 1900)
+        new_state = western._rata_die_table.state
+        assert len(western._rata_die_table.build(old_state)) == 366
+        assert western._rata_die_table.state is new_state
+        assert str(GregorianCalendar.from_rata_die(GregorianCalendar(1900, 3, 1).to_rata_die())) == "1900-03-01"
+        assert western._rata_die_table.state[2] is not None
+    finally:
+        set_lookup_years(1970, 2100)
+
+
+def test_12_iter_month_year():
+    february = GregorianCalendar.iter_month(2024, 2)
+    assert len(february) == 29
+    assert [(greg.year, greg.month, greg.day) for greg in february] == [(2024, 2, day) for day in range(1, 30)]
+    assert february[-1].to_rata_die() == GregorianCalendar(2024, 2, 29).to_rata_die()
+    assert [greg.day for greg in february[::7]] == [1, 8, 15, 22, 29]
+    assert [greg.day for greg in reversed(february[:3])] == [3, 2, 1]
+    assert len(GregorianCalendar.iter_month(2100, 2)) == 28
+    assert len(GregorianCalendar.iter_month(2000, 2)) == 29
+    for year in (-586, 1, 1900, 2000, 2023, 2024):
+        days = GregorianCalendar.iter_year(year)
+        assert len(days) == GregorianCalendar.days_in_year(year)
+        first_day = GregorianCalendar(year, 1, 1).to_rata_die()
+        for rata_die, greg in enumerate(days, start=first_day):
+            expected = GregorianCalendar.from_rata_die(rata_die)
+            assert (greg.year, greg.month, greg.day) == (expected.year, expected.month, expected.day)
+            assert greg.to_rata_die() == rata_die
+            assert greg.day_of_year() == rata_die - first_day + 1
+        assert str(days[59]) == str(GregorianCalendar.year_day(year, 60))
+    assert [str(greg) for greg in GregorianCalendar.iter_year(2023)[-2:]] == ["2023-12-30", "2023-12-31"]
+
+    # the repr shows how the sequence is built
+    for days, expected in ((GregorianCalendar.iter_month(2024, 2), "datetime2.western.GregorianCalendar.iter_month(2024, 2)"),
+                           (GregorianCalendar.iter_year(-586), "datetime2.western.GregorianCalendar.iter_year(-586)"),
+                           (GregorianCalendar.iter_month(2024, 2)[3:10:2], "datetime2.western.GregorianCalendar.iter_year(2024)[34:41:2]"),
+                           (GregorianCalendar.iter_year(2023)[::-1], "datetime2.western.GregorianCalendar.iter_year(2023)[364::-1]"),
+                           (GregorianCalendar.iter_month(2024, 2)[5:5], "datetime2.western.GregorianCalendar.iter_year(2024)[0:0]")):
+        assert repr(days) == expected
+        assert [str(greg) for greg in eval(expected, {"datetime2": __import__("datetime2.western")})] == [str(greg) for greg in days]
+
+    class MyGregorian(GregorianCalendar):
+        pass
+    assert type(MyGregorian.iter_month(2024, 1)[0]) is MyGregorian
+
+    for year, month in ((2024.0, 1), (2024, "1"), (None, 1)):
+        with pytest.raises(TypeError):
+            GregorianCalendar.iter_month(year, month)
+    with pytest.raises(TypeError):
+        GregorianCalendar.iter_year(Decimal(2024))
+    for month in (0, 13):
+        with pytest.raises(ValueError):
+            GregorianCalendar.iter_month(2024, month)
+    with pytest.raises(IndexError):
+        GregorianCalendar.iter_month(2024, 4)[30]
+
+
+def test_10_constructor_rata_die_many():
+    np = pytest.importorskip("numpy")
+
+    # valid data, all days in a 400 years cycle and around day 1 included
+    day_counts = [test_row[0] for test_row in gregorian_test_data] + list(range(-146097, 146098))
+    years, months, days = GregorianCalendar.from_rata_die_many(day_counts)
+    assert years.dtype == months.dtype == days.dtype == np.int64
+    for day_count, year, month, day in zip(day_counts, years.tolist(), months.tolist(), days.tolist()):
+        greg_rd = GregorianCalendar.from_rata_die(day_count)
+        assert (greg_rd.year, greg_rd.month, greg_rd.day) == (year, month, day)
+    years, months, days = GregorianCalendar.from_rata_die_many(np.array([], dtype=np.int64))
+    assert len(years) == len(months) == len(days) == 0
+    # buffers are accepted
+    years, months, days = GregorianCalendar.from_rata_die_many(memoryview(np.array([1, 737109], dtype=np.int64)))
+    assert (years.tolist(), months.tolist(), days.tolist()) == ([1, 2019], [1, 2], [1, 19])
+
+    # exception with non integer values
+    for par in ([1.0], ["1"], [None]):
+        with pytest.raises(TypeError):
+            GregorianCalendar.from_rata_die_many(par)
+
+
 def test_20_attribute():
     greg = GregorianCalendar(1, 1, 1)
     with pytest.raises(AttributeError):
@@ -462,6 +564,83 @@ def test_32_cformat():
             greg.cformat(par)
 
 
+def test_33_cformat_many(monkeypatch):
+    np = pytest.importorskip("numpy")
+
+    day_counts = [test_row[0] for test_row in gregorian_test_data]
+    for format_string in ("%a %A %b %B %d %j %m %U %w %W %y %Y", "", "abc", "%", "%%%", "%k%d%", "{%d}'\"\\"):
+        expected = [GregorianCalendar.from_rata_die(day_count).cformat(format_string) for day_count in day_counts]
+        assert GregorianCalendar.cformat_many(format_string, day_counts) == expected
+        assert GregorianCalendar.cformat_many(format_string, np.array(day_counts, dtype=np.int64)) == expected
+    assert GregorianCalendar.cformat_many("%Y-%m-%d", []) == []
+    # names are shared, not copied
+    names = GregorianCalendar.cformat_many("%B", [1, 32, 33])
+    assert names == ["January", "February", "February"]
+    assert names[1] is names[2] is GregorianCalendar.name_months[1]
+    # weekdays do not need years, months and days
+    with monkeypatch.context() as patched:
+        patched.setattr(GregorianCalendar, "from_rata_die_many", None)
+        assert GregorianCalendar.cformat_many("%a %w", [1, 2]) == ["Mon 1", "Tue 2"]
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            GregorianCalendar.cformat_many(par, [1])
+    for par in ([1.0], ["1"], [None]):
+        with pytest.raises(TypeError):
+            GregorianCalendar.cformat_many("%Y", par)
+
+
+def test_34_cparse():
+    formats = ("%Y-%m-%d", "%Y%m%d", "%a %d %b %Y", "%A, %B %d, %Y", "%Y-%j", "%Y %W %w", "%Y %U %a",
+               "%Y-%m-%d %j %W %U %a %A %b %B %w", "{%Y}'\"\\%%%k%j")
+    for test_row in gregorian_test_data:
+        year, month, day = test_row[2]
+        greg = GregorianCalendar(year, month, day)
+        for format_string in formats:
+            parsed = GregorianCalendar.cparse(greg.cformat(format_string), format_string)
+            assert type(parsed) == GregorianCalendar
+            assert (parsed.year, parsed.month, parsed.day) == (year, month, day)
+    # missing month and day default to 1
+    parsed = GregorianCalendar.cparse("2024", "%Y")
+    assert (parsed.year, parsed.month, parsed.day) == (2024, 1, 1)
+    parsed = GregorianCalendar.cparse("2024-03", "%Y-%m")
+    assert (parsed.year, parsed.month, parsed.day) == (2024, 3, 1)
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            GregorianCalendar.cparse(par, "%Y")
+        with pytest.raises(TypeError):
+            GregorianCalendar.cparse("2024", par)
+    for string, format_string in (("2024-3-05", "%Y-%m-%d"), ("2024-03-05", "%Y/%m/%d"), ("24-03-05", "%Y-%m-%d"),
+                                  ("2024-03-05 ", "%Y-%m-%d"), ("2024-13-05", "%Y-%m-%d"), ("2023-02-29", "%Y-%m-%d"),
+                                  ("2024-367", "%Y-%j"), ("2024-000", "%Y-%j"), ("2024 60 1", "%Y %W %w"),
+                                  ("Tue 05 Mar 2024", "%A %d %b %Y"), ("Mon 05 Mar 2024", "%a %d %b %Y"),
+                                  ("2024-03-05 2024-03-06", "%Y-%m-%d %Y-%m-%d"), ("2024-03-05 066", "%Y-%m-%d %j"),
+                                  ("03-05", "%m-%d"), ("24-03-05", "%y-%m-%d")):
+        with pytest.raises(ValueError):
+            GregorianCalendar.cparse(string, format_string)
+
+
+def test_35_from_str():
+    for test_row in gregorian_test_data:
+        year, month, day = test_row[2]
+        parsed = GregorianCalendar.from_str(str(GregorianCalendar(year, month, day)))
+        assert type(parsed) == GregorianCalendar
+        assert (parsed.year, parsed.month, parsed.day) == (year, month, day)
+    parsed = GregorianCalendar.from_str("12345-06-07")
+    assert (parsed.year, parsed.month, parsed.day) == (12345, 6, 7)
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            GregorianCalendar.from_str(par)
+    for par in ("", "2024-3-05", "2024/03/05", "2024-03-05T", "+2024-03-05", "２０２４-03-05", "2024-02-30"):
+        with pytest.raises(ValueError):
+            GregorianCalendar.from_str(par)
+
+
 def test_50_to_rata_die():
     for test_row in gregorian_test_data:
         year = test_row[2][0]
@@ -563,3 +742,25 @@ def test_53_day_of_year():
         doy = test_row[3]
         assert GregorianCalendar(year, month, day).day_of_year() == doy
 
+
+def test_54_to_rata_die_many():
+    np = pytest.importorskip("numpy")
+
+    years = [test_row[2][0] for test_row in gregorian_test_data]
+    months = [test_row[2][1] for test_row in gregorian_test_data]
+    days = [test_row[2][2] for test_row in gregorian_test_data]
+    day_counts = GregorianCalendar.to_rata_die_many(years, months, days)
+    assert day_counts.dtype == np.int64
+    assert day_counts.tolist() == [test_row[0] for test_row in gregorian_test_data]
+    # round trip on all days of a 400 years cycle
+    all_day_counts = np.arange(-146097, 146098)
+    assert (GregorianCalendar.to_rata_die_many(*GregorianCalendar.from_rata_die_many(all_day_counts)) == all_day_counts).all()
+
+    # invalid values
+    for year, month, day in ((1, 0, 1), (1, 13, 1), (1, 1, 0), (1, 1, 32), (1, 2, 29), (100, 2, 29), (4, 2, 30)):
+        with pytest.raises(ValueError):
+            GregorianCalendar.to_rata_die_many([2000, year], [1, month], [1, day])
+    with pytest.raises(ValueError):
+        GregorianCalendar.to_rata_die_many([1, 2], [1], [1])
+    with pytest.raises(TypeError):
+        GregorianCalendar.to_rata_die_many([1.0], [1], [1])
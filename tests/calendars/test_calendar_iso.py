@@ -295,6 +295,23 @@ def test_09_constructor_rata_die():
             IsoCalendar.from_rata_die(par)
 
 
+def test_10_constructor_rata_die_many():
+    np = pytest.importorskip("numpy")
+
+    # valid data, all days in a 400 years cycle and around day 1 included
+    day_counts = [test_row[0] for test_row in iso_test_data] + list(range(-146097, 146098))
+    years, weeks, days = IsoCalendar.from_rata_die_many(day_counts)
+    assert years.dtype == weeks.dtype == days.dtype == np.int64
+    for day_count, year, week, day in zip(day_counts, years.tolist(), weeks.tolist(), days.tolist()):
+        iso_rd = IsoCalendar.from_rata_die(day_count)
+        assert (iso_rd.year, iso_rd.week, iso_rd.day) == (year, week, day)
+
+    # exception with non integer values
+    for par in ([1.0], ["1"], [None]):
+        with pytest.raises(TypeError):
+            IsoCalendar.from_rata_die_many(par)
+
+
 def test_20_attribute():
     iso = IsoCalendar(1, 1, 1)
     with pytest.raises(AttributeError):
@@ -414,6 +431,29 @@ def test_50_to_rata_die():
         assert IsoCalendar(year, week, day).to_rata_die() == rd
 
 
+def test_52_to_rata_die_many():
+    np = pytest.importorskip("numpy")
+
+    years = [test_row[1] for test_row in iso_test_data]
+    weeks = [test_row[2] for test_row in iso_test_data]
+    days = [test_row[3] for test_row in iso_test_data]
+    day_counts = IsoCalendar.to_rata_die_many(years, weeks, days)
+    assert day_counts.dtype == np.int64
+    assert day_counts.tolist() == [test_row[0] for test_row in iso_test_data]
+    # round trip on all days of a 400 years cycle
+    all_day_counts = np.arange(-146097, 146098)
+    assert (IsoCalendar.to_rata_die_many(*IsoCalendar.from_rata_die_many(all_day_counts)) == all_day_counts).all()
+
+    # invalid values
+    for year, week, day in ((1, 0, 1), (1, 53, 1), (4, 54, 1), (4, 1, 0), (4, 1, 8)):
+        with pytest.raises(ValueError):
+            IsoCalendar.to_rata_die_many([2000, year], [1, week], [1, day])
+    with pytest.raises(ValueError):
+        IsoCalendar.to_rata_die_many([1, 2], [1], [1])
+    with pytest.raises(TypeError):
+        IsoCalendar.to_rata_die_many([1.0], [1], [1])
+
+
 def test_51_replace():
     for test_row in iso_test_data[:33]:   # take Calendrical Calculations tests data only (other may make replace fail, as in the next tests method)
         year = test_row[1]
@@ -0,0 +1,463 @@
+# datetime2 package test
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import io
+import mmap
+import struct
+from fractions import Fraction
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from datetime2 import Date, Time, TimeDelta
+from datetime2.arrays import (
+    DATE_RECORD_FORMAT,
+    NAIVE_UTCOFFSET,
+    TIME_DTYPE,
+    TIME_RECORD_FORMAT,
+    TIMEDELTA_RECORD_FORMAT,
+    DateArray,
+    TimeArray,
+    TimeDeltaArray,
+    parse_date_chunks,
+    parse_dates,
+    parse_time_chunks,
+    parse_times,
+)
+from datetime2.western import GregorianCalendar
+
+
+date_array_test_data = (-1000000000, -2, -1, 0, 1, 2, 1000, 737109, 1000000000)
+
+
+#############################################################################
+# DateArray tests
+#
+def test_000_constructor():
+    dates = DateArray(date_array_test_data)
+    assert len(dates) == len(date_array_test_data)
+    assert dates.day_counts.dtype == np.int64
+    assert dates.day_counts.tolist() == list(date_array_test_data)
+    assert len(DateArray([])) == 0
+    # constructor copies input values
+    source = np.array([1, 2, 3], dtype=np.int64)
+    dates = DateArray(source)
+    source[0] = 42
+    assert dates[0] == Date(1)
+    # invalid values
+    for par in ([1.0, 2.0], ["1"], [[1, 2], [3, 4]]):
+        with pytest.raises((TypeError, ValueError)):
+            DateArray(par)
+
+
+def test_001_constructor_from_dates():
+    dates = DateArray.from_dates(Date(day_count) for day_count in date_array_test_data)
+    assert dates.day_counts.tolist() == list(date_array_test_data)
+    with pytest.raises(TypeError):
+        DateArray.from_dates([Date(1), 2])
+
+
+def test_002_numpy_conversion():
+    dates = DateArray(date_array_test_data)
+    assert np.asarray(dates).tolist() == list(date_array_test_data)
+    assert np.asarray(dates).dtype == np.int64
+    assert np.asarray(dates, dtype=np.float64).tolist() == [float(value) for value in date_array_test_data]
+    # the view of the array cannot be used to modify the DateArray
+    with pytest.raises(ValueError):
+        np.asarray(dates)[0] = 1
+    # as a consequence, a DateArray can be passed to functions accepting rata die arrays
+    assert GregorianCalendar.cformat_many("%Y-%m-%d", dates[4:7]) == ["0001-01-01", "0001-01-02", "0003-09-27"]
+
+
+def test_010_element_access():
+    dates = DateArray(date_array_test_data)
+    for index, day_count in enumerate(date_array_test_data):
+        assert type(dates[index]) == Date
+        assert dates[index] == Date(day_count)
+        assert type(dates[index].day_count) == int
+    assert dates[-1] == Date(date_array_test_data[-1])
+    assert list(dates) == [Date(day_count) for day_count in date_array_test_data]
+    with pytest.raises(IndexError):
+        dates[len(date_array_test_data)]
+    # slicing and fancy indexing return DateArray instances
+    assert isinstance(dates[2:5], DateArray)
+    assert dates[2:5].day_counts.tolist() == list(date_array_test_data[2:5])
+    assert dates[::-1].day_counts.tolist() == list(date_array_test_data[::-1])
+    assert dates[dates.day_counts > 0].day_counts.tolist() == [day_count for day_count in date_array_test_data if day_count > 0]
+    # raw buffer is read-only from the outside
+    with pytest.raises(ValueError):
+        dates.day_counts[0] = 3
+
+
+def test_011_element_assignment():
+    dates = DateArray([1, 2, 3])
+    dates[0] = Date(10)
+    dates[1:] = DateArray([20, 30])
+    assert dates.day_counts.tolist() == [10, 20, 30]
+    with pytest.raises(TypeError):
+        dates[0] = 4
+
+
+def test_020_operations():
+    dates = DateArray(date_array_test_data)
+    for delta in (-3, 0, 5):
+        shifted = dates + TimeDelta(delta)
+        assert isinstance(shifted, DateArray)
+        assert shifted.day_counts.tolist() == [day_count + delta for day_count in date_array_test_data]
+        assert (TimeDelta(delta) + dates).day_counts.tolist() == shifted.day_counts.tolist()
+        assert (dates - TimeDelta(delta)).day_counts.tolist() == [day_count - delta for day_count in date_array_test_data]
+    with pytest.raises(ValueError):
+        dates + TimeDelta(1, 2)
+    with pytest.raises(ValueError):
+        dates - TimeDelta(1, 2)
+    assert (dates - Date(1)).tolist() == [day_count - 1 for day_count in date_array_test_data]
+    assert (Date(1) - dates).tolist() == [1 - day_count for day_count in date_array_test_data]
+    assert (dates - dates).tolist() == [0] * len(date_array_test_data)
+    with pytest.raises(TypeError):
+        dates + 1
+    with pytest.raises(TypeError):
+        dates - 1
+    with pytest.raises(TypeError):
+        TimeDelta(1) - dates
+
+
+def test_030_comparisons():
+    dates = DateArray(date_array_test_data)
+    pivot = Date(1)
+    assert (dates == pivot).tolist() == [day_count == 1 for day_count in date_array_test_data]
+    assert (dates != pivot).tolist() == [day_count != 1 for day_count in date_array_test_data]
+    assert (dates < pivot).tolist() == [day_count < 1 for day_count in date_array_test_data]
+    assert (dates <= pivot).tolist() == [day_count <= 1 for day_count in date_array_test_data]
+    assert (dates > pivot).tolist() == [day_count > 1 for day_count in date_array_test_data]
+    assert (dates >= pivot).tolist() == [day_count >= 1 for day_count in date_array_test_data]
+    # with the date on the left, the array comparisons are used
+    assert (pivot == dates).tolist() == (dates == pivot).tolist()
+    assert (pivot != dates).tolist() == (dates != pivot).tolist()
+    assert (pivot < dates).tolist() == (dates > pivot).tolist()
+    assert (pivot <= dates).tolist() == (dates >= pivot).tolist()
+    assert (pivot > dates).tolist() == (dates < pivot).tolist()
+    assert (pivot >= dates).tolist() == (dates <= pivot).tolist()
+    reversed_dates = dates[::-1]
+    assert (dates < reversed_dates).tolist() == [a < b for a, b in zip(date_array_test_data, date_array_test_data[::-1])]
+    assert dates != 1
+    with pytest.raises(TypeError):
+        dates < 1
+    with pytest.raises(TypeError):
+        hash(dates)
+
+
+def test_040_sorting():
+    unsorted_data = [5, -3, 1000, 0, 5, -1000000]
+    dates = DateArray(unsorted_data)
+    assert dates.sorted().day_counts.tolist() == sorted(unsorted_data)
+    assert dates.day_counts.tolist() == unsorted_data
+    assert [unsorted_data[index] for index in dates.argsort()] == sorted(unsorted_data)
+    dates.sort()
+    assert dates.day_counts.tolist() == sorted(unsorted_data)
+
+
+def test_050_from_buffer():
+    buffer = bytearray(struct.pack("<" + DATE_RECORD_FORMAT[1:] * len(date_array_test_data), *date_array_test_data))
+    dates = DateArray.from_buffer(buffer)
+    assert list(dates) == [Date(day_count) for day_count in date_array_test_data]
+    assert dates.to_bytes() == bytes(buffer)
+    assert DateArray(date_array_test_data).to_bytes() == bytes(buffer)
+    # the buffer is shared, not copied
+    dates[0] = Date(42)
+    assert struct.unpack_from(DATE_RECORD_FORMAT, buffer)[0] == 42
+    assert DateArray.from_buffer(buffer, offset=8, count=2).day_counts.tolist() == list(date_array_test_data[1:3])
+    # read-only buffers give read-only arrays
+    with pytest.raises(ValueError):
+        DateArray.from_buffer(bytes(buffer))[0] = Date(1)
+    with pytest.raises(TypeError):
+        DateArray.from_buffer("abc")
+    with pytest.raises(ValueError):
+        DateArray.from_buffer(b"1234567")
+
+
+def test_051_from_mmap(tmp_path):
+    path = tmp_path / "dates.bin"
+    path.write_bytes(DateArray(range(737000, 738000)).to_bytes())
+    with open(path, "r+b") as file:
+        with mmap.mmap(file.fileno(), 0) as mapped_file:
+            dates = DateArray.from_buffer(mapped_file)
+            assert len(dates) == 1000
+            assert dates[999] == Date(737999)
+            dates[0] = Date(1)
+            del dates
+    assert path.read_bytes()[:8] == struct.pack(DATE_RECORD_FORMAT, 1)
+
+
+#############################################################################
+# TimeArray tests
+#
+time_array_nanoseconds = [0, 1, 43_200_000_000_000, 86_399_999_999_999]
+time_array_utcoffsets = [NAIVE_UTCOFFSET, 0, -3_600_000_000_000, 86_400_000_000_000]
+
+
+def test_060_time_array():
+    naive_times = TimeArray(time_array_nanoseconds)
+    assert list(naive_times) == [Time.from_nanoseconds(ns) for ns in time_array_nanoseconds]
+    assert all(time_obj.utcoffset is None for time_obj in naive_times)
+    times = TimeArray(time_array_nanoseconds, time_array_utcoffsets)
+    expected = [Time.from_nanoseconds(time_array_nanoseconds[0])]
+    expected += [Time.from_nanoseconds(ns, utcoffset=Fraction(offset, 86_400_000_000_000))
+                 for ns, offset in zip(time_array_nanoseconds[1:], time_array_utcoffsets[1:])]
+    assert len(times) == 4
+    for index, time_obj in enumerate(expected):
+        assert times[index] == time_obj
+        assert times[index].utcoffset == time_obj.utcoffset
+    assert [time_obj.utcoffset for time_obj in times] == [time_obj.utcoffset for time_obj in expected]
+    assert isinstance(times[1:3], TimeArray)
+    assert times[1:3].nanoseconds.tolist() == time_array_nanoseconds[1:3]
+    assert times.utcoffsets.tolist() == time_array_utcoffsets
+    assert np.asarray(times).dtype == TIME_DTYPE
+    with pytest.raises(ValueError):
+        times.nanoseconds[0] = 1
+    assert TimeArray.from_times(expected).to_bytes() == times.to_bytes()
+    assert eval(repr(times), {"datetime2": __import__("datetime2.arrays")}).to_bytes() == times.to_bytes()
+    times[0] = Time(Fraction(1, 2), utcoffset=Fraction(1, 24))
+    assert times.nanoseconds[0] == 43_200_000_000_000
+    assert times.utcoffsets[0] == 3_600_000_000_000
+
+    for nanoseconds, utcoffsets in (([-1], None), ([86_400_000_000_000], None), ([0], [86_400_000_000_001]), ([0, 1], [0])):
+        with pytest.raises(ValueError):
+            TimeArray(nanoseconds, utcoffsets)
+    with pytest.raises(ValueError):
+        TimeArray.from_times([Time(Fraction(1, 7))])
+    with pytest.raises(TypeError):
+        TimeArray.from_times([Date(1)])
+    with pytest.raises(TypeError):
+        times[0] = Date(1)
+
+
+def test_061_time_array_from_buffer():
+    records = [(43_200_000_000_000, 3_600_000_000_000), (1, NAIVE_UTCOFFSET), (-1, 0)]
+    buffer = bytearray(b"".join(struct.pack(TIME_RECORD_FORMAT, *record) for record in records))
+    times = TimeArray.from_buffer(buffer)
+    assert times[0] == Time(Fraction(1, 2), utcoffset=Fraction(1, 24))
+    assert times[1].utcoffset is None
+    # records from other systems are verified when they are accessed
+    with pytest.raises(ValueError):
+        times[2]
+    assert times.nanoseconds.min() == -1
+    times[2] = Time(0)
+    assert struct.unpack_from(TIME_RECORD_FORMAT, buffer, 32) == (0, NAIVE_UTCOFFSET)
+    assert TimeArray.from_buffer(buffer, offset=16, count=1).nanoseconds.tolist() == [1]
+    with pytest.raises(ValueError):
+        TimeArray.from_buffer(buffer[:-1])
+
+
+#############################################################################
+# Streaming parsers
+#
+iso_lines = (b"2024-03-05T12:34:56.123456789 first line\n"
+             b"\n"
+             b"0001-01-01T00:00:00.000000000 second line\r\n"
+             b"9999-12-31T23:59:59.999999999")
+
+
+def test_070_timedelta_array():
+    nanoseconds = [86_400_000_000_000, -21_600_000_000_000, 1, 0]
+    timedeltas = TimeDeltaArray(nanoseconds)
+    expected = [TimeDelta(1), TimeDelta(Fraction(-1, 4)), TimeDelta(Fraction(1, 86_400_000_000_000)), TimeDelta(0)]
+    assert len(timedeltas) == 4
+    assert list(timedeltas) == expected
+    assert [timedeltas[index] for index in range(4)] == expected
+    assert isinstance(timedeltas[1:3], TimeDeltaArray)
+    assert timedeltas[1:3].nanoseconds.tolist() == nanoseconds[1:3]
+    assert np.asarray(timedeltas).tolist() == nanoseconds
+    with pytest.raises(ValueError):
+        timedeltas.nanoseconds[0] = 1
+    assert TimeDeltaArray.from_timedeltas(expected).to_bytes() == struct.pack("<4q", *nanoseconds)
+    assert eval(repr(timedeltas), {"datetime2": __import__("datetime2.arrays")}).to_bytes() == timedeltas.to_bytes()
+    timedeltas[3] = TimeDelta(Fraction(1, 24))
+    assert timedeltas.nanoseconds[3] == 3_600_000_000_000
+
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_timedeltas([TimeDelta(Fraction(1, 7))])
+    with pytest.raises(TypeError):
+        TimeDeltaArray.from_timedeltas([Date(1)])
+    with pytest.raises(TypeError):
+        timedeltas[0] = Date(1)
+
+
+def test_071_timedelta_array_from_buffer():
+    nanoseconds = [86_400_000_000_000, -21_600_000_000_000, 1, 0]
+    buffer = bytearray(b"".join(struct.pack(TIMEDELTA_RECORD_FORMAT, value) for value in nanoseconds))
+    timedeltas = TimeDeltaArray.from_buffer(buffer)
+    assert timedeltas.nanoseconds.tolist() == nanoseconds
+    assert TimeDeltaArray.from_buffer(timedeltas.to_bytes()).nanoseconds.tolist() == nanoseconds
+    # the array is a view of the buffer
+    timedeltas[3] = TimeDelta(Fraction(1, 24))
+    assert struct.unpack_from(TIMEDELTA_RECORD_FORMAT, buffer, 24) == (3_600_000_000_000,)
+    assert TimeDeltaArray.from_buffer(buffer, offset=8, count=2).nanoseconds.tolist() == [-21_600_000_000_000, 1]
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_buffer(bytes(buffer))[0] = TimeDelta(1)
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_buffer(b"1234567")
+
+
+def test_080_datetime64_conversions():
+    datetimes = np.array(["1970-01-01", "2024-02-29", "0001-01-01", "1969-12-31"], dtype="datetime64[D]")
+    dates = DateArray.from_datetime64(datetimes)
+    assert dates.day_counts.tolist() == [719163, Date.gregorian(2024, 2, 29).day_count, 1, 719162]
+    assert (dates.to_datetime64() == datetimes).all()
+    assert dates.to_datetime64().dtype == np.dtype("datetime64[D]")
+    assert DateArray.from_datetime64(np.array(["2024-02"], dtype="datetime64[M]")).day_counts.tolist() == [738917]
+    assert DateArray.from_datetime64(np.array([1], dtype="datetime64[W]")).day_counts.tolist() == [719170]
+    assert len(DateArray.from_datetime64(np.array([], dtype="datetime64[D]"))) == 0
+    # timestamps are rounded to dates only when asked
+    timestamps = np.array(["2024-02-29T23:00", "1969-12-31T12:00", "2000-01-01T00:00"], dtype="datetime64[m]")
+    expected = {
+        "floor": ["2024-02-29", "1969-12-31", "2000-01-01"],
+        "ceiling": ["2024-03-01", "1970-01-01", "2000-01-01"],
+        "half_even": ["2024-03-01", "1970-01-01", "2000-01-01"],
+    }
+    for rounding, results in expected.items():
+        assert DateArray.from_datetime64(timestamps, rounding=rounding).to_datetime64().astype(str).tolist() == results
+    assert DateArray.from_datetime64(timestamps[2:]).day_counts.tolist() == [730120]
+
+    with pytest.raises(ValueError):
+        DateArray.from_datetime64(timestamps)
+    with pytest.raises(ValueError):
+        DateArray.from_datetime64(timestamps, rounding="round")
+    with pytest.raises(ValueError):
+        DateArray.from_datetime64(np.array(["NaT"], dtype="datetime64[D]"))
+    with pytest.raises(ValueError):
+        DateArray([-(2**63)]).to_datetime64()
+    for values in ([1, 2], np.array([1], dtype="timedelta64[D]"), np.array(["NaT"], dtype="datetime64")[:0]):
+        with pytest.raises(TypeError):
+            DateArray.from_datetime64(values)
+
+
+def test_081_timedelta64_conversions():
+    times = TimeArray.from_timedelta64(np.array([0, 3600, 86399], dtype="timedelta64[s]"),
+                                       np.array(["NaT", 3_600_000, -18_000_000], dtype="timedelta64[ms]"))
+    assert times.nanoseconds.tolist() == [0, 3_600_000_000_000, 86_399_000_000_000]
+    assert times.utcoffsets.tolist() == [NAIVE_UTCOFFSET, 3_600_000_000_000, -18_000_000_000_000]
+    nanoseconds, utcoffsets = times.to_timedelta64()
+    assert nanoseconds.dtype == utcoffsets.dtype == np.dtype("timedelta64[ns]")
+    assert nanoseconds.astype(np.int64).tolist() == [0, 3_600_000_000_000, 86_399_000_000_000]
+    assert np.isnat(utcoffsets).tolist() == [True, False, False]
+    assert TimeArray.from_timedelta64(nanoseconds, utcoffsets).to_bytes() == times.to_bytes()
+    assert TimeArray.from_timedelta64(nanoseconds).utcoffsets.tolist() == [NAIVE_UTCOFFSET] * 3
+    # values finer than a nanosecond
+    picoseconds = np.array([1500, 2500, 86_399_999_999_999_999], dtype="timedelta64[ps]")
+    assert TimeArray.from_timedelta64(picoseconds, rounding="floor").nanoseconds.tolist() == [1, 2, 86_399_999_999_999]
+    assert TimeArray.from_timedelta64(picoseconds, rounding="half_even").nanoseconds.tolist() == [2, 2, 0]
+    assert TimeArray.from_times([Time(Fraction(1, 7))], rounding="ceiling").nanoseconds.tolist() == [12_342_857_142_858]
+    assert TimeArray.from_times([Time(0, utcoffset=Fraction(1, 7))], rounding="floor").utcoffsets.tolist() == [12_342_857_142_857]
+
+    timedeltas = TimeDeltaArray.from_timedelta64(np.array([1, -1, 3], dtype="timedelta64[D]"))
+    assert list(timedeltas) == [TimeDelta(1), TimeDelta(-1), TimeDelta(3)]
+    assert timedeltas.to_timedelta64().astype(np.int64).tolist() == [86_400_000_000_000, -86_400_000_000_000, 259_200_000_000_000]
+    picoseconds = np.array([1500, 2500, -1500, -2500], dtype="timedelta64[ps]")
+    assert TimeDeltaArray.from_timedelta64(picoseconds, rounding="floor").nanoseconds.tolist() == [1, 2, -2, -3]
+    assert TimeDeltaArray.from_timedelta64(picoseconds, rounding="ceiling").nanoseconds.tolist() == [2, 3, -1, -2]
+    assert TimeDeltaArray.from_timedelta64(picoseconds, rounding="half_even").nanoseconds.tolist() == [2, 2, -2, -2]
+    assert TimeDeltaArray.from_timedeltas([TimeDelta(Fraction(-1, 7))], rounding="half_even").nanoseconds.tolist() == [-12_342_857_142_857]
+
+    with pytest.raises(ValueError):
+        TimeArray.from_timedelta64(picoseconds[:1])
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_timedelta64(picoseconds)
+    for values in (np.array([-1], dtype="timedelta64[ns]"), np.array([1], dtype="timedelta64[D]"), np.array(["NaT"], dtype="timedelta64[ns]")):
+        with pytest.raises(ValueError):
+            TimeArray.from_timedelta64(values)
+    with pytest.raises(ValueError):
+        TimeArray.from_timedelta64(np.array([0], dtype="timedelta64[ns]"), np.array([2], dtype="timedelta64[D]"))
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_timedelta64(np.array([2**62], dtype="timedelta64[s]"))
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_timedelta64(np.array(["NaT"], dtype="timedelta64[ns]"))
+    with pytest.raises(ValueError):
+        TimeDeltaArray([-(2**63)]).to_timedelta64()
+    with pytest.raises(ValueError):
+        TimeDeltaArray.from_timedeltas([TimeDelta(1)], rounding="up")
+    for values in ([1], np.array([1], dtype="datetime64[D]"), np.array([1], dtype="timedelta64[Y]")):
+        with pytest.raises(TypeError):
+            TimeDeltaArray.from_timedelta64(values)
+        with pytest.raises(TypeError):
+            TimeArray.from_timedelta64(values)
+
+
+def test_100_parse_dates():
+    expected = [GregorianCalendar(2024, 3, 5).to_rata_die(), 1, GregorianCalendar(9999, 12, 31).to_rata_die()]
+    for chunk_size in (1, 7, 50, 1 << 20):
+        for source in (iso_lines, bytearray(iso_lines), memoryview(iso_lines), io.BytesIO(iso_lines)):
+            chunks = list(parse_date_chunks(source, chunk_size=chunk_size))
+            assert all(type(chunk) is DateArray and len(chunk) > 0 for chunk in chunks)
+            assert [day_count for chunk in chunks for day_count in chunk.day_counts.tolist()] == expected
+        assert [date.day_count for date in parse_dates(iso_lines, chunk_size=chunk_size)] == expected
+    assert [date.day_count for date in parse_dates(b"x;2024-03-05\n", start=2)] == expected[:1]
+    assert list(parse_dates(b"")) == []
+
+    # invalid data
+    for par in ("2024-03-05", 2024, None, io.StringIO("2024-03-05")):
+        with pytest.raises(TypeError):
+            list(parse_dates(par))
+    for par in (b"2024-13-05", b"2023-02-29", b"2024-03-00", b"2024-03-0x", b"2024/03/05", b"2024-03-5\n",
+                b"-024-03-05", b"2024-03-05\n2024-03"):
+        with pytest.raises(ValueError):
+            list(parse_dates(par))
+    with pytest.raises(ValueError):
+        list(parse_dates(iso_lines, start=-1))
+    with pytest.raises(ValueError):
+        list(parse_dates(iso_lines, chunk_size=0))
+
+
+def test_101_parse_times():
+    day_ns = [45_296_123_456_789, 0, 86_399_999_999_999]
+    for chunk_size in (1, 7, 50, 1 << 20):
+        for source in (iso_lines, memoryview(iso_lines), io.BytesIO(iso_lines)):
+            chunks = list(parse_time_chunks(source, start=11, fraction_digits=9, chunk_size=chunk_size))
+            assert all(type(chunk) is TimeArray for chunk in chunks)
+            assert all((chunk.utcoffsets == NAIVE_UTCOFFSET).all() for chunk in chunks)
+            assert [value for chunk in chunks for value in chunk.nanoseconds.tolist()] == day_ns
+    for fraction_digits in range(10):
+        expected = [value - value % 10 ** (9 - fraction_digits) for value in day_ns]
+        times = list(parse_times(iso_lines, start=11, fraction_digits=fraction_digits))
+        assert all(type(time) is Time and time.utcoffset is None for time in times)
+        assert times == [Time.from_nanoseconds(value) for value in expected]
+
+    # invalid data
+    for par in ("12:34:56", 123456, None):
+        with pytest.raises(TypeError):
+            list(parse_times(par))
+    for par in (b"24:00:00", b"12:60:00", b"12:34:60", b"12:34:5x", b"12-34-56", b"12:34:5"):
+        with pytest.raises(ValueError):
+            list(parse_times(par))
+    with pytest.raises(ValueError):
+        list(parse_times(b"12:34:56,123", fraction_digits=3))
+    for par in (-1, 10):
+        with pytest.raises(ValueError):
+            list(parse_times(b"12:34:56", fraction_digits=par))
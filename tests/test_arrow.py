@@ -0,0 +1,132 @@
+# datetime2 package test
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import datetime
+from fractions import Fraction
+import pytest
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+from datetime2 import Date, Time, TimeDelta
+from datetime2.arrays import NAIVE_UTCOFFSET, DateArray, TimeArray, TimeDeltaArray
+from datetime2.arrow import UNIX_EPOCH_DAY_COUNT, from_arrow, to_arrow
+
+
+def test_000_dates():
+    assert Date.gregorian(1970, 1, 1).day_count == UNIX_EPOCH_DAY_COUNT
+    day_counts = [1, UNIX_EPOCH_DAY_COUNT - 1, UNIX_EPOCH_DAY_COUNT, 738000, 3652059]
+    arrow_dates = to_arrow(DateArray(day_counts))
+    assert arrow_dates.type == pa.date32()
+    assert arrow_dates.to_pylist() == [datetime.date.fromordinal(day_count) for day_count in day_counts]
+    dates = from_arrow(arrow_dates)
+    assert isinstance(dates, DateArray)
+    assert dates.day_counts.tolist() == day_counts
+    dates[0] = Date(2)
+    assert dates.day_counts[0] == 2
+    assert from_arrow(arrow_dates.slice(2, 2)).day_counts.tolist() == day_counts[2:4]
+    chunked = pa.chunked_array([arrow_dates.slice(0, 2), arrow_dates.slice(2)])
+    assert from_arrow(chunked).day_counts.tolist() == day_counts
+    assert from_arrow(pa.array([-86_400_000, 0], pa.date64())).day_counts.tolist() == [719162, 719163]
+    assert len(from_arrow(to_arrow(DateArray([])))) == 0
+
+    with pytest.raises(ValueError):
+        to_arrow(DateArray([UNIX_EPOCH_DAY_COUNT + 2**31]))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([1, None], pa.date32()))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([1], pa.date64()))
+
+
+def test_010_times():
+    nanoseconds = [0, 43_200_000_000_000, 86_399_999_999_999]
+    utcoffsets = [NAIVE_UTCOFFSET, 3_600_000_000_000, -86_400_000_000_000]
+    arrow_times = to_arrow(TimeArray(nanoseconds, utcoffsets))
+    assert arrow_times.type == pa.struct([("time", pa.time64("ns")), ("utcoffset", pa.duration("ns"))])
+    assert arrow_times.field("time").cast(pa.int64()).to_pylist() == nanoseconds
+    assert arrow_times.field("utcoffset").cast(pa.int64()).to_pylist() == [None] + utcoffsets[1:]
+    times = from_arrow(arrow_times)
+    assert isinstance(times, TimeArray)
+    assert times.nanoseconds.tolist() == nanoseconds
+    assert times.utcoffsets.tolist() == utcoffsets
+    assert times[1].utcoffset == Fraction(1, 24)
+    assert from_arrow(arrow_times.slice(1)).utcoffsets.tolist() == utcoffsets[1:]
+    naive_times = to_arrow(TimeArray(nanoseconds))
+    assert naive_times.field("utcoffset").null_count == 3
+
+    # other units and layouts
+    assert from_arrow(pa.array([1, 2], pa.time32("s"))).nanoseconds.tolist() == [1_000_000_000, 2_000_000_000]
+    assert from_arrow(pa.array([3], pa.time64("us"))).nanoseconds.tolist() == [3000]
+    assert list(from_arrow(pa.array([0], pa.time32("ms")))) == [Time(0)]
+    struct_s = pa.StructArray.from_arrays([pa.array([1], pa.time32("s")), pa.array([-3600], pa.duration("s"))],
+                                          names=["time", "utcoffset"])
+    assert from_arrow(struct_s)[0] == Time(Fraction(1, 86_400), utcoffset=Fraction(-1, 24))
+    struct_time_only = pa.StructArray.from_arrays([pa.array([5], pa.time64("ns"))], names=["time"])
+    assert from_arrow(struct_time_only).utcoffsets.tolist() == [NAIVE_UTCOFFSET]
+
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([1, None], pa.time64("ns")))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([86_400_000_000_000], pa.time64("ns")))
+    with pytest.raises(TypeError):
+        from_arrow(pa.StructArray.from_arrays([pa.array([5])], names=["time"]))
+    with pytest.raises(TypeError):
+        from_arrow(pa.StructArray.from_arrays([pa.array([5], pa.time64("ns")), pa.array([1])],
+                                              names=["time", "utcoffset"]))
+
+
+def test_020_timedeltas():
+    nanoseconds = [86_400_000_000_000, -21_600_000_000_000, 1, -(2**63) + 1]
+    arrow_timedeltas = to_arrow(TimeDeltaArray(nanoseconds))
+    assert arrow_timedeltas.type == pa.duration("ns")
+    assert arrow_timedeltas.cast(pa.int64()).to_pylist() == nanoseconds
+    timedeltas = from_arrow(arrow_timedeltas)
+    assert isinstance(timedeltas, TimeDeltaArray)
+    assert timedeltas.nanoseconds.tolist() == nanoseconds
+    assert timedeltas[1] == TimeDelta(Fraction(-1, 4))
+    timedeltas[0] = TimeDelta(0)
+    assert from_arrow(pa.array([2, -3], pa.duration("ms"))).nanoseconds.tolist() == [2_000_000, -3_000_000]
+
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([2**62], pa.duration("s")))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([None], pa.duration("ns")))
+
+
+def test_030_invalid_types():
+    with pytest.raises(TypeError):
+        to_arrow([Date(1)])
+    with pytest.raises(TypeError):
+        from_arrow([1, 2])
+    with pytest.raises(TypeError):
+        from_arrow(pa.array([1, 2]))
+    with pytest.raises(TypeError):
+        from_arrow(pa.array([0], pa.timestamp("ns")))
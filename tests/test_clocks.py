@@ -0,0 +1,104 @@
+# datetime2 package test
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import time
+from fractions import Fraction
+import pytest
+
+import datetime2
+from datetime2 import Date, Time, get_clock_source, set_clock_source
+from datetime2.clocks import CoarseClock, FakeClock, MonotonicClock, SystemClock
+
+
+@pytest.fixture
+def fake_clock():
+    clock = FakeClock()
+    previous_source = set_clock_source(clock)
+    yield clock
+    set_clock_source(previous_source)
+
+
+#############################################################################
+# Clock sources
+#
+def test_000_default_clock_source():
+    assert isinstance(get_clock_source(), SystemClock)
+    assert abs(SystemClock().time_ns() - time.time_ns()) < 1_000_000_000
+
+
+def test_010_fake_clock(fake_clock):
+    assert get_clock_source() is fake_clock
+    # 2024-05-01 12:00 UTC
+    fake_clock.set(1_714_564_800_000_000_000)
+    assert Time.utcnow().day_frac == Fraction(1, 2)
+    assert Time.now(utcoffset=Fraction(1, 24)).day_frac == Fraction(13, 24)
+    fake_clock.advance(43_200_000_000_000)
+    assert Time.utcnow().day_frac == 0
+    day_count, day_frac, utcoffset = datetime2.get_moment_complete()
+    assert Date.today().day_count == day_count
+    assert Time.now().day_frac == day_frac
+    assert Time.now().utcoffset == utcoffset
+    assert (day_frac - utcoffset) % 1 == 0
+    with pytest.raises(TypeError):
+        fake_clock.set(1.5)
+    with pytest.raises(TypeError):
+        set_clock_source(object())
+
+
+def test_020_coarse_clock():
+    with CoarseClock(tick=0.001) as clock:
+        first_ns = clock.time_ns()
+        assert abs(first_ns - time.time_ns()) < 1_000_000_000
+        time.sleep(0.05)
+        assert clock.time_ns() > first_ns
+        previous_source = set_clock_source(clock)
+        try:
+            assert Time.utcnow().day_frac * 86400 == pytest.approx(time.time() % 86400, abs=1)
+        finally:
+            set_clock_source(previous_source)
+    assert not clock._thread.is_alive()
+    for tick, exception in (("1", TypeError), (0, ValueError), (-1, ValueError)):
+        with pytest.raises(exception):
+            CoarseClock(tick)
+
+
+def test_030_monotonic_clock():
+    clock = MonotonicClock(resync=0.01)
+    values = [clock.time_ns() for _ in range(1000)]
+    assert values == sorted(values)
+    assert abs(values[-1] - time.time_ns()) < 1_000_000_000
+    deadline, offset = clock._offset_state
+    time.sleep(0.02)
+    clock.time_ns()
+    assert clock._offset_state[0] > deadline
+    for resync, exception in (("1", TypeError), (0, ValueError), (-1, ValueError)):
+        with pytest.raises(exception):
+            MonotonicClock(resync)
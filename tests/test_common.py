@@ -0,0 +1,249 @@
+# datetime2 package test
+
+# Copyright (c) 2026 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+from decimal import Decimal
+from fractions import Fraction
+import pytest
+
+from datetime2.common import (
+    InstancePool,
+    ValueCache,
+    compile_format,
+    fraction_to_rounded_nanoseconds,
+    range_validator,
+    verify_fractional_value,
+    verify_fractional_value_num_den,
+    verify_rounding,
+)
+
+
+#############################################################################
+# Fractional value verification
+#
+def test_000_verify_fractional_value():
+    for value, expected in ((3, Fraction(3)), (Fraction(1, 3), Fraction(1, 3)), ("1/3", Fraction(1, 3)),
+                            (0.25, Fraction(1, 4)), (Decimal("0.25"), Fraction(1, 4)), (True, Fraction(1))):
+        verified = verify_fractional_value(value)
+        assert type(verified) is Fraction
+        assert verified == expected
+    # exact fractions are not copied
+    fraction = Fraction(5, 7)
+    assert verify_fractional_value(fraction, min=0, max_excl=1) is fraction
+    assert verify_fractional_value(fraction, min=0, max_excl=1, strict=True) is fraction
+    # subclasses of Fraction are converted
+    class MyFraction(Fraction):
+        pass
+    verified = verify_fractional_value(MyFraction(5, 7))
+    assert type(verified) is Fraction
+    assert verified == fraction
+    # invalid values
+    for value in (None, "a", 1j, [1]):
+        with pytest.raises(TypeError):
+            verify_fractional_value(value)
+    for value in (float("inf"), float("nan")):
+        with pytest.raises(TypeError):
+            verify_fractional_value(value)
+    for value in (3, 0.25, "1/3"):
+        with pytest.raises(TypeError):
+            verify_fractional_value(value, strict=True)
+
+
+def test_001_verify_fractional_value_num_den():
+    assert verify_fractional_value_num_den(2, 4) == Fraction(1, 2)
+    assert verify_fractional_value_num_den(Fraction(1, 2), Fraction(3, 4), strict=True) == Fraction(2, 3)
+    with pytest.raises(ZeroDivisionError):
+        verify_fractional_value_num_den(1, 0)
+    with pytest.raises(TypeError):
+        verify_fractional_value_num_den(1, 2, strict=True)
+
+
+def test_002_rounded_nanoseconds():
+    nanosecond = Fraction(1, 86_400_000_000_000)
+    for rounding in (None, "floor", "ceiling", "half_even"):
+        assert verify_rounding(rounding) == rounding
+        assert fraction_to_rounded_nanoseconds(Fraction(1, 4), rounding) == 21_600_000_000_000
+        assert fraction_to_rounded_nanoseconds(-3 * nanosecond, rounding) == -3
+    assert fraction_to_rounded_nanoseconds(nanosecond / 3, None) is None
+    expected = {
+        "floor": (0, 1, 1, 2, -1, -2, -3),
+        "ceiling": (1, 2, 2, 3, 0, -1, -2),
+        "half_even": (0, 2, 1, 2, 0, -2, -2),
+    }
+    for rounding, results in expected.items():
+        for value, result in zip((Fraction(1, 3), Fraction(3, 2), Fraction(4, 3), Fraction(5, 2), Fraction(-1, 2), Fraction(-3, 2), Fraction(-5, 2)), results):
+            assert fraction_to_rounded_nanoseconds(value * nanosecond, rounding) == result
+    for rounding in ("round", "FLOOR", 0):
+        with pytest.raises(ValueError):
+            verify_rounding(rounding)
+
+
+def test_010_ranges():
+    for value_type in (int, Fraction):
+        assert verify_fractional_value(value_type(0), min=0, max_excl=1) == 0
+        with pytest.raises(ValueError):
+            verify_fractional_value(value_type(1), min=0, max_excl=1)
+        with pytest.raises(ValueError):
+            verify_fractional_value(value_type(-1), min=0, max_excl=1)
+        assert verify_fractional_value(value_type(1), min=-1, max=1) == 1
+        assert verify_fractional_value(value_type(-1), min=-1, max=1) == -1
+        with pytest.raises(ValueError):
+            verify_fractional_value(value_type(0), min_excl=0)
+        with pytest.raises(ValueError):
+            verify_fractional_value(value_type(2), max=1)
+    assert verify_fractional_value(Fraction(-2, 3), min=Fraction(-2, 3), max_excl=Fraction(1, 3)) == Fraction(-2, 3)
+    with pytest.raises(ValueError):
+        verify_fractional_value(Fraction(1, 3), min=Fraction(-2, 3), max_excl=Fraction(1, 3))
+    with pytest.raises(ValueError):
+        verify_fractional_value(Fraction(-7, 10), min=Fraction(-2, 3), max_excl=Fraction(1, 3))
+    # inconsistent conditions
+    with pytest.raises(RuntimeError):
+        verify_fractional_value(0, min=0, min_excl=0)
+    with pytest.raises(RuntimeError):
+        verify_fractional_value(0, max=0, max_excl=0)
+
+
+def test_011_range_validators_are_reused():
+    assert range_validator(0, None, None, 1) is range_validator(0, None, None, 1)
+    assert range_validator(0, None, None, 1) is not range_validator(-1, 1, None, None)
+    # equal bounds share the validator and its messages
+    validator = range_validator(max=True)
+    assert range_validator(max=1) is validator and range_validator(max=Fraction(1)) is validator
+    with pytest.raises(ValueError, match="less than or equal to 1$"):
+        validator(2)
+    assert range_validator(min_excl=Fraction(-2, 4)) is range_validator(min_excl=Fraction(-1, 2))
+
+
+#############################################################################
+# Value cache
+#
+def test_050_value_cache():
+    cache = ValueCache(maxsize=3)
+    first = object()
+    assert cache.get(1) is None
+    assert cache.setdefault(1, first) is first
+    # the first stored object is kept
+    assert cache.setdefault(1, object()) is first
+    assert cache.get(1) is first
+    # the oldest entry is discarded
+    for key in range(2, 5):
+        cache.setdefault(key, object())
+    assert len(cache) == 3
+    assert cache.get(1) is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_051_value_cache_with_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ValueCache(maxsize=64)
+
+    def fill(thread_index):
+        return [cache.setdefault(key % 200, (key % 200, thread_index)) for key in range(20000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(fill, range(8)))
+    for result in results:
+        assert all(value[0] == key % 200 for key, value in enumerate(result))
+    assert len(cache) <= cache.maxsize + 8
+
+
+def test_052_instance_pool():
+    pool = InstancePool()
+    assert pool.maxsize == 0
+    pool.resize(3)
+    first = object()
+    assert pool.get(1) is None
+    assert pool.setdefault(1, first) is first
+    assert pool.setdefault(1, object()) is first
+    assert pool.holds(1, first)
+    assert not pool.holds(2, first)
+    for key in (2, 3):
+        pool.setdefault(key, object())
+    # the least recently used entry is discarded
+    assert pool.get(1) is first
+    pool.setdefault(4, object())
+    assert pool.get(2) is None
+    assert pool.get(1) is first
+    assert len(pool) == 3
+    assert (pool.hits, pool.misses) == (2, 2)
+    pool.resize(1)
+    assert len(pool) == 1
+    assert pool.get(1) is first
+    pool.clear()
+    assert len(pool) == 0
+    assert (pool.hits, pool.misses) == (0, 0)
+    with pytest.raises(TypeError):
+        pool.resize(1.0)
+    with pytest.raises(ValueError):
+        pool.resize(-1)
+
+
+#############################################################################
+# Format compilation
+#
+class Formattable:
+    format_functions = {
+        "n": lambda self: str(self.number),
+        "q": lambda self: "'\"\\",
+    }
+
+    def __init__(self, number):
+        self.number = number
+
+
+def test_100_compile_format():
+    for format_string, expected in (("", ""), ("%n", "42"), ("a%nb%nc", "a42b42c"), ("%q", "'\"\\"),
+                                    ("%", "%"), ("%%", "%"), ("%%%", "%%"), ("%%n", "%n"), ("%%%n", "%42"),
+                                    ("%k%n", "%k42"), ("%n%", "42%"), ("{%n}", "{42}"), ("{0}'\"\\\n", "{0}'\"\\\n")):
+        assert compile_format(Formattable, format_string)(Formattable(42)) == expected
+
+
+def test_101_compiled_formats_are_reused():
+    class OtherFormattable(Formattable):
+        format_functions = {"n": lambda self: f"<{self.number}>"}
+
+    formatter = compile_format(Formattable, "%n-%n")
+    assert compile_format(Formattable, "%n-%n") is formatter
+    assert formatter(Formattable(7)) == "7-7"
+    assert compile_format(OtherFormattable, "%n-%n")(OtherFormattable(7)) == "<7>-<7>"
+
+
+def test_102_compiled_formats_see_directive_changes():
+    class ChangingFormattable(Formattable):
+        format_functions = dict(Formattable.format_functions)
+
+    formatter = compile_format(ChangingFormattable, "%n/%k")
+    assert formatter(ChangingFormattable(7)) == "7/%k"
+    ChangingFormattable.format_functions["k"] = lambda self: str(self.number * 2)
+    ChangingFormattable.format_functions["n"] = lambda self: f"n{self.number}"
+    assert compile_format(ChangingFormattable, "%n/%k") is formatter
+    assert formatter(ChangingFormattable(7)) == "n7/14"
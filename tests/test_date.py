@@ -29,12 +29,13 @@
 
 __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
+import datetime
 from decimal import Decimal
 from fractions import Fraction
 import pickle
 import pytest
 
-from datetime2 import Date, Time, TimeDelta
+from datetime2 import Date, DateRange, Time, TimeDelta
 
 
 INF = float("inf")
@@ -144,6 +145,18 @@ def test_11_pickling():
             assert unpickled.dummy == 42
             assert der == unpickled
 
+    # pickled by versions before __slots__, as the instance dictionary
+    legacy = (b'\x80\x02]q\x00(cdatetime2\nDate\nq\x01)\x81q\x02}q\x03X\n\x00\x00\x00_day_countq\x04J\x81F\x0b\x00sbh\x01)'
+              b'\x81q\x05}q\x06h\x04J\xfb\xff\xff\xffsbe.')
+    assert pickle.loads(legacy) == [Date(738945), Date(-5)]
+    legacy = (b'ccopy_reg\n_reconstructor\np0\n(cdatetime2\nDate\np1\nc__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\n'
+              b'V_day_count\np6\nI738945\nsb.')
+    assert pickle.loads(legacy) == Date(738945)
+    der = Derived.__new__(Derived)
+    der.__setstate__({"_day_count": 5, "dummy": 42, "gregorian": None})
+    assert der.day_count == 5
+    assert der.__dict__ == {"dummy": 42}
+    assert str(der.gregorian) == "0001-01-05"
 
 def test_12_bool():
     # In boolean contexts, all Date instances are considered to be true
@@ -151,6 +164,113 @@ def test_12_bool():
         assert Date(day_count)
 
 
+def test_13_binary_encoding():
+    for day_count in date_test_data + (2**70, -2**70, 2**2100):
+        d = Date(day_count)
+        encoded = d.to_bytes()
+        assert type(encoded) is bytes
+        assert Date.from_bytes(encoded) == d
+        assert Date.from_bytes(bytearray(encoded)) == d
+        assert Date.from_bytes(memoryview(encoded)) == d
+    assert len(Date(738000).to_bytes()) == 5
+    # pickles hold only the binary encoding
+    d = Date(738000)
+    d.gregorian
+    assert d.to_bytes() in pickle.dumps(d)
+    assert len(pickle.dumps(d)) < 50
+
+    for data in ("abc", 1, None):
+        with pytest.raises(TypeError):
+            Date.from_bytes(data)
+    for data in (b"", Date(1).to_bytes()[:-1], Date(1).to_bytes() + b"\0", Time(0).to_bytes(), b"\x12\x01\x00"):
+        with pytest.raises(ValueError):
+            Date.from_bytes(data)
+
+
+def test_14_pydate_conversions():
+    for day_count in (1, 2, 719163, 738000, 3652059):
+        pydate = datetime.date.fromordinal(day_count)
+        assert Date.from_pydate(pydate) == Date(day_count)
+        assert Date(day_count).to_pydate() == pydate
+    pydate = datetime.date(2024, 2, 29)
+    assert str(Date.from_pydate(pydate).gregorian) == "2024-02-29"
+    assert Date.from_pydate(datetime.datetime(2024, 2, 29, 23, 59)) == Date.from_pydate(pydate)
+    pydates = [datetime.date.fromordinal(day_count) for day_count in range(738000, 738100)]
+    dates = Date.from_pydate_many(pydates)
+    assert dates == [Date(day_count) for day_count in range(738000, 738100)]
+    assert Date.to_pydate_many(dates) == pydates
+    assert Date.from_pydate_many(iter([])) == []
+
+    for value in (738000, "2024-02-29", None):
+        with pytest.raises(TypeError):
+            Date.from_pydate(value)
+        with pytest.raises(TypeError):
+            Date.from_pydate_many([pydate, value])
+        with pytest.raises(TypeError):
+            Date.to_pydate_many([Date(1), value])
+    for day_count in (0, -5, 3652060):
+        with pytest.raises(ValueError):
+            Date(day_count).to_pydate()
+        with pytest.raises(ValueError):
+            Date.to_pydate_many([Date(1), Date(day_count)])
+
+
+def test_15_range():
+    dates = Date.range(Date(738000), Date(738010))
+    assert isinstance(dates, DateRange)
+    assert len(dates) == 10
+    assert list(dates) == [Date(day_count) for day_count in range(738000, 738010)]
+    assert dates[0] == dates.start == Date(738000)
+    assert dates[-1] == Date(738009)
+    assert dates.stop == Date(738010)
+    assert dates.step == 1
+    assert dates.day_counts == range(738000, 738010)
+    assert dates[2:8:3] == Date.range(Date(738002), Date(738008), 3)
+    assert list(dates[::-4]) == [Date(738009), Date(738005), Date(738001)]
+    assert list(reversed(dates[:3])) == [Date(738002), Date(738001), Date(738000)]
+    assert Date(738004) in dates and Date(738010) not in dates and 738004 not in dates
+    assert dates.index(Date(738004)) == 4
+    assert dates.count(Date(738004)) == 1 and dates.count(Date(738020)) == 0
+    assert repr(dates) == "datetime2.DateRange(datetime2.Date(738000), datetime2.Date(738010), 1)"
+    assert DateRange(Date(738000), Date(738010)) == dates
+    assert hash(Date.range(Date(5), Date(1), TimeDelta(-2))) == hash(DateRange(Date(5), Date(2), -2))
+    assert list(Date.range(Date(5), Date(1), TimeDelta(-2))) == [Date(5), Date(3)]
+    assert not Date.range(Date(5), Date(1))
+    with pytest.raises(IndexError):
+        dates[10]
+    with pytest.raises(ValueError):
+        dates.index(Date(738010))
+
+    # lengths and slices do not build the dates
+    huge = Date.range(Date(-10 ** 12), Date(10 ** 12), 7)
+    assert len(huge) == 285714285715
+    assert huge[10 ** 9] == Date(-10 ** 12 + 7 * 10 ** 9)
+    assert len(huge[::10 ** 6]) == 285715
+
+    # subclasses of Date yield instances of the subclass
+    class MyDate(Date):
+        __slots__ = ()
+    assert type(MyDate.range(Date(1), Date(3))[1]) is MyDate
+
+    # the days of a month or of a year, through a calendar attribute, are dates
+    february = Date.gregorian.iter_month(2024, 2)
+    assert isinstance(february, DateRange)
+    assert february == Date.range(Date.gregorian(2024, 2, 1), Date.gregorian(2024, 3, 1))
+    assert [date_obj.day_count for date_obj in february[::7]] == [Date.gregorian(2024, 2, day).day_count for day in (1, 8, 15, 22, 29)]
+    assert str(february[-1].gregorian) == "2024-02-29"
+    year_2023 = Date.gregorian.iter_year(2023)
+    assert len(year_2023) == 365
+    assert year_2023.start == Date.gregorian(2023, 1, 1) and year_2023.stop == Date.gregorian(2024, 1, 1)
+    assert [str(date_obj.gregorian) for date_obj in reversed(year_2023[-2:])] == ["2023-12-31", "2023-12-30"]
+
+    for start, stop, step in ((1, Date(5), 1), (Date(1), "5", 1), (Date(1), Date(5), 1.0)):
+        with pytest.raises(TypeError):
+            Date.range(start, stop, step)
+    for step in (0, TimeDelta(0), TimeDelta(Fraction(1, 2))):
+        with pytest.raises(ValueError):
+            Date.range(Date(1), Date(5), step)
+
+
 def test_20_attribute():
     # the day_count attribute is read-only
     d = Date(1)
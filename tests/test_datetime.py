@@ -0,0 +1,216 @@
+# Time class tests
+
+# Copyright (c) 2011-2023 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+from fractions import Fraction
+import pickle
+import time
+import pytest
+
+from datetime2 import Date, DateTime, Time, TimeDelta, set_clock_source
+from datetime2.clocks import FakeClock
+
+
+NS_IN_DAY = 86_400_000_000_000
+
+
+def test_00_constructor():
+    dt = DateTime(Date(738000), Time(Fraction(1, 2)))
+    assert dt.nanoseconds == 737999 * NS_IN_DAY + NS_IN_DAY // 2
+    assert dt.utcoffset is None
+    assert dt.date == Date(738000)
+    assert dt.time == Time(Fraction(1, 2))
+    aware = DateTime(Date(1), Time(0, utcoffset="-1/4"))
+    assert aware.nanoseconds == 0
+    assert aware.utcoffset == Fraction(-1, 4)
+    assert aware.time.utcoffset == Fraction(-1, 4)
+    before_day_1 = DateTime(Date(0), Time(Fraction(3, 4)))
+    assert before_day_1.nanoseconds == -NS_IN_DAY // 4
+    assert before_day_1.date == Date(0)
+    assert before_day_1.time == Time(Fraction(3, 4))
+
+    for date, time_obj in ((738000, Time(0)), (Date(1), Fraction(1, 2)), (Date(1), None)):
+        with pytest.raises(TypeError):
+            DateTime(date, time_obj)
+    with pytest.raises(ValueError):
+        DateTime(Date(1), Time(Fraction(1, 7)))
+    with pytest.raises(ValueError):
+        DateTime(Date(1), Time(0, utcoffset=Fraction(1, 7)))
+
+
+def test_01_constructor_from_nanoseconds():
+    dt = DateTime.from_nanoseconds(NS_IN_DAY + 1, utcoffset=Fraction(1, 24))
+    assert dt.date == Date(2)
+    assert dt.time == Time.from_nanoseconds(1, utcoffset=Fraction(1, 24))
+    assert DateTime.from_nanoseconds(-1).date == Date(0)
+    with pytest.raises(TypeError):
+        DateTime.from_nanoseconds(1.0)
+    with pytest.raises(ValueError):
+        DateTime.from_nanoseconds(0, utcoffset=2)
+    with pytest.raises(ValueError):
+        DateTime.from_nanoseconds(0, utcoffset=Fraction(1, 7))
+
+
+def test_02_constructor_now():
+    # 2001-09-09 01:46:40 UTC
+    moment_ns = 1_000_000_000 * 10**9
+    previous_source = set_clock_source(FakeClock(moment_ns))
+    try:
+        utc_now = DateTime.utcnow()
+        assert utc_now.date == Date.gregorian(2001, 9, 9)
+        assert utc_now.time == Time.from_nanoseconds(6400 * 10**9)
+        assert utc_now.utcoffset is None
+        west_now = DateTime.now(utcoffset=Fraction(-1, 4))
+        assert west_now.date == Date.gregorian(2001, 9, 8)
+        assert west_now.nanoseconds == utc_now.nanoseconds - NS_IN_DAY // 4
+        assert west_now == DateTime.from_nanoseconds(utc_now.nanoseconds, utcoffset=0)
+        local_now = DateTime.now()
+        utcoffset = Fraction(time.localtime(moment_ns // 10**9).tm_gmtoff, 86400)
+        assert local_now.utcoffset == utcoffset
+        assert local_now == DateTime.from_nanoseconds(utc_now.nanoseconds, utcoffset=0)
+        assert DateTime.localnow().nanoseconds == local_now.nanoseconds
+        assert DateTime.localnow().utcoffset is None
+    finally:
+        set_clock_source(previous_source)
+
+
+def test_10_hash_equality():
+    naive = DateTime(Date(738000), Time(Fraction(1, 2)))
+    utc = DateTime(Date(738000), Time(Fraction(1, 2), utcoffset=0))
+    paris = DateTime(Date(738000), Time(Fraction(13, 24), utcoffset=Fraction(1, 24)))
+    auckland = DateTime(Date(738001), Time(Fraction(1, 24), utcoffset=Fraction(13, 24)))
+    assert utc == paris == auckland
+    assert hash(utc) == hash(paris) == hash(auckland)
+    assert naive != utc
+    assert naive == DateTime.from_nanoseconds(naive.nanoseconds)
+    assert hash(naive) == hash(DateTime.from_nanoseconds(naive.nanoseconds))
+    assert len({naive, utc, paris, auckland}) == 2
+    assert naive != Date(738000)
+    assert not naive == Time(Fraction(1, 2))
+
+
+def test_11_pickling_binary_encoding():
+    for dt in (DateTime(Date(738000), Time(Fraction(1, 2))), DateTime(Date(-5), Time("1/3", utcoffset="-1/4")),
+               DateTime.from_nanoseconds(10**30, utcoffset=1)):
+        decoded = DateTime.from_bytes(dt.to_bytes())
+        assert decoded == dt
+        assert decoded.nanoseconds == dt.nanoseconds
+        assert decoded.utcoffset == dt.utcoffset
+        dt.date.gregorian
+        assert pickle.loads(pickle.dumps(dt)) == dt
+        assert dt.to_bytes() in pickle.dumps(dt)
+    for data in ("abc", 1, None):
+        with pytest.raises(TypeError):
+            DateTime.from_bytes(data)
+    valid = DateTime(Date(1), Time(0, utcoffset=Fraction(1, 24))).to_bytes()
+    for data in (b"", b"\x41", valid[:-1], valid + b"\0", Date(1).to_bytes(),
+                 b"\x41\x00\x01\x00",                                        # unknown offset kind
+                 b"\x41\x01\x01\x00\x07" + (NS_IN_DAY + 1).to_bytes(7, "little")):   # UTC offset too large
+        with pytest.raises(ValueError):
+            DateTime.from_bytes(data)
+
+
+def test_20_attributes():
+    dt = DateTime(Date.gregorian(2024, 2, 29), Time.western(13, 30, 15))
+    assert str(dt.date.gregorian) == "2024-02-29"
+    assert str(dt.time.western) == "13:30:15"
+    assert dt.date is dt.date
+    with pytest.raises(AttributeError):
+        dt.nanoseconds = 1
+    with pytest.raises(AttributeError):
+        dt.date = Date(1)
+    with pytest.raises(AttributeError):
+        dt.unknown
+
+
+def test_30_repr_str():
+    import datetime2
+
+    for dt in (DateTime(Date(738000), Time(Fraction(1, 2))), DateTime(Date(-5), Time("1/3", utcoffset="-1/4"))):
+        assert eval(repr(dt)) == dt
+    assert repr(DateTime(Date(738000), Time(Fraction(1, 2)))) == "datetime2.DateTime(datetime2.Date(738000), datetime2.Time('1/2'))"
+    assert str(DateTime(Date(738000), Time(Fraction(1, 2)))) == "R.D. 738000, 1/2 of a day"
+
+
+def test_40_operations():
+    dt = DateTime(Date.gregorian(2024, 12, 31), Time.western(18, 0, 0, timezone=1))
+    # the day is carried
+    later = dt + TimeDelta(Fraction(1, 4))
+    assert later.date == Date.gregorian(2025, 1, 1)
+    assert later.time == Time.western(0, 0, 0, timezone=1)
+    assert TimeDelta(Fraction(1, 4)) + dt == later
+    assert later - TimeDelta(Fraction(1, 4)) == dt
+    assert dt + TimeDelta(-366) == DateTime(Date.gregorian(2023, 12, 31), Time.western(18, 0, 0, timezone=1))
+    assert later - dt == TimeDelta(Fraction(1, 4))
+    assert dt - later == TimeDelta(Fraction(-1, 4))
+    # differences of aware instances use UTC
+    utc = DateTime(Date.gregorian(2024, 12, 31), Time.western(18, 0, 0, timezone=0))
+    assert utc - dt == TimeDelta(Fraction(1, 24))
+    naive = DateTime(Date(1), Time(0))
+    assert (naive + TimeDelta("1/86400000000000")).nanoseconds == 1
+
+    with pytest.raises(ValueError):
+        dt + TimeDelta(Fraction(1, 7))
+    with pytest.raises(ValueError):
+        naive - dt
+    for other in (1, Date(1), Time(0)):
+        with pytest.raises(TypeError):
+            dt + other
+        with pytest.raises(TypeError):
+            dt - other
+
+
+def test_41_comparisons():
+    early = DateTime(Date(738000), Time(Fraction(23, 24), utcoffset=0))
+    late = DateTime(Date(738001), Time(Fraction(1, 24), utcoffset=Fraction(1, 24)))
+    assert early < late and early <= late and late > early and late >= early
+    assert not early > late and early != late
+    assert DateTime(Date(738001), Time(0, utcoffset=Fraction(-1, 24))) >= late
+    naive = DateTime(Date(738000), Time(0))
+    assert naive < DateTime(Date(738000), Time(Fraction(1, 2)))
+    with pytest.raises(TypeError):
+        naive < early
+    with pytest.raises(TypeError):
+        early >= naive
+    with pytest.raises(TypeError):
+        naive < Date(1)
+
+
+class DateTimeSubclass(DateTime):
+    pass
+
+
+def test_90_subclass():
+    dt = DateTimeSubclass(Date(738000), Time(Fraction(1, 2)))
+    dt.extra = 1
+    assert type(dt + TimeDelta(1)) is DateTimeSubclass
+    unpickled = pickle.loads(pickle.dumps(dt))
+    assert type(unpickled) is DateTimeSubclass
+    assert unpickled == dt and unpickled.extra == 1
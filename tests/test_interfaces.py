@@ -34,6 +34,18 @@ from fractions import Fraction
 import pytest
 
 from datetime2 import Date, Time, TimeDelta
+from datetime2.modern import InternetTime, IsoCalendar
+from datetime2.western import GregorianCalendar, WesternTime, WesternTimeDelta
+
+
+def counting_class(base_class, allocations):
+    # subclass of base_class that counts its allocations in the allocations dictionary
+    class CountingClass(base_class):
+        def __new__(cls, *args, **kwargs):
+            allocations[base_class.__name__] = allocations.get(base_class.__name__, 0) + 1
+            return super().__new__(cls)
+
+    return CountingClass
 
 
 #############################################################################
@@ -224,15 +236,16 @@ def test_016_Date_has_attributes_but_instance_not():
     assert hasattr(Date, "gregorian")
     assert Date.gregorian
     # an instance created with another calendar or by Date does not have
-    #   the attribute; it is instead is reachable via the Date class
+    #   the attribute (it does not even have a __dict__); it is instead
+    #   reachable via the Date class
     d1 = Date(4)
-    with pytest.raises(KeyError):
-        d1.__dict__["gregorian"]
+    with pytest.raises(AttributeError):
+        d1.__dict__
     assert hasattr(d1, "gregorian")
     d1.gregorian
     d2 = Date.iso(3, 4, 5)
-    with pytest.raises(KeyError):
-        d2.__dict__["gregorian"]
+    with pytest.raises(AttributeError):
+        d2.__dict__
     assert hasattr(d2, "gregorian")
     d2.gregorian
     # a Date instance created via the calendar does have the same attribute
@@ -241,6 +254,108 @@ def test_016_Date_has_attributes_but_instance_not():
     d3.gregorian
 
 
+def test_018_calendar_objects_are_cached_by_value():
+    # calendar objects are shared by equal Date instances
+    d1 = Date(737109)
+    d2 = Date(737109)
+    assert d1.gregorian is d2.gregorian
+    # also when built via the calendar
+    d3 = Date.gregorian(2019, 2, 20)
+    assert Date(737110).gregorian is d3.gregorian
+    # the cache is bounded
+    calendar_cache = Date.__dict__["gregorian"].cache
+    for day_count in range(calendar_cache.maxsize + 100):
+        assert Date(day_count).gregorian.to_rata_die() == day_count
+    assert len(calendar_cache) <= calendar_cache.maxsize
+    # cached objects are not pickled with the instance
+    import pickle
+    assert b"Gregorian" not in pickle.dumps(d3)
+
+
+def test_019_calendar_objects_are_cached_safely_by_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    dates = [Date(day_count) for day_count in range(-50, 50)]
+    calendar_cache = Date.__dict__["gregorian"].cache
+
+    def get_calendar_objects(thread_index):
+        # all threads see the same calendar object for each value
+        return [[date.gregorian for date in dates] for _ in range(20)]
+
+    calendar_cache.clear()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get_calendar_objects, range(8)))
+    for index, date in enumerate(dates):
+        assert all(rounds[index] is date.gregorian for result in results for rounds in result)
+    assert len(calendar_cache) <= calendar_cache.maxsize
+
+
+def test_020_conversions_allocate_one_object_each():
+    allocations = {}
+    CountingDate = counting_class(Date, allocations)
+    CountingDate.register_new_calendar("gregorian_count", counting_class(GregorianCalendar, allocations))
+    CountingDate.register_new_calendar("iso_count", counting_class(IsoCalendar, allocations))
+    conversions = (
+        (lambda: CountingDate.gregorian_count(2024, 5, 1), {"GregorianCalendar": 1, "Date": 1}),
+        (lambda: CountingDate.gregorian_count.year_day(2024, 100), {"GregorianCalendar": 1, "Date": 1}),
+        (lambda: CountingDate.gregorian_count.from_rata_die(5), {"GregorianCalendar": 1, "Date": 1}),
+        (lambda: CountingDate.iso_count(2024, 5, 1), {"IsoCalendar": 1, "Date": 1}),
+        (lambda: CountingDate(-738000).gregorian_count, {"Date": 1, "GregorianCalendar": 1}),
+        (lambda: CountingDate(-738000).iso_count, {"Date": 1, "IsoCalendar": 1}),
+        (lambda: CountingDate(-738000).gregorian_count, {"Date": 1}),  # cached
+    )
+    for conversion, expected_allocations in conversions:
+        allocations.clear()
+        conversion()
+        assert allocations == expected_allocations
+
+
+def test_021_interning_pools():
+    pools = (Date.pool, GregorianCalendar.pool, IsoCalendar.pool)
+    # pools are opt-in
+    assert all(pool.maxsize == 0 for pool in pools)
+    assert GregorianCalendar.from_rata_die(5) is not GregorianCalendar.from_rata_die(5)
+    assert Date.gregorian(2024, 5, 1) is not Date.gregorian(2024, 5, 1)
+    try:
+        for pool in pools:
+            pool.resize(16)
+        greg = GregorianCalendar.from_rata_die(5)
+        assert GregorianCalendar.from_rata_die(5) is greg
+        assert type(greg) is GregorianCalendar
+        iso = IsoCalendar.from_rata_die(5)
+        assert IsoCalendar.from_rata_die(5) is iso
+        assert (GregorianCalendar.pool.hits, GregorianCalendar.pool.misses) == (1, 1)
+        # calendars produce shared Date instances
+        date = Date.gregorian(2024, 5, 1)
+        assert Date.gregorian(2024, 5, 1) is date
+        assert Date.iso(2024, 18, 3) is date
+        assert Date.gregorian.from_rata_die(date.day_count) is date
+        assert (Date.pool.hits, Date.pool.misses) == (3, 1)
+        # attribute access does not change the class of pooled instances
+        Date.__dict__["gregorian"].cache.clear()
+        assert (Date(5).gregorian.year, Date(5).gregorian.day) == (greg.year, greg.day)
+        assert Date(5).gregorian is not greg
+        assert type(greg) is GregorianCalendar
+        assert type(GregorianCalendar.from_rata_die(5)) is GregorianCalendar
+        # calendar objects of attributes are derived without the pool, so that
+        # an instance evicted by another thread is never changed either
+        Date.__dict__["gregorian"].cache.clear()
+        Date.__dict__["iso"].cache.clear()
+        lookups = [(pool.hits, pool.misses) for pool in pools[1:]]
+        assert (Date(5).gregorian.day, Date(5).iso.day) == (greg.day, iso.day)
+        assert [(pool.hits, pool.misses) for pool in pools[1:]] == lookups
+        assert type(greg) is GregorianCalendar and type(iso) is IsoCalendar
+        # the least recently used instances are evicted
+        for day_count in range(100, 200):
+            GregorianCalendar.from_rata_die(day_count)
+        assert len(GregorianCalendar.pool) == 16
+        assert GregorianCalendar.from_rata_die(5) is not greg
+    finally:
+        for pool in pools:
+            pool.resize(0)
+            pool.clear()
+
+
 def test_090_avoid_date_override():
     # In the past it happened that a date instance, created via a Gregorian calendar,
     # was able to directly get an attribute which instead belonged to the calendar class.
@@ -449,15 +564,16 @@ def test_216_Time_has_attributes_but_instance_not():
     assert hasattr(Time, "western")
     assert Time.western
     # an instance created with another calendar or by Time does not have
-    #   the attribute; it is instead is reachable via the Time class
+    #   the attribute (it does not even have a __dict__); it is instead
+    #   reachable via the Time class
     t1 = Time("4/10")
-    with pytest.raises(KeyError):
-        t1.__dict__["western"]
+    with pytest.raises(AttributeError):
+        t1.__dict__
     assert hasattr(t1, "western")
     t1.western
     t2 = Time.internet(345)
-    with pytest.raises(KeyError):
-        t2.__dict__["western"]
+    with pytest.raises(AttributeError):
+        t2.__dict__
     assert hasattr(t2, "western")
     t2.western
     # a Time instance created via the time class does have the same attribute
@@ -466,6 +582,44 @@ def test_216_Time_has_attributes_but_instance_not():
     t3.western
 
 
+def test_218_time_representations_are_cached_by_value():
+    # time representation objects are shared by Time instances with the same value
+    t1 = Time("4/10", utcoffset="1/4")
+    t2 = Time("4/10", utcoffset="1/4")
+    assert t1.western is t2.western
+    # but not with Time instances that represent the same moment with another UTC offset
+    t3 = Time("3/20", utcoffset=0)
+    assert t1 == t3
+    assert t3.western.hour == 3
+    assert t1.western.hour == 9
+    # also when built via the representation
+    t4 = Time.western(9, 36, 0, timezone=6)
+    assert t1.western is t4.western
+    # cached objects are not pickled with the instance
+    import pickle
+    assert b"Western" not in pickle.dumps(t4)
+
+
+def test_220_conversions_allocate_one_object_each():
+    allocations = {}
+    CountingTime = counting_class(Time, allocations)
+    CountingTime.register_new_time("western_count", counting_class(WesternTime, allocations))
+    CountingTime.register_new_time("internet_count", counting_class(InternetTime, allocations))
+    conversions = (
+        (lambda: CountingTime.western_count(1, 2, 3), {"WesternTime": 1, "Time": 1}),
+        (lambda: CountingTime.western_count(1, 2, 3, timezone=1), {"WesternTime": 1, "Time": 1}),
+        (lambda: CountingTime.internet_count(123), {"InternetTime": 1, "Time": 1}),
+        (lambda: CountingTime(Fraction(1, 7777)).western_count, {"Time": 1, "WesternTime": 1}),
+        (lambda: CountingTime(Fraction(1, 7777), utcoffset=Fraction(1, 24)).internet_count,
+         {"Time": 1, "InternetTime": 1}),
+        (lambda: CountingTime(Fraction(1, 7777)).western_count, {"Time": 1}),  # cached
+    )
+    for conversion, expected_allocations in conversions:
+        allocations.clear()
+        conversion()
+        assert allocations == expected_allocations
+
+
 def test_230_naivety_is_preserved():
     class NaivetyCheck:
         def __init__(self, hour100, minute100, utcoffset=None):
@@ -694,8 +848,8 @@ def test_416_TimeDelta_has_attributes_but_instance_not():
     # does not have the attribute; it is instead is reachable via the Time
     # class
     td1 = TimeDelta(1234, 567)
-    with pytest.raises(KeyError):
-        td1.__dict__["western"]
+    with pytest.raises(AttributeError):
+        td1.__dict__
     assert hasattr(td1, "western")
     td1.western
     # TODO: if and when we'll have another time interval class we'll add it here
@@ -710,3 +864,18 @@ def test_416_TimeDelta_has_attributes_but_instance_not():
     assert hasattr(td3, "western")
     td3.western
 
+
+
+def test_420_conversions_allocate_one_object_each():
+    allocations = {}
+    CountingTimeDelta = counting_class(TimeDelta, allocations)
+    CountingTimeDelta.register_new_time_interval("western_count", counting_class(WesternTimeDelta, allocations))
+    conversions = (
+        (lambda: CountingTimeDelta.western_count(1, 2, 3, 4), {"WesternTimeDelta": 1, "TimeDelta": 1}),
+        (lambda: CountingTimeDelta(Fraction(-1, 7777)).western_count, {"TimeDelta": 1, "WesternTimeDelta": 1}),
+        (lambda: CountingTimeDelta(Fraction(-1, 7777)).western_count, {"TimeDelta": 1}),  # cached
+    )
+    for conversion, expected_allocations in conversions:
+        allocations.clear()
+        conversion()
+        assert allocations == expected_allocations
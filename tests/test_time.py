@@ -29,12 +29,13 @@
 
 __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
+import datetime
 from decimal import Decimal
 from fractions import Fraction
 import pickle
 import pytest
 
-from datetime2 import Time, TimeDelta
+from datetime2 import Date, Time, TimeDelta
 
 
 INF = float("inf")
@@ -292,6 +293,85 @@ def test_06_constructor_utcnow():
     assert time_now.utcoffset is None
 
 
+def test_07_constructor_from_nanoseconds():
+    for nanoseconds, day_frac in ((0, Fraction(0)), (1, Fraction(1, 86400000000000)),
+                                  (21600000000000, Fraction(1, 4)), (86399999999999, Fraction(86399999999999, 86400000000000))):
+        time_ns = Time.from_nanoseconds(nanoseconds)
+        assert type(time_ns) is Time
+        assert time_ns.day_frac == day_frac
+        assert type(time_ns.day_frac) is Fraction
+        assert time_ns.utcoffset is None
+        assert time_ns == Time(day_frac)
+        for utcoffset_frac, input_values in utcoffset_test_data:
+            for input_value in input_values:
+                time_ns = Time.from_nanoseconds(nanoseconds, utcoffset=input_value)
+                assert time_ns.day_frac == day_frac
+                assert time_ns.utcoffset == utcoffset_frac
+                assert time_ns == Time(day_frac, utcoffset=utcoffset_frac)
+
+    # exception with non integer values
+    for par in (1.0, Fraction(1), Decimal(1), "1", None):
+        with pytest.raises(TypeError):
+            Time.from_nanoseconds(par)
+    # exception with values out of range
+    for par in (-1, 86400000000000, 10 ** 20):
+        with pytest.raises(ValueError):
+            Time.from_nanoseconds(par)
+    for utcoffset in (Fraction(-1001, 1000), Fraction(1001, 1000), 2):
+        with pytest.raises(ValueError):
+            Time.from_nanoseconds(0, utcoffset=utcoffset)
+
+
+def test_08_local_clock(monkeypatch):
+    # for the time being, let's use the good old datetime module :-)
+    import datetime
+    import time
+    from datetime2 import _LocalClock
+    from datetime2.clocks import FakeClock
+
+    for second in range(0, 2_000_000_000, 86_400 * 7 + 3_607):
+        local_moment = datetime.datetime.fromtimestamp(second).astimezone()
+        second_state = _LocalClock._local_second(second)
+        assert second_state[1] == local_moment.toordinal()
+        assert (second * 1_000_000_000 - second_state[2]) // 1_000_000_000 == (
+                local_moment.hour * 3600 + local_moment.minute * 60 + local_moment.second)
+        assert second_state[3] * 86400 == local_moment.utcoffset().total_seconds()
+
+    # time.localtime is called only when the second changes
+    localtime_calls = []
+
+    def counting_localtime(second):
+        localtime_calls.append(second)
+        return time.gmtime(second)
+
+    fake_clock = FakeClock()
+    clock = _LocalClock(fake_clock)
+    monkeypatch.setattr(time, "localtime", counting_localtime)
+    for moment_ns, expected in ((86_400_000_000_001, (719164, 1, 0)),
+                                (86_400_999_999_999, (719164, 999_999_999, 0)),
+                                (86_401_000_000_000, (719164, 1_000_000_000, 0)),
+                                (172_799_999_999_999, (719164, 86_399_999_999_999, 0))):
+        fake_clock.set(moment_ns)
+        assert clock.moment_ns() == expected
+    assert localtime_calls == [86_400, 86_401, 172_799]
+
+
+def test_09_constructor_now_utc():
+    # an aware UTC time is built without local calendar fields
+    import datetime
+
+    count = 0
+    while count < 3:
+        datetime_now = datetime.datetime.now(datetime.timezone.utc)
+        time_now = Time.now(utcoffset=0)
+        if int(time_now.day_frac * 86400) == datetime_now.hour * 3600 + datetime_now.minute * 60 + datetime_now.second:
+            break
+        count += 1
+    assert count < 3, "Unable to get at least one a correct Time.now(utcoffset=0)"
+    assert time_now.utcoffset == 0
+    assert Time.now(utcoffset=Fraction(1, 3 * 86400 * 10**9)).utcoffset == Fraction(1, 3 * 86400 * 10**9)
+
+
 def test_10_hash_equality():
     # Time instances are immutable
     t1 = Time("3/5")
@@ -368,6 +448,18 @@ def test_11_pickling():
             assert unpickled.dummy == 42
             assert der == unpickled
 
+    # pickled by versions before __slots__, as the instance dictionary
+    legacy = (b'\x80\x02]q\x00(cdatetime2\nTime\nq\x01)\x81q\x02}q\x03(X\t\x00\x00\x00_day_fracq\x04cfractions\nFraction\n'
+              b'q\x05K\x01K\x03\x86q\x06Rq\x07X\n\x00\x00\x00_utcoffsetq\x08h\x05K\x01K\x18\x86q\tRq\nubh\x01)\x81q\x0b}q\x0c'
+              b'(h\x04h\x05K\x01K\x02\x86q\rRq\x0eh\x08Nube.')
+    unpickled = pickle.loads(legacy)
+    assert unpickled == [Time(Fraction(1, 3), utcoffset=Fraction(1, 24)), Time(Fraction(1, 2))]
+    assert unpickled[0].utcoffset == Fraction(1, 24)
+    assert unpickled[1].utcoffset is None
+    assert str(unpickled[1].western) == "12:00:00"
+    time_obj = Time.__new__(Time)
+    time_obj.__setstate__({"_day_frac": Fraction(1, 4), "_utcoffset": None, "western": None})
+    assert time_obj == Time(Fraction(1, 4))
 
 def test_12_bool():
     # In boolean contexts, all Time instances are considered to be true
@@ -384,6 +476,76 @@ def test_12_bool():
             assert Time("0.2222", utcoffset=input_value)
 
 
+def test_13_binary_encoding():
+    times = [Time(day_frac) for day_frac, input_values in time_test_data + time_test_data_num_den]
+    times += [Time(Fraction(1, 4), utcoffset=utcoffset) for utcoffset, input_values in utcoffset_test_data]
+    times += [Time(Fraction(2, 3), utcoffset=Fraction(1, 7)), Time(Fraction(1, 7), utcoffset=Fraction(-1, 3)),
+              Time.from_nanoseconds(86399999999999, utcoffset=Fraction(-1)), Time(Fraction(1, 86400 * 10**10))]
+    for t in times:
+        encoded = t.to_bytes()
+        decoded = Time.from_bytes(encoded)
+        assert decoded == t
+        assert decoded.day_frac == t.day_frac
+        assert decoded.utcoffset == t.utcoffset
+    # multiples of a nanosecond are encoded as integers
+    assert len(Time.from_nanoseconds(45296789000000).to_bytes()) == 9
+    assert len(Time(Fraction(1, 2), utcoffset=Fraction(1, 24)).to_bytes()) == 16
+    # pickles hold only the binary encoding
+    t = Time(Fraction(1, 2), utcoffset=Fraction(1, 24))
+    t.western
+    t.internet
+    assert t.to_bytes() in pickle.dumps(t)
+    assert b"Western" not in pickle.dumps(t)
+
+    for data in ("abc", 1, None):
+        with pytest.raises(TypeError):
+            Time.from_bytes(data)
+    valid = Time(Fraction(1, 3), utcoffset=Fraction(1, 3)).to_bytes()
+    for data in (b"", b"\x21", valid[:-1], valid + b"\0", Date(1).to_bytes(),
+                 b"\x21\x0f",                                                 # missing day fraction
+                 b"\x21\x0d" + bytes((6,)) + (86400 * 10**9).to_bytes(6, "little"),   # day fraction too large
+                 b"\x21\x0d\x01\xff",                                       # negative day fraction
+                 b"\x21\x01\x01\x00\x01\x02",                                # UTC offset of 2 days
+                 b"\x21\x0e\x01\x01\x01\x00"):                               # zero denominator
+        with pytest.raises(ValueError):
+            Time.from_bytes(data)
+
+
+def test_14_pytime_conversions():
+    utc_minus_five = datetime.timezone(datetime.timedelta(hours=-5))
+    pytime = datetime.time(13, 30, 15, 123456, utc_minus_five)
+    time_obj = Time.from_pytime(pytime)
+    assert time_obj == Time.from_nanoseconds(48615123456000, utcoffset=Fraction(-5, 24))
+    assert time_obj.utcoffset == Fraction(-5, 24)
+    assert time_obj.to_pytime() == pytime
+    assert time_obj.to_pytime().utcoffset() == datetime.timedelta(hours=-5)
+    assert Time.from_pytime(datetime.time(6)) == Time(Fraction(1, 4))
+    assert Time.from_pytime(datetime.time(6)).utcoffset is None
+    assert Time(Fraction(1, 4)).to_pytime() == datetime.time(6)
+    assert Time(Fraction(1, 4), utcoffset=0).to_pytime() == datetime.time(6, tzinfo=datetime.timezone.utc)
+    # values finer than a microsecond are floored
+    assert Time.from_nanoseconds(1999).to_pytime() == datetime.time(0, 0, 0, 1)
+    assert Time(Fraction(1, 7)).to_pytime() == datetime.time(3, 25, 42, 857142)
+    pytimes = [pytime, datetime.time(23, 59, 59, 999999), datetime.time(0, tzinfo=utc_minus_five)]
+    times = Time.from_pytime_many(pytimes)
+    assert times == [Time.from_pytime(value) for value in pytimes]
+    assert [value.utcoffset for value in times] == [Fraction(-5, 24), None, Fraction(-5, 24)]
+    assert Time.to_pytime_many(times) == pytimes
+
+    for value in (0, Fraction(1, 2), datetime.date(2000, 1, 1), None):
+        with pytest.raises(TypeError):
+            Time.from_pytime(value)
+        with pytest.raises(TypeError):
+            Time.from_pytime_many([pytime, value])
+        with pytest.raises(TypeError):
+            Time.to_pytime_many([Time(0), value])
+    for time_obj in (Time(0, utcoffset=Fraction(1, 86400 * 10**7)), Time(0, utcoffset=1), Time(0, utcoffset=-1)):
+        with pytest.raises(ValueError):
+            time_obj.to_pytime()
+        with pytest.raises(ValueError):
+            Time.to_pytime_many([time_obj])
+
+
 def test_20_attributes():
     # the attributes of a Time instance are read-only
     t1 = Time("0.12345")
@@ -951,6 +1113,37 @@ def test_43_time_subtraction():
     assert d - e == TimeDelta(Fraction(1, 2))  # -0.5 under flows to 0.5
 
 
+def test_44_nanosecond_precision():
+    # values that are not exact multiples of a nanosecond keep exact semantics
+    for day_frac in (Fraction(1, 3), Fraction(2, 7), Fraction(1, 86400000000001)):
+        assert Time(day_frac).day_frac == day_frac
+        assert Time(day_frac) == Time(day_frac)
+        assert Time(day_frac) != Time(Fraction(1, 2))
+        assert Time(day_frac) < Time(day_frac + Fraction(1, 10 ** 20))
+        assert Time(day_frac) + TimeDelta(Fraction(1, 2)) == Time(day_frac + Fraction(1, 2))
+        assert Time(day_frac) - Time(day_frac) == TimeDelta(0)
+    # mixed exact and inexact components can still represent the same moment
+    t1 = Time(Fraction(1, 3) + Fraction(1, 4), utcoffset=Fraction(1, 3))
+    t2 = Time(Fraction(1, 2), utcoffset=Fraction(1, 4))
+    assert t1 == t2
+    assert hash(t1) == hash(t2)
+    assert not t1 < t2
+    assert t1 - t2 == TimeDelta(0)
+    t3 = Time.from_nanoseconds(43200000000000, utcoffset=Fraction(1, 4))
+    assert t3 == t1
+    assert hash(t3) == hash(t1)
+    # differences are in the (-1/2, 1/2] interval, also for integer nanoseconds
+    for ns1, ns2, delta in ((0, 1, Fraction(-1, 86400000000000)), (1, 0, Fraction(1, 86400000000000)),
+                            (0, 43200000000000, Fraction(1, 2)), (43200000000000, 0, Fraction(1, 2)),
+                            (0, 43200000000001, Fraction(43199999999999, 86400000000000))):
+        assert Time.from_nanoseconds(ns1) - Time.from_nanoseconds(ns2) == TimeDelta(delta)
+    assert Time(0, utcoffset=0) - Time(0, utcoffset=Fraction(1, 4)) == TimeDelta(Fraction(1, 4))
+    # addition and subtraction of TimeDelta wrap around midnight
+    assert Time.from_nanoseconds(86399999999999) + TimeDelta(1, 86400000000000) == Time(0)
+    assert Time.from_nanoseconds(0) - TimeDelta(1, 86400000000000) == Time.from_nanoseconds(86399999999999)
+    assert Time.from_nanoseconds(1, utcoffset="1/4") + TimeDelta(3) == Time.from_nanoseconds(1, utcoffset="1/4")
+
+
 def test_90_subclass():
     # check that there is no interference from the interface mechanism and from possible additional arguments
     class T(Time):
@@ -995,3 +1188,5 @@ def test_91_subclass2():
     t_sub = T("5/7")
     assert type(t_sub + TimeDelta(0.5)) is T
     assert type(t_sub - TimeDelta(0.5)) is T
+    assert type(T.from_nanoseconds(0)) is T
+    assert type(T.from_nanoseconds(0) + TimeDelta(0.5)) is T
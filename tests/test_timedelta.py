@@ -30,12 +30,13 @@
 __author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
 
 from collections import namedtuple
+import datetime
 from decimal import Decimal
 from fractions import Fraction
 import pickle
 import pytest
 
-from datetime2 import TimeDelta
+from datetime2 import Date, TimeDelta
 
 
 INF = float("inf")
@@ -176,6 +177,17 @@ def test_11_pickling():
             assert unpickled.dummy == 42
             assert der == unpickled
 
+    # pickled by versions before __slots__, as the instance dictionary
+    legacy = (b'\x80\x02]q\x00(cdatetime2\nTimeDelta\nq\x01)\x81q\x02}q\x03(X\x10\x00\x00\x00_fractional_daysq\x04cfractions\n'
+              b'Fraction\nq\x05K\x05K\x04\x86q\x06Rq\x07X\t\x00\x00\x00_int_partq\x08K\x01X\n\x00\x00\x00_frac_partq\th\x05K\x01'
+              b'K\x04\x86q\nRq\x0bubh\x01)\x81q\x0c}q\r(h\x04h\x05J\xfd\xff\xff\xffK\x01\x86q\x0eRq\x0fh\x08J\xfd\xff\xff\xffh\th'
+              b'\x05K\x00K\x01\x86q\x10Rq\x11ube.')
+    unpickled = pickle.loads(legacy)
+    assert unpickled == [TimeDelta(Fraction(5, 4)), TimeDelta(-3)]
+    assert unpickled[1] + TimeDelta(3) == TimeDelta(0)
+    timedelta_obj = TimeDelta.__new__(TimeDelta)
+    timedelta_obj.__setstate__({"_fractional_days": Fraction(1, 2), "_int_part": 0, "_frac_part": Fraction(1, 2), "western": None})
+    assert timedelta_obj == TimeDelta(Fraction(1, 2))
 
 def test_12_bool():
     # A TimeDelta instance is true unless it is equal to TimeDelta(0)
@@ -193,6 +205,57 @@ def test_12_bool():
                 assert TimeDelta(input_value[0], input_value[1])
 
 
+def test_13_binary_encoding():
+    for test_datum in timedelta_test_data:
+        td = TimeDelta(test_datum.frac_days)
+        decoded = TimeDelta.from_bytes(td.to_bytes())
+        assert decoded == td
+        assert decoded.int_part == td.int_part
+        assert decoded.frac_part == td.frac_part
+    for fractional_days in (Fraction(10**40, 3), Fraction(-1, 10**40), Fraction(-7, 86400), Fraction(2**3000, 5)):
+        td = TimeDelta(fractional_days)
+        assert TimeDelta.from_bytes(td.to_bytes()) == td
+    assert len(TimeDelta(3).to_bytes()) == 4
+    assert len(TimeDelta(Fraction(3, 4)).to_bytes()) == 9
+    assert len(TimeDelta(Fraction(-22, 7)).to_bytes()) == 6
+    assert TimeDelta(3).to_bytes() in pickle.dumps(TimeDelta(3))
+
+    for data in ("abc", 1, None):
+        with pytest.raises(TypeError):
+            TimeDelta.from_bytes(data)
+    valid = TimeDelta(Fraction(-22, 7)).to_bytes()
+    for data in (b"", b"\x31", valid[:-1], valid + b"\0", Date(1).to_bytes(), b"\x31\x03", b"\x31\x07\x01\x00"):
+        with pytest.raises(ValueError):
+            TimeDelta.from_bytes(data)
+
+
+def test_14_pytimedelta_conversions():
+    for pytimedelta, fractional_days in ((datetime.timedelta(days=3), Fraction(3)),
+                                         (datetime.timedelta(days=-1, seconds=43200), Fraction(-1, 2)),
+                                         (datetime.timedelta(microseconds=-1), Fraction(-1, 86_400_000_000)),
+                                         (datetime.timedelta.max, Fraction(86_400_000_000 * 1_000_000_000 - 1, 86_400_000_000))):
+        td = TimeDelta.from_pytimedelta(pytimedelta)
+        assert td == TimeDelta(fractional_days)
+        assert td.int_part == TimeDelta(fractional_days).int_part
+        assert td.frac_part == TimeDelta(fractional_days).frac_part
+        assert td.to_pytimedelta() == pytimedelta
+        assert TimeDelta.from_pytimedelta_many([pytimedelta]) == [td]
+        assert TimeDelta.to_pytimedelta_many([td]) == [pytimedelta]
+    # values finer than a microsecond are floored
+    assert TimeDelta(Fraction(1, 7)).to_pytimedelta() == datetime.timedelta(microseconds=12342857142)
+    assert TimeDelta(Fraction(-1, 7)).to_pytimedelta() == datetime.timedelta(microseconds=-12342857143)
+
+    for value in (1, Fraction(1, 2), "1", None):
+        with pytest.raises(TypeError):
+            TimeDelta.from_pytimedelta(value)
+        with pytest.raises(TypeError):
+            TimeDelta.from_pytimedelta_many([datetime.timedelta(1), value])
+        with pytest.raises(TypeError):
+            TimeDelta.to_pytimedelta_many([TimeDelta(1), value])
+    with pytest.raises(OverflowError):
+        TimeDelta(10**9).to_pytimedelta()
+
+
 def test_20_attributes():
     # the attribute of a TimeDelta instance is read-only
     td1 = TimeDelta("0.12345")
@@ -581,6 +644,29 @@ def test_51_is_integer():
             assert td.is_integer() == (test_datum.frac_part == 0)
 
 
+def test_52_integral_time_deltas():
+    # integral time deltas, e.g. the difference of two dates, behave as the other ones
+    for td in (TimeDelta(5), Date(12) - Date(7), TimeDelta(2) + TimeDelta(3), TimeDelta(-5) * -1, TimeDelta.from_bytes(TimeDelta(5).to_bytes())):
+        assert type(td.fractional_days) is Fraction and td.fractional_days == 5
+        assert type(td.frac_part) is Fraction and td.frac_part == 0
+        assert td.int_part == 5
+        assert td.is_integer()
+        assert td == TimeDelta(Fraction(5)) and hash(td) == hash(TimeDelta(Fraction(5)))
+        assert repr(td) == "datetime2.TimeDelta('5')" and str(td) == "5 days"
+    two = Date(3) - Date(1)
+    assert two / TimeDelta(4) == Fraction(1, 2)
+    assert type(two / TimeDelta(4)) is Fraction
+    assert two % TimeDelta(3) == Fraction(2)
+    assert type(two % TimeDelta(3)) is Fraction
+    assert two // TimeDelta(Fraction(3, 4)) == 2
+    assert two + TimeDelta(Fraction(1, 2)) == TimeDelta(Fraction(5, 2))
+    assert -two == TimeDelta(-2)
+    assert two * Fraction(1, 4) == TimeDelta(Fraction(1, 2))
+    assert Date(10) + two == Date(12)
+    assert Date(10) - two == Date(8)
+    assert TimeDelta(Fraction(1, 2)) + TimeDelta(Fraction(1, 2)) == two - TimeDelta(1)
+
+
 def test_90_subclass():
     # check that there is no interference from the interface mechanism and from possible additional arguments
     class TD(TimeDelta):
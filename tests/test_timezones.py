@@ -0,0 +1,204 @@
+# Time class tests
+
+# Copyright (c) 2011-2023 Francesco Ricciardi
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# * Neither the name(s) of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AS IS AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO
+# EVENT SHALL THE COPYRIGHT HOLDERS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+__author__ = "Francesco Ricciardi <francescor2010 at yahoo.it>"
+
+import os
+import struct
+from fractions import Fraction
+import pytest
+
+from datetime2 import Date, DateTime, Time, set_clock_source
+from datetime2.clocks import FakeClock
+from datetime2.timezones import TZPATH, TimeZone, available_zones, get_zone
+
+
+NS_IN_SECOND = 1_000_000_000
+NS_IN_HOUR = 3600 * NS_IN_SECOND
+UNIX_EPOCH_DAY_COUNT = 719163
+
+has_tzdata = any(os.path.isfile(os.path.join(directory, "Europe", "Rome")) for directory in TZPATH)
+needs_tzdata = pytest.mark.skipif(not has_tzdata, reason="system time zone data not available")
+
+
+def tzif_data(transitions, type_indices, offsets, footer):
+    # a version 2 TZif file: an empty version 1 block, then the data
+    empty_block = b"TZif2" + bytes(15) + struct.pack(">6L", 0, 0, 0, 0, 1, 1) + struct.pack(">lBB", 0, 0, 0) + b"\0"
+    block = b"TZif2" + bytes(15) + struct.pack(">6L", 0, 0, 0, len(transitions), len(offsets), 1)
+    block += struct.pack(f">{len(transitions)}q", *transitions) + bytes(type_indices)
+    block += b"".join(struct.pack(">lBB", offset, 0, 0) for offset in offsets) + b"\0"
+    return empty_block + block + b"\n" + footer + b"\n"
+
+
+def utc(year, month, day, hour=0, minute=0):
+    return DateTime(Date.gregorian(year, month, day), Time.western(hour, minute, 0, timezone=0))
+
+
+def local(year, month, day, hour=0, minute=0):
+    return DateTime(Date.gregorian(year, month, day), Time.western(hour, minute, 0))
+
+
+# A zone one hour east of UTC, switching to summer time in 2000, with the
+# European rule in force afterwards
+SUMMER_2000 = (Date.gregorian(2000, 3, 26).day_count - UNIX_EPOCH_DAY_COUNT) * 86400 + 3600
+WINTER_2000 = (Date.gregorian(2000, 10, 29).day_count - UNIX_EPOCH_DAY_COUNT) * 86400 + 3600
+EUROPEAN = tzif_data([SUMMER_2000, WINTER_2000], [1, 0], [3600, 7200], b"CET-1CEST,M3.5.0,M10.5.0/3")
+
+
+def test_00_compile():
+    zone = TimeZone.from_bytes(EUROPEAN, "Test/Europe")
+    assert zone.key == "Test/Europe"
+    assert repr(zone) == "TimeZone('Test/Europe')"
+    assert str(zone) == "Test/Europe"
+    assert repr(TimeZone.from_bytes(EUROPEAN)) == "TimeZone.from_bytes(...)"
+    for data in (b"", b"TZjf" + EUROPEAN[4:], EUROPEAN[:60]):
+        with pytest.raises(ValueError):
+            TimeZone.from_bytes(data)
+    with pytest.raises(ValueError):
+        TimeZone.from_bytes(tzif_data([], [], [3600], b"CET-1CEST,M13.5.0,M10.5.0"))
+    with pytest.raises(TypeError):
+        TimeZone.from_bytes("TZif")
+
+
+def test_01_utcoffset_at_utc_moments():
+    zone = TimeZone.from_bytes(EUROPEAN)
+    assert zone.utcoffset(Date.gregorian(2000, 1, 1), Time(0, utcoffset=0)) == Fraction(1, 24)
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time.western(0, 59, 59, timezone=0)) == Fraction(1, 24)
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time.western(1, 0, 0, timezone=0)) == Fraction(1, 12)
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time.western(3, 0, 0, timezone=2)) == Fraction(1, 12)
+    # the following transitions come from the TZ string
+    assert zone.utcoffset(Date.gregorian(2001, 3, 25), Time.western(0, 59, 59, timezone=0)) == Fraction(1, 24)
+    assert zone.utcoffset(Date.gregorian(2001, 3, 25), Time.western(1, 0, 0, timezone=0)) == Fraction(1, 12)
+    assert zone.utcoffset(Date.gregorian(2124, 10, 29), Time.western(0, 59, 0, timezone=0)) == Fraction(1, 12)
+    assert zone.utcoffset(Date.gregorian(2124, 10, 29), Time.western(1, 0, 0, timezone=0)) == Fraction(1, 24)
+    # times that are not a whole number of nanoseconds
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time(Fraction(1, 24) - Fraction(1, 10 ** 12), utcoffset=0)) == Fraction(1, 24)
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time(Fraction(1, 13))) == Fraction(1, 24)
+    assert zone.utcoffset(Date.gregorian(2000, 3, 26), Time(Fraction(1, 7))) == Fraction(1, 12)
+    with pytest.raises(TypeError):
+        zone.utcoffset(Date(1), None)
+    with pytest.raises(TypeError):
+        zone.utcoffset(730000, Time(0))
+    with pytest.raises(ValueError):
+        zone.utcoffset(Date(1), Time(0), fold=2)
+
+
+def test_02_utcoffset_at_local_times():
+    zone = TimeZone.from_bytes(EUROPEAN)
+    # 02:30 does not exist on the last Sunday of March, and 02:30 happens
+    # twice on the last Sunday of October
+    for year, day in ((2000, 26), (2031, 30)):
+        assert zone.utcoffset(Date.gregorian(year, 3, day), Time.western(1, 59, 59)) == Fraction(1, 24)
+        assert zone.utcoffset(Date.gregorian(year, 3, day), Time.western(2, 30, 0)) == Fraction(1, 24)
+        assert zone.utcoffset(Date.gregorian(year, 3, day), Time.western(2, 30, 0), fold=1) == Fraction(1, 12)
+        assert zone.utcoffset(Date.gregorian(year, 3, day), Time.western(3, 0, 0)) == Fraction(1, 12)
+    for year, day in ((2000, 29), (2031, 26)):
+        assert zone.utcoffset(Date.gregorian(year, 10, day), Time.western(1, 59, 59)) == Fraction(1, 12)
+        assert zone.utcoffset(Date.gregorian(year, 10, day), Time.western(2, 30, 0)) == Fraction(1, 12)
+        assert zone.utcoffset(Date.gregorian(year, 10, day), Time.western(2, 30, 0), fold=1) == Fraction(1, 24)
+        assert zone.utcoffset(Date.gregorian(year, 10, day), Time.western(3, 0, 0)) == Fraction(1, 24)
+
+
+def test_03_localize():
+    zone = TimeZone.from_bytes(EUROPEAN)
+    summer = zone.localize(utc(2040, 7, 1, 12))
+    assert summer == utc(2040, 7, 1, 12)
+    assert summer.utcoffset == Fraction(1, 12)
+    assert summer.time == Time.western(14, 0, 0, timezone=2)
+    winter = zone.localize(local(2040, 1, 1, 12))
+    assert winter.utcoffset == Fraction(1, 24)
+    assert winter.nanoseconds == local(2040, 1, 1, 12).nanoseconds
+    assert zone.localize(local(2040, 10, 28, 2, 30)).utcoffset == Fraction(1, 12)
+    assert zone.localize(local(2040, 10, 28, 2, 30), fold=1).utcoffset == Fraction(1, 24)
+    assert zone.localize_many([utc(2040, 7, 1, 12), local(2040, 1, 1, 12)]) == [summer, winter]
+    with pytest.raises(TypeError):
+        zone.localize(Date(1))
+    with pytest.raises(ValueError):
+        zone.localize(summer, fold=-1)
+
+
+def test_04_now():
+    zone = TimeZone.from_bytes(EUROPEAN)
+    summer_moment = utc(2040, 7, 1, 12)
+    previous_source = set_clock_source(FakeClock(summer_moment.nanoseconds - (UNIX_EPOCH_DAY_COUNT - 1) * 86400 * NS_IN_SECOND))
+    try:
+        assert zone.now() == summer_moment
+        assert zone.now().utcoffset == Fraction(1, 12)
+    finally:
+        set_clock_source(previous_source)
+
+
+def test_05_localize_datetime64():
+    np = pytest.importorskip("numpy")
+    zone = TimeZone.from_bytes(EUROPEAN)
+    moments = np.array(["1999-07-01T12:00", "2000-03-26T00:59:59.999", "2000-03-26T01:00", "2100-08-01T00:00", "NaT"],
+                       dtype="datetime64[ms]")
+    local_moments, utcoffsets = zone.localize_datetime64(moments)
+    assert utcoffsets.dtype == np.dtype("timedelta64[s]")
+    assert utcoffsets[:4].astype(np.int64).tolist() == [3600, 3600, 7200, 7200]
+    assert local_moments.dtype == np.dtype("datetime64[ms]")
+    assert local_moments[:4].tolist() == (moments[:4] + utcoffsets[:4]).tolist()
+    assert np.isnat(local_moments[4])
+    assert zone.localize_datetime64(moments[:0])[1].size == 0
+    with pytest.raises(TypeError):
+        zone.localize_datetime64(np.arange(3))
+
+
+def test_06_southern_and_fixed_zones():
+    # daylight saving time from the first Sunday of October to the first
+    # Sunday of April, as in Sydney
+    southern = TimeZone.from_bytes(tzif_data([], [], [36000], b"AEST-10AEDT,M10.1.0,M4.1.0/3"))
+    assert southern.localize(local(2024, 1, 15, 12)).utcoffset == Fraction(11, 24)
+    assert southern.localize(local(2024, 7, 15, 12)).utcoffset == Fraction(10, 24)
+    fixed = TimeZone.from_bytes(tzif_data([], [], [-18000], b"<-05>5"))
+    assert fixed.localize(utc(2024, 7, 15)).utcoffset == Fraction(-5, 24)
+    assert fixed.localize(utc(1024, 7, 15)).utcoffset == Fraction(-5, 24)
+    # daylight saving time all year long
+    permanent = TimeZone.from_bytes(tzif_data([], [], [7200], b"XXX-1YYY,0/0,J365/25"))
+    assert permanent.localize(utc(2024, 12, 31, 23, 30)).utcoffset == Fraction(1, 12)
+    assert permanent.localize(utc(2025, 6, 1)).utcoffset == Fraction(1, 12)
+
+
+@needs_tzdata
+def test_10_system_zones():
+    rome = get_zone("Europe/Rome")
+    assert get_zone("Europe/Rome") is rome
+    assert rome.localize(utc(2024, 3, 31, 0, 59)).utcoffset == Fraction(1, 24)
+    assert rome.localize(utc(2024, 3, 31, 1)).utcoffset == Fraction(1, 12)
+    assert rome.localize(utc(1900, 1, 1)).utcoffset == Fraction(1, 24)
+    new_york = TimeZone("America/New_York")
+    assert new_york.localize(local(2024, 11, 3, 1, 30)).utcoffset == Fraction(-4, 24)
+    assert new_york.localize(local(2024, 11, 3, 1, 30), fold=1).utcoffset == Fraction(-5, 24)
+    assert new_york.localize(utc(2300, 7, 4)).utcoffset == Fraction(-4, 24)
+    assert {"Europe/Rome", "America/New_York", "UTC"} <= available_zones()
+    for key in ("Mars/Olympus_Mons", "../zoneinfo/UTC", "/etc/localtime", "Europe//Rome", ""):
+        with pytest.raises(ValueError):
+            get_zone(key)
+    with pytest.raises(TypeError):
+        get_zone(1)
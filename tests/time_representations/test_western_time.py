@@ -410,6 +410,7 @@ def test_32_cformat():
     for test_cformat_timezone in timezone_cformat_test_data:
         western = WesternTime(1, 2, 3, timezone=test_cformat_timezone[0])
         assert western.cformat('%z') == test_cformat_timezone[1]
+        assert western.cformat('%H%M%z %H') == f'0102{test_cformat_timezone[1]} 01'
 
     # check percent
     western = WesternTime(1, 2, 3)
@@ -433,6 +434,93 @@ def test_32_cformat():
             western.cformat(par)
 
 
+def test_33_cformat_many():
+    np = pytest.importorskip("numpy")
+
+    nanoseconds = [0, 1, 999, 1_000, 999_999_999, 12_345_678_901_234, 43_199_999_999_999, 43_200_000_000_000,
+                   86_399_999_999_999]
+    for timezone in (None, 0, Fraction(-11, 4), 5):
+        for format_string in ("%H %I %p %M %S %f %z", "", "%z%z", "%k%S%", "{%H}'\"\\"):
+            expected = []
+            for nanosecond in nanoseconds:
+                day_frac = Fraction(nanosecond, 86_400_000_000_000)
+                western = WesternTime.from_time_pair(day_frac, None if timezone is None else Fraction(timezone, 24))
+                expected.append(western.cformat(format_string))
+            assert WesternTime.cformat_many(format_string, nanoseconds, timezone=timezone) == expected
+            assert WesternTime.cformat_many(format_string, np.array(nanoseconds), timezone=timezone) == expected
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            WesternTime.cformat_many(par, [1])
+    for par in ([1.0], ["1"], [None]):
+        with pytest.raises(TypeError):
+            WesternTime.cformat_many("%H", par)
+    for par in ([-1], [86_400_000_000_000]):
+        with pytest.raises(ValueError):
+            WesternTime.cformat_many("%H", par)
+    with pytest.raises(TypeError):
+        WesternTime.cformat_many("%H", [1], timezone="a")
+    with pytest.raises(ValueError):
+        WesternTime.cformat_many("%H", [1], timezone=25)
+
+
+def test_34_cparse():
+    formats = ("%H:%M:%S.%f%z", "%I:%M:%S.%f %p%z", "%H%M%S%f%z", "%z %H %I %p %M:%S.%f", "{%H}'\"\\%%%k%M%S%f")
+    for test_row in western_time_test_data:
+        hour, minute = test_row[1][0], test_row[1][1]
+        second = Fraction(test_row[1][2])
+        for timezone in [None] + [test_timezone[0] for test_timezone in timezone_cformat_test_data]:
+            western = WesternTime(hour, minute, second, timezone=timezone)
+            for format_string in formats:
+                parsed = WesternTime.cparse(western.cformat(format_string), format_string)
+                assert type(parsed) == WesternTime
+                assert (parsed.hour, parsed.minute) == (hour, minute)
+                assert parsed.second == int(second * 1_000_000) / Fraction(1_000_000)
+                if "%z" in format_string:
+                    assert parsed.cformat("%z") == western.cformat("%z")
+    # missing fields default to 0
+    parsed = WesternTime.cparse("12", "%H")
+    assert (parsed.hour, parsed.minute, parsed.second, parsed.timezone) == (12, 0, 0, None)
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            WesternTime.cparse(par, "%H")
+        with pytest.raises(TypeError):
+            WesternTime.cparse("12", par)
+    for string, format_string in (("1:02", "%H:%M"), ("01:02", "%H-%M"), ("24:00", "%H:%M"), ("12:60", "%H:%M"),
+                                  ("01", "%I"), ("00 AM", "%I %p"), ("13 PM", "%I %p"), ("01 AM 13", "%I %p %H"),
+                                  ("13 AM", "%H %p"), ("01:02+1", "%H:%M%z"), ("01:02:03.12", "%H:%M:%S.%f"),
+                                  ("01:02+25:00", "%H:%M%z"), ("01 01", "%H %H2")):
+        with pytest.raises(ValueError):
+            WesternTime.cparse(string, format_string)
+
+
+def test_35_from_str():
+    for test_row in western_time_test_data:
+        hour, minute = test_row[1][0], test_row[1][1]
+        second = Fraction(test_row[1][2])
+        parsed = WesternTime.from_str(str(WesternTime(hour, minute, second)))
+        assert type(parsed) == WesternTime
+        assert (parsed.hour, parsed.minute, parsed.second, parsed.timezone) == (hour, minute, int(second), None)
+    for test_timezone in timezone_test_data:
+        western = WesternTime(1, 2, 3, timezone=test_timezone[0])
+        parsed = WesternTime.from_str(str(western))
+        assert parsed.timezone == int(western.timezone * 60) / Fraction(60)
+    # ISO 8601 time zones are accepted as well
+    assert WesternTime.from_str("01:02:03-02:45").timezone == Fraction(-11, 4)
+    assert WesternTime.from_str("01:02:03+05:30").timezone == Fraction(11, 2)
+
+    # invalid parameters
+    for par in (1, (1,), [1], {1: 1}, None):
+        with pytest.raises(TypeError):
+            WesternTime.from_str(par)
+    for par in ("", "1:02:03", "01:02", "01:02:03.5", "24:00:00", "01:02:03+25:00", "01:02:03Z", "０1:02:03"):
+        with pytest.raises(ValueError):
+            WesternTime.from_str(par)
+
+
 def test_50_to_time_pair():
     for test_row in western_time_test_data:
         day_frac = Fraction(test_row[0])